@@ -8,38 +8,77 @@ This hook validates git commands and blocks flags that bypass safety checks:
 - --force-with-lease: Force push with lease
 """
 
-import json
 import re
 import sys
 
+try:
+    from orjson import loads
+except ImportError:  # orjson is optional; the stdlib parser also accepts bytes
+    from json import loads
 
-def read_stdin() -> str:
-    """Read JSON input from stdin.
+# Flags that bypass hooks or signing on any git subcommand
+BYPASS_FLAGS = frozenset({'--no-verify', '--no-gpg-sign'})
+
+# Flags that force-push when combined with `git push`
+FORCE_PUSH_FLAGS = frozenset({'--force', '-f', '--force-with-lease'})
+
+# Shell operators that start a new command: ; & | ( ) newlines, backticks and $(
+COMMAND_SEPARATORS = re.compile(r'[;&|()`\n]|\$\(')
+
+# Whitespace and shell metacharacters that can sit directly against a flag
+TOKEN_SEPARATORS = re.compile(r'[\s;&|()<>`$]+')
+
+
+def is_prohibited(bash_command: str) -> bool:
+    """Check whether a shell command uses a prohibited git flag.
+
+    The command is split into its individual shell commands, and each one is
+    tokenized on whitespace and shell metacharacters, so `git commit
+    --no-verify;echo` and `(git push --force)` are caught. Everything after a
+    `git` token in a command is checked against the flag sets.
+
+    Args:
+        bash_command: Shell command line to check.
 
     Returns:
-        Complete stdin content as a string.
+        True if the command should be blocked.
 
     """
-    return sys.stdin.read()
+    # Non-git commands are the common case; skip tokenizing them entirely
+    if 'git' not in bash_command:
+        return False
+
+    for command in COMMAND_SEPARATORS.split(bash_command):
+        # Strip shell quoting and `--flag=value` suffixes so each token is a bare flag
+        tokens = [word.strip('\'"').split('=', 1)[0] for word in TOKEN_SEPARATORS.split(command) if word]
+        git_index = next((i for i, word in enumerate(tokens) if word == 'git' or word.endswith('/git')), None)
+        if git_index is None:
+            continue
+
+        git_args = set(tokens[git_index + 1 :])
+        if git_args & BYPASS_FLAGS:
+            return True
+        if 'push' in git_args and git_args & FORCE_PUSH_FLAGS:
+            return True
+
+    return False
 
 
 def main() -> None:
     """Main hook logic: validates git commands and blocks dangerous flags."""
     try:
-        # Read and parse hook input
-        hook_input = read_stdin()
-        input_data = json.loads(hook_input)
+        # Read hook input; a payload that never mentions git cannot be blocked
+        hook_input = sys.stdin.buffer.read()
+        if b'git' not in hook_input:
+            sys.exit(0)
+
+        input_data = loads(hook_input)
 
         # Extract bash command from tool input
         bash_command = input_data.get('tool_input', {}).get('command', '')
 
         # Check for prohibited git flags
-        prohibited_pattern = re.compile(
-            r'git.*(--no-verify|--no-gpg-sign)|'
-            r'git\s+push.*(--force([^-]|$)|-f\s|--force-with-lease)'
-        )
-
-        if prohibited_pattern.search(bash_command):
+        if is_prohibited(bash_command):
             error_msg = """BLOCKED: Hook bypass or force flags detected.
 
 Prohibited flags: --no-verify, --no-gpg-sign, --force, -f, --force-with-lease
@@ -10,67 +10,74 @@ Usage:
 """
 
 import argparse
-import operator
 import re
 from pathlib import Path
 
+STEP_RE = re.compile(r'^[ \t]*(?P<keyword>Given|When|Then|And|But)[ \t]+(?P<text>.+)$', re.MULTILINE)
+
+# Common patterns for parameters; decimal precedes number so it claims '2.5' first
+PARAM_PATTERNS = [
+    (re.compile(r'"([^"]+)"'), 'quoted string'),
+    (re.compile(r"'([^']+)'"), 'quoted string'),
+    (re.compile(r'\b\d+\.\d+\b'), 'decimal'),
+    (re.compile(r'\d+'), 'number'),
+]
+
+QUOTES_RE = re.compile(r'["\']')
+NON_WORD_RE = re.compile(r'[^\w\s]')
+
 
 def parse_feature_file(feature_path):
     """Parse feature file and extract unique steps."""
-    with Path(feature_path).open(encoding='utf-8') as f:
-        content = f.read()
+    content = Path(feature_path).read_text(encoding='utf-8')
 
-    # Find all Given/When/Then/And/But steps
-    pattern = r'^\s*(Given|When|Then|And|But)\s+(.+)$'
-    steps = []
+    # Find all Given/When/Then/And/But steps in a single scan of the file.
+    # Keyed by (keyword, text) so duplicates collapse while preserving order.
+    unique_steps = {}
+    previous_keyword = 'Given'
 
-    for line in content.split('\n'):
-        match = re.match(pattern, line.strip())
-        if match:
-            keyword = match.group(1)
-            text = match.group(2).strip()
+    for match in STEP_RE.finditer(content):
+        keyword = match.group('keyword')
+        text = match.group('text').strip()
 
-            # Convert And/But to previous keyword type
-            if keyword in {'And', 'But'}:
-                keyword = steps[-1]['keyword'] if steps else 'Given'
+        # Convert And/But to previous keyword type
+        if keyword in {'And', 'But'}:
+            keyword = previous_keyword
+        previous_keyword = keyword
 
-            steps.append({'keyword': keyword, 'text': text, 'original': line.strip()})
-
-    # Remove duplicates while preserving order
-    unique_steps = []
-    seen = set()
-    for step in steps:
-        key = (step['keyword'], step['text'])
-        if key not in seen:
-            seen.add(key)
-            unique_steps.append(step)
+        unique_steps.setdefault((keyword, text), {'keyword': keyword, 'text': text, 'original': match.group(0).strip()})
 
-    return unique_steps
+    return list(unique_steps.values())
 
 
 def detect_parameters(step_text):
-    """Detect potential parameters in step text."""
-    # Common patterns for parameters
-    patterns = [
-        (r'"([^"]+)"', 'quoted string'),
-        (r"'([^']+)'", 'quoted string'),
-        (r'\d+', 'number'),
-        (r'\b\d+\.\d+\b', 'decimal'),
-    ]
+    """Detect potential parameters in step text.
 
-    params = []
-    for pattern, param_type in patterns:
-        matches = re.finditer(pattern, step_text)
-        params.extend({'value': match.group(0), 'type': param_type, 'position': match.start()} for match in matches)
+    Returns:
+        List of (position, value, type) tuples sorted by position.
 
+    """
+    params = []
+    claimed = []
+    for pattern, param_type in PARAM_PATTERNS:
+        for match in pattern.finditer(step_text):
+            start, end = match.span()
+            # Skip matches inside an earlier parameter (e.g. digits within a quoted string)
+            if any(start < claimed_end and claimed_start < end for claimed_start, claimed_end in claimed):
+                continue
+            claimed.append((start, end))
+            params.append((start, match.group(0), param_type))
+
+    # Claimed spans never overlap, so positions are unique and sort the tuples
+    params.sort()
     return params
 
 
 def generate_step_function_name(step_text):
     """Generate Python function name from step text."""
     # Remove quotes and special characters
-    text = re.sub(r'["\']', '', step_text)
-    text = re.sub(r'[^\w\s]', '', text)
+    text = QUOTES_RE.sub('', step_text)
+    text = NON_WORD_RE.sub('', text)
 
     # Convert to snake_case
     words = text.lower().split()
@@ -94,20 +101,20 @@ def generate_step_definition(step):
     # Generate decorator
     if params:
         # Use parsers for parameterized steps
-        # Replace parameters with placeholders
+        # Splice placeholders in right-to-left so earlier positions stay valid
         param_text = text
         param_names = []
 
-        for i, param in enumerate(sorted(params, key=operator.itemgetter('position'), reverse=True)):
-            if param['type'] == 'quoted string':
+        for i, (start, value, param_type) in enumerate(reversed(params)):
+            if param_type == 'quoted string':
                 # Replace quoted string with parameter
                 param_name = f'value{i + 1}' if len(params) > 1 else 'value'
-                param_text = param_text.replace(param['value'], f'"{{{param_name}}}"', 1)
-                param_names.append(param_name)
-            elif param['type'] in {'number', 'decimal'}:
+                placeholder = f'"{{{param_name}}}"'
+            else:
                 param_name = f'count{i + 1}' if len(params) > 1 else 'count'
-                param_text = param_text.replace(param['value'], f'{{{param_name}}}', 1)
-                param_names.append(param_name)
+                placeholder = f'{{{param_name}}}'
+            param_text = param_text[:start] + placeholder + param_text[start + len(value) :]
+            param_names.append(param_name)
 
         decorator = f"@{keyword}(parsers.parse('{param_text}'))"
         function_params = ', '.join(['browser', *param_names])
@@ -153,31 +160,21 @@ scenarios('../features/{feature_name}.feature')
 
 '''
 
-    # Group steps by keyword
-    given_steps = [s for s in steps if s['keyword'] == 'Given']
-    when_steps = [s for s in steps if s['keyword'] == 'When']
-    then_steps = [s for s in steps if s['keyword'] == 'Then']
+    # Group steps by keyword in a single pass
+    buckets = {'Given': [], 'When': [], 'Then': []}
+    for step in steps:
+        buckets[step['keyword']].append(step)
 
     # Generate step definitions
-    code = header
-
-    if given_steps:
-        code += '# Given steps - setup\n\n'
-        for step in given_steps:
-            code += generate_step_definition(step)
-            code += '\n\n'
-
-    if when_steps:
-        code += '# When steps - actions\n\n'
-        for step in when_steps:
-            code += generate_step_definition(step)
-            code += '\n\n'
-
-    if then_steps:
-        code += '# Then steps - assertions\n\n'
-        for step in then_steps:
-            code += generate_step_definition(step)
-            code += '\n\n'
+    parts = [header]
+
+    for keyword, comment in (('Given', 'setup'), ('When', 'actions'), ('Then', 'assertions')):
+        if buckets[keyword]:
+            parts.append(f'# {keyword} steps - {comment}\n\n')
+            for step in buckets[keyword]:
+                parts.extend((generate_step_definition(step), '\n\n'))
+
+    code = ''.join(parts)
 
     # Write to file
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -10,44 +10,20 @@ Usage:
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
+TEST_DIRS = [
+    'tests',
+    'tests/acceptance',
+    'tests/acceptance/features',
+    'tests/acceptance/step_defs',
+]
 
-def create_directory_structure(project_root):
-    """Create test directory structure."""
-    test_dirs = [
-        'tests',
-        'tests/acceptance',
-        'tests/acceptance/features',
-        'tests/acceptance/step_defs',
-    ]
-
-    for dir_path in test_dirs:
-        full_path = project_root / dir_path
-        full_path.mkdir(parents=True, exist_ok=True)
-
-        # Create __init__.py files
-        if dir_path.startswith('tests'):
-            init_file = full_path / '__init__.py'
-            if not init_file.exists():
-                init_file.write_text('"""Test package."""\n')
-
-        print(f'✓ Created {dir_path}/')
-
-
-def create_pytest_ini(project_root, settings_module):
-    """Create pytest.ini configuration."""
-    pytest_ini = project_root / 'pytest.ini'
-
-    if pytest_ini.exists():
-        print(f'! pytest.ini already exists at {pytest_ini}')
-        response = input('  Overwrite? (y/N): ')
-        if response.lower() != 'y':
-            print('  Skipped pytest.ini')
-            return
+PACKAGE_INIT = '"""Test package."""\n'
 
-    content = f"""[pytest]
+PYTEST_INI_TEMPLATE = """[pytest]
 # Django settings
 DJANGO_SETTINGS_MODULE = {settings_module}.test
 python_files = test_*.py
@@ -80,19 +56,7 @@ addopts =
 norecursedirs = .git .tox dist build *.egg venv node_modules
 """
 
-    pytest_ini.write_text(content)
-    print('✓ Created pytest.ini')
-
-
-def create_root_conftest(project_root):
-    """Create root conftest.py."""
-    conftest = project_root / 'tests' / 'conftest.py'
-
-    if conftest.exists():
-        print('! tests/conftest.py already exists')
-        return
-
-    content = '''"""Root test configuration."""
+ROOT_CONFTEST = '''"""Root test configuration."""
 import pytest
 from django.core.management import call_command
 
@@ -128,19 +92,7 @@ def api_client():
         pytest.skip("DRF not installed")
 '''
 
-    conftest.write_text(content)
-    print('✓ Created tests/conftest.py')
-
-
-def create_acceptance_conftest(project_root):
-    """Create acceptance test conftest.py."""
-    conftest = project_root / 'tests' / 'acceptance' / 'conftest.py'
-
-    if conftest.exists():
-        print('! tests/acceptance/conftest.py already exists')
-        return
-
-    content = '''"""Acceptance test configuration."""
+ACCEPTANCE_CONFTEST = '''"""Acceptance test configuration."""
 import pytest
 from splinter import Browser
 
@@ -212,33 +164,7 @@ def admin_user(db):
     )
 '''
 
-    conftest.write_text(content)
-    print('✓ Created tests/acceptance/conftest.py')
-
-
-def create_test_settings(project_root, settings_module):
-    """Create test settings file."""
-    # Extract project name and settings location
-    parts = settings_module.split('.')
-    if len(parts) == 2:
-        # myproject.settings
-        project_name = parts[0]
-        settings_dir = project_root / project_name
-    else:
-        # myproject.settings.base
-        project_name = parts[0]
-        settings_dir = project_root / project_name / 'settings'
-
-    test_settings = settings_dir / 'test.py'
-
-    if test_settings.exists():
-        print(f'! {test_settings} already exists')
-        return
-
-    # Determine base import
-    base_import = 'from .base import *' if (settings_dir / 'base.py').exists() else 'from .settings import *'
-
-    content = f'''"""Test-specific Django settings."""
+TEST_SETTINGS_TEMPLATE = '''"""Test-specific Django settings."""
 {base_import}
 
 # Use in-memory SQLite for speed
@@ -275,7 +201,9 @@ TEMPLATE_DEBUG = False
 ALLOWED_HOSTS = ['*', 'testserver']
 
 # Remove debug toolbar and unnecessary middleware
-MIDDLEWARE = [m for m in MIDDLEWARE if 'debug' not in m.lower()]
+import re
+_DEBUG_MIDDLEWARE_RE = re.compile('debug', re.IGNORECASE)
+MIDDLEWARE = [m for m in MIDDLEWARE if not _DEBUG_MIDDLEWARE_RE.search(m)]
 
 # Test media and static files
 import os
@@ -299,20 +227,7 @@ LOGGING = {{
 }}
 '''
 
-    settings_dir.mkdir(parents=True, exist_ok=True)
-    test_settings.write_text(content)
-    print(f'✓ Created {test_settings}')
-
-
-def create_example_feature(project_root):
-    """Create example feature file."""
-    feature_file = project_root / 'tests' / 'acceptance' / 'features' / 'example.feature'
-
-    if feature_file.exists():
-        print('! example.feature already exists')
-        return
-
-    content = """Feature: Homepage
+EXAMPLE_FEATURE = """Feature: Homepage
   As a visitor
   I want to view the homepage
   So that I can learn about the site
@@ -323,19 +238,7 @@ def create_example_feature(project_root):
     And I should see the navigation menu
 """
 
-    feature_file.write_text(content)
-    print('✓ Created example.feature')
-
-
-def create_example_steps(project_root):
-    """Create example step definitions."""
-    steps_file = project_root / 'tests' / 'acceptance' / 'step_defs' / 'test_example.py'
-
-    if steps_file.exists():
-        print('! test_example.py already exists')
-        return
-
-    content = '''"""Example step definitions."""
+EXAMPLE_STEPS = '''"""Example step definitions."""
 from pytest_bdd import scenarios, given, when, then
 
 # Load all scenarios from example.feature
@@ -363,19 +266,7 @@ def see_navigation(browser):
            browser.is_element_present_by_css('header')
 '''
 
-    steps_file.write_text(content)
-    print('✓ Created test_example.py')
-
-
-def create_requirements(project_root):
-    """Create requirements-test.txt."""
-    req_file = project_root / 'requirements-test.txt'
-
-    if req_file.exists():
-        print('! requirements-test.txt already exists')
-        return
-
-    content = """# Testing dependencies
+REQUIREMENTS_TEST = """# Testing dependencies
 pytest>=7.0.0
 pytest-django>=4.5.0
 pytest-bdd>=6.0.0
@@ -387,19 +278,7 @@ splinter[django]>=0.19.0
 # webdriver-manager>=3.8.0
 """
 
-    req_file.write_text(content)
-    print('✓ Created requirements-test.txt')
-
-
-def create_readme(project_root):
-    """Create README for tests."""
-    readme = project_root / 'tests' / 'README.md'
-
-    if readme.exists():
-        print('! tests/README.md already exists')
-        return
-
-    content = """# Django Acceptance Tests
+TESTS_README = """# Django Acceptance Tests
 
 Acceptance tests for this Django project using pytest-bdd and pytest-splinter.
 
@@ -457,8 +336,88 @@ tests/
 - [Splinter Documentation](https://splinter.readthedocs.io/)
 """
 
-    readme.write_text(content)
-    print('✓ Created tests/README.md')
+
+def resolve_settings_dir(project_root, settings_module):
+    """Locate the directory that holds the settings package or module."""
+    # Extract project name and settings location
+    parts = settings_module.split('.')
+    if len(parts) == 2:
+        # myproject.settings
+        return project_root / parts[0]
+    # myproject.settings.base
+    return project_root / parts[0] / 'settings'
+
+
+def build_manifest(project_root, settings_module):
+    """Build the list of files to create.
+
+    Returns:
+        List of (relative_path, content, overwrite_allowed) tuples. Files that
+        allow overwriting prompt before replacing an existing copy; the rest
+        are skipped when present.
+
+    """
+    settings_dir = resolve_settings_dir(project_root, settings_module)
+
+    # Determine base import
+    base_import = 'from .base import *' if (settings_dir / 'base.py').exists() else 'from .settings import *'
+    context = {'settings_module': settings_module, 'base_import': base_import}
+
+    return [
+        *((Path(dir_path) / '__init__.py', PACKAGE_INIT, False) for dir_path in TEST_DIRS),
+        (Path('pytest.ini'), PYTEST_INI_TEMPLATE.format_map(context), True),
+        (Path('tests/conftest.py'), ROOT_CONFTEST, False),
+        (Path('tests/acceptance/conftest.py'), ACCEPTANCE_CONFTEST, False),
+        (settings_dir.relative_to(project_root) / 'test.py', TEST_SETTINGS_TEMPLATE.format_map(context), False),
+        (Path('tests/acceptance/features/example.feature'), EXAMPLE_FEATURE, False),
+        (Path('tests/acceptance/step_defs/test_example.py'), EXAMPLE_STEPS, False),
+        (Path('requirements-test.txt'), REQUIREMENTS_TEST, False),
+        (Path('tests/README.md'), TESTS_README, False),
+    ]
+
+
+def list_existing(directories):
+    """Return the set of paths already present in the given directories.
+
+    Each directory is scanned once, instead of stat-ing every target file.
+    """
+    existing = set()
+    for directory in directories:
+        try:
+            with os.scandir(directory) as entries:
+                existing.update(Path(entry.path) for entry in entries)
+        except FileNotFoundError:
+            continue
+    return existing
+
+
+def write_manifest(project_root, manifest):
+    """Create every file in the manifest, skipping or prompting for existing ones."""
+    targets = [
+        (project_root / relative_path, relative_path, content, overwrite_allowed)
+        for relative_path, content, overwrite_allowed in manifest
+    ]
+    parents = dict.fromkeys(path.parent for path, *_ in targets)
+    existing = list_existing(parents)
+
+    for parent in parents:
+        if parent not in existing and not parent.exists():
+            parent.mkdir(parents=True, exist_ok=True)
+            print(f'✓ Created {parent.relative_to(project_root)}/')
+
+    for path, relative_path, content, overwrite_allowed in targets:
+        if path in existing:
+            if not overwrite_allowed:
+                print(f'! {relative_path} already exists')
+                continue
+            print(f'! {relative_path} already exists at {path}')
+            response = input('  Overwrite? (y/N): ')
+            if response.lower() != 'y':
+                print(f'  Skipped {relative_path}')
+                continue
+
+        path.write_text(content)
+        print(f'✓ Created {relative_path}')
 
 
 def main():
@@ -503,15 +462,7 @@ def main():
     print(f'Using settings module: {settings_module}\n')
 
     # Create structure
-    create_directory_structure(project_root)
-    create_pytest_ini(project_root, settings_module)
-    create_root_conftest(project_root)
-    create_acceptance_conftest(project_root)
-    create_test_settings(project_root, settings_module)
-    create_example_feature(project_root)
-    create_example_steps(project_root)
-    create_requirements(project_root)
-    create_readme(project_root)
+    write_manifest(project_root, build_manifest(project_root, settings_module))
 
     print('\n✓ Setup complete!')
     print('\nNext steps:')
@@ -1,53 +1,137 @@
 """FileSystem adapter implementation.
 
 Concrete implementation of FileSystemPort using anyio for async file operations.
+Blocking pathlib calls are dispatched straight to anyio's worker threads
+rather than through anyio.Path wrappers.
 """
 
 from __future__ import annotations
 
 import os
+import stat
+from collections import OrderedDict
+from functools import partial
 from typing import TYPE_CHECKING
 
-import anyio
+from anyio.to_thread import run_sync
 
 if TYPE_CHECKING:
     from pathlib import Path
 
-
-class ConstitutionFileAdapter:  # pragma: no cover
+# Directories write_file has already ensured exist, shared by all adapters (LRU)
+_KNOWN_DIRS_SIZE = 1024
+_known_dirs: OrderedDict[Path, None] = OrderedDict()
+
+
+def _list_markdown_files(directory: Path) -> list[Path]:
+    """Scan directory for .md files in one pass, using scandir's cached entry types."""
+    try:
+        st = directory.stat()
+    except FileNotFoundError:
+        msg = f'Directory not found: {directory}'
+        raise FileNotFoundError(msg) from None
+
+    if not stat.S_ISDIR(st.st_mode):
+        msg = f'Not a directory: {directory}'
+        raise NotADirectoryError(msg)
+
+    with os.scandir(directory) as entries:
+        return sorted(directory / entry.name for entry in entries if entry.name.endswith('.md') and entry.is_file())
+
+
+def _rename_file(old_path: Path, new_path: Path) -> None:
+    """Rename without clobbering, letting rename itself report a missing source."""
+    if new_path.exists():
+        msg = f'File already exists: {new_path}'
+        raise FileExistsError(msg)
+
+    try:
+        old_path.rename(new_path)
+    except FileNotFoundError:
+        # Only blame the source if it is what's missing (not the target's directory)
+        if old_path.exists():
+            raise
+        msg = f'File not found: {old_path}'
+        raise FileNotFoundError(msg) from None
+
+
+def _rename_files(pairs: list[tuple[Path, Path]]) -> None:
+    """Rename a batch of files, resolving their shared directory only once."""
+    directories = {path.parent for pair in pairs for path in pair}
+    if len(directories) != 1 or os.rename not in os.supports_dir_fd:
+        for old_path, new_path in pairs:
+            _rename_file(old_path, new_path)
+        return
+
+    # Every name is looked up relative to one open directory descriptor
+    dir_fd = os.open(directories.pop(), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for old_path, new_path in pairs:
+            try:
+                os.stat(new_path.name, dir_fd=dir_fd)
+            except FileNotFoundError:
+                pass
+            else:
+                msg = f'File already exists: {new_path}'
+                raise FileExistsError(msg)
+
+            try:
+                os.rename(old_path.name, new_path.name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+            except FileNotFoundError:
+                msg = f'File not found: {old_path}'
+                raise FileNotFoundError(msg) from None
+    finally:
+        os.close(dir_fd)
+
+
+def _is_readable_file(path: Path) -> bool:
+    """Check that path is a readable regular file using a single stat."""
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and os.access(path, os.R_OK)
+
+
+class ConstitutionFileAdapter:
     """Concrete filesystem adapter for constitution files."""
 
-    def __init__(self) -> None:  # pragma: no cover
+    def __init__(self) -> None:
         self.file_adapter = FileSystemAdapter()
 
-    async def find_constitution_file(self, start_path: Path) -> Path:  # pragma: no cover
+    async def find_constitution_file(self, start_path: Path) -> tuple[Path, bool]:
         """Find the constitution file starting from the given path.
 
         Args:
             start_path: Path to start searching from
 
         Returns:
-            Path to the constitution file. (This path may or may not exist.)
+            Tuple of the path to the constitution file and whether a readable file
+            was found there. When none was found, the path is where one should be written.
 
         """
-        start_anyio = anyio.Path(start_path)
-        if await start_anyio.is_file() and start_path.name == 'constitution.md':
-            return start_path
+        # Probe every candidate in one worker-thread hop rather than one await per parent
+        return await run_sync(self._search_constitution_file, start_path)
 
-        path = start_path
+    @staticmethod
+    def _search_constitution_file(start_path: Path) -> tuple[Path, bool]:
+        """Walk upward from start_path looking for a readable constitution file."""
+        if start_path.name == 'constitution.md' and _is_readable_file(start_path):
+            return start_path, True
 
-        while True:
+        # parents ends at the filesystem root, which is never searched
+        for path in (start_path, *start_path.parents[:-1]):
             constitution_file = path / 'constitution.md'
-            constitution_anyio = anyio.Path(constitution_file)
-            if await constitution_anyio.exists() and os.access(constitution_file, os.R_OK):
-                return constitution_file
-            path = path.parent
-            if str(path) == path.anchor or not os.access(path, os.R_OK) or not os.access(path, os.W_OK):
+            if _is_readable_file(constitution_file):
+                return constitution_file, True
+            # Stop below the first ancestor the user can't both read and write, so a
+            # constitution.md outside their own tree is never picked up
+            if not os.access(path.parent, os.R_OK | os.W_OK):
                 break
 
-        return start_path / 'constitution.md'
+        return start_path / 'constitution.md', False
 
-    async def read_constitution(self, start_path: Path) -> str:  # pragma: no cover
+    async def read_constitution(self, start_path: Path) -> str:
         """Read the governing constitution document starting from the given path.
 
         Args:
@@ -60,13 +144,12 @@ class ConstitutionFileAdapter:  # pragma: no cover
             FileNotFoundError: If the constitution file is not found
 
         """
-        constitution_file = await self.find_constitution_file(start_path)
-        constitution_anyio = anyio.Path(constitution_file)
-        if not await constitution_anyio.exists():
+        constitution_file, existed = await self.find_constitution_file(start_path)
+        if not existed:
             raise FileNotFoundError('Constitution file not found')
         return await self.file_adapter.read_file(constitution_file)
 
-    async def write_constitution(self, start_path: Path, content: str) -> Path:  # pragma: no cover
+    async def write_constitution(self, start_path: Path, content: str) -> Path:
         """Write the governing constitution document starting from the given path.
 
         Args:
@@ -74,7 +157,7 @@ class ConstitutionFileAdapter:  # pragma: no cover
             content: Constitution file contents
 
         """
-        constitution_file = await self.find_constitution_file(start_path)
+        constitution_file, _ = await self.find_constitution_file(start_path)
         await self.file_adapter.write_file(constitution_file, content)
         return constitution_file
 
@@ -82,7 +165,7 @@ class ConstitutionFileAdapter:  # pragma: no cover
 class FileSystemAdapter:
     """Concrete filesystem adapter using anyio.
 
-    Implements FileSystemPort protocol using anyio's async Path operations.
+    Implements FileSystemPort protocol by running pathlib operations in anyio worker threads.
     All file operations are asynchronous and use UTF-8 encoding.
     """
 
@@ -101,7 +184,7 @@ class FileSystemAdapter:
             OSError: For other filesystem errors
 
         """
-        return await anyio.Path(filepath).read_text(encoding='utf-8')
+        return await run_sync(partial(filepath.read_text, encoding='utf-8'))
 
     async def write_file(self, filepath: Path, content: str) -> None:
         """Write string content to file, creating parent directories if needed.
@@ -115,9 +198,23 @@ class FileSystemAdapter:
             OSError: For other filesystem errors
 
         """
-        parent_anyio = anyio.Path(filepath.parent)
-        await parent_anyio.mkdir(parents=True, exist_ok=True)
-        await anyio.Path(filepath).write_text(content, encoding='utf-8')
+        parent = filepath.parent
+        mkdir = partial(parent.mkdir, parents=True, exist_ok=True)
+        write_text = partial(filepath.write_text, content, encoding='utf-8')
+        if parent in _known_dirs:
+            _known_dirs.move_to_end(parent)
+        else:
+            await run_sync(mkdir)
+            _known_dirs[parent] = None
+            if len(_known_dirs) > _KNOWN_DIRS_SIZE:
+                _known_dirs.popitem(last=False)
+        try:
+            await run_sync(write_text)
+        except FileNotFoundError:
+            # Parent was removed since it was last ensured
+            _known_dirs.pop(parent, None)
+            await run_sync(mkdir)
+            await run_sync(write_text)
 
     async def delete_file(self, filepath: Path) -> None:
         """Delete file if it exists.
@@ -130,9 +227,7 @@ class FileSystemAdapter:
             OSError: For other filesystem errors
 
         """
-        filepath_anyio = anyio.Path(filepath)
-        if await filepath_anyio.exists():
-            await filepath_anyio.unlink()
+        await run_sync(partial(filepath.unlink, missing_ok=True))
 
     async def rename_file(self, old_path: Path, new_path: Path) -> None:
         """Atomically rename file.
@@ -148,18 +243,22 @@ class FileSystemAdapter:
             OSError: For other filesystem errors
 
         """
-        old_anyio = anyio.Path(old_path)
-        new_anyio = anyio.Path(new_path)
+        await run_sync(_rename_file, old_path, new_path)
 
-        if not await old_anyio.exists():
-            msg = f'File not found: {old_path}'
-            raise FileNotFoundError(msg)
+    async def rename_files(self, pairs: list[tuple[Path, Path]]) -> None:
+        """Rename several files in order in one worker-thread hop.
 
-        if await new_anyio.exists():
-            msg = f'File already exists: {new_path}'
-            raise FileExistsError(msg)
+        Args:
+            pairs: (old_path, new_path) tuples, applied in sequence
 
-        await old_anyio.rename(new_path)
+        Raises:
+            FileNotFoundError: If an old_path does not exist
+            FileExistsError: If a new_path already exists
+            PermissionError: If rename not permitted
+            OSError: For other filesystem errors
+
+        """
+        await run_sync(_rename_files, pairs)
 
     async def list_markdown_files(self, directory: Path) -> list[Path]:
         """List all .md files in directory (non-recursive).
@@ -176,22 +275,7 @@ class FileSystemAdapter:
             NotADirectoryError: If path is not a directory
 
         """
-        directory_anyio = anyio.Path(directory)
-
-        if not await directory_anyio.exists():
-            msg = f'Directory not found: {directory}'
-            raise FileNotFoundError(msg)
-
-        if not await directory_anyio.is_dir():
-            msg = f'Not a directory: {directory}'
-            raise NotADirectoryError(msg)
-
-        # Convert async iterator to list and sort
-        # Convert anyio.Path back to pathlib.Path for return type compatibility
-        from pathlib import Path as PathlibPath
-
-        files = [PathlibPath(p) async for p in directory_anyio.glob('*.md')]
-        return sorted(files)
+        return await run_sync(_list_markdown_files, directory)
 
     async def file_exists(self, filepath: Path) -> bool:
         """Check if file exists.
@@ -203,8 +287,8 @@ class FileSystemAdapter:
             True if file exists and is a regular file
 
         """
-        filepath_anyio = anyio.Path(filepath)
-        return await filepath_anyio.exists() and await filepath_anyio.is_file()
+        # is_file() is False for missing paths, so no separate exists() probe
+        return await run_sync(filepath.is_file)
 
     async def create_directory(self, directory: Path) -> None:
         """Create directory and all parent directories.
@@ -218,10 +302,8 @@ class FileSystemAdapter:
             OSError: For other filesystem errors
 
         """
-        directory_anyio = anyio.Path(directory)
-
-        if await directory_anyio.exists() and not await directory_anyio.is_dir():
+        if await run_sync(directory.is_file):
             msg = f'Path exists but is not a directory: {directory}'
             raise FileExistsError(msg)
 
-        await directory_anyio.mkdir(parents=True, exist_ok=True)
+        await run_sync(partial(directory.mkdir, parents=True, exist_ok=True))
@@ -7,8 +7,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import anyio
 import yaml
+from anyio.to_thread import run_sync
 
 from linemark.domain.exceptions import DoctypeNotFoundError, NodeNotFoundError
 
@@ -16,6 +16,29 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
+def _resolve_file_path(sqid: str, doctype: str, directory: Path) -> Path:
+    """Find a node's doctype file with a single glob over the directory."""
+    # Find all files matching the SQID pattern
+    matching_files = list(directory.glob(f'*_{sqid}_*.md'))
+    if not matching_files:
+        msg = f'Node @{sqid} not found'
+        raise NodeNotFoundError(msg)
+
+    # Filter for the specific doctype
+    doctype_pattern = f'*_{sqid}_{doctype}_*.md'
+    doctype_files = [path for path in matching_files if path.match(doctype_pattern)]
+    if not doctype_files:
+        raise DoctypeNotFoundError(doctype, sqid)
+
+    # Return first match (should only be one)
+    return doctype_files[0].absolute()
+
+
+def _read_type_file(sqid: str, doctype: str, directory: Path) -> str:
+    """Resolve and read a node's doctype file."""
+    return _resolve_file_path(sqid, doctype, directory).read_text(encoding='utf-8')
+
+
 class ReadTypeAdapter:
     """Adapter for reading document type content from filesystem.
 
@@ -48,10 +71,8 @@ class ReadTypeAdapter:
             ValueError: If file format is invalid (malformed frontmatter)
 
         """
-        file_path = await self.resolve_file_path(sqid, doctype, directory)
-
-        # Read file content using anyio
-        content = await anyio.Path(file_path).read_text(encoding='utf-8')
+        # Locate and read the file in a single worker-thread call
+        content = await run_sync(_read_type_file, sqid, doctype, directory)
 
         # Parse frontmatter and body
         _, body = self._split_frontmatter_and_body(content)
@@ -79,26 +100,7 @@ class ReadTypeAdapter:
             DoctypeNotFoundError: If the specific doctype file doesn't exist
 
         """
-        # Find all files matching the SQID pattern using anyio
-        from pathlib import Path as PathlibPath
-
-        directory_anyio = anyio.Path(directory)
-        pattern = f'*_{sqid}_*.md'
-        matching_files = [PathlibPath(p) async for p in directory_anyio.glob(pattern)]
-
-        if not matching_files:
-            msg = f'Node @{sqid} not found'
-            raise NodeNotFoundError(msg)
-
-        # Filter for the specific doctype
-        doctype_pattern = f'*_{sqid}_{doctype}_*.md'
-        doctype_files = [PathlibPath(p) async for p in directory_anyio.glob(doctype_pattern)]
-
-        if not doctype_files:
-            raise DoctypeNotFoundError(doctype, sqid)
-
-        # Return first match (should only be one)
-        return doctype_files[0].absolute()
+        return await run_sync(_resolve_file_path, sqid, doctype, directory)
 
     def _split_frontmatter_and_body(self, content: str) -> tuple[dict[str, object], str]:
         """Split file content into frontmatter and body.
@@ -6,10 +6,10 @@ file iteration in outline order, and result generation.
 
 from __future__ import annotations
 
-from pathlib import Path as PathlibPath
 from typing import TYPE_CHECKING
 
 import anyio
+from anyio.to_thread import run_sync
 
 from linemark.domain.search import compile_search_pattern, extract_sqid_from_filename
 from linemark.ports.search import SearchResult
@@ -20,6 +20,11 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
+def _glob_files(directory: Path, patterns: list[str]) -> list[Path]:
+    """Collect the files matching any of the glob patterns in one directory pass per pattern."""
+    return [path for pattern in patterns for path in directory.glob(pattern)]
+
+
 class SearchAdapter:
     """Adapter for searching across document type files.
 
@@ -126,31 +131,24 @@ class SearchAdapter:
             FileNotFoundError: If directory doesn't exist
 
         """
-        directory_anyio = anyio.Path(directory)
-
-        # Build glob patterns and collect files
-        files: list[PathlibPath] = []
-
+        # Build glob patterns
         if subtree_sqid and doctypes:
             # Filter by both subtree and doctypes
-            for doctype in doctypes:
-                pattern = f'{subtree_sqid}*_{doctype}_*.md'
-                # Convert anyio.Path back to pathlib.Path
-                files.extend([PathlibPath(str(path_obj)) async for path_obj in directory_anyio.glob(pattern)])
+            patterns = [f'{subtree_sqid}*_{doctype}_*.md' for doctype in doctypes]
         elif subtree_sqid:
             # Filter by subtree only
-            pattern = f'{subtree_sqid}*.md'
-            files.extend([PathlibPath(str(path_obj)) async for path_obj in directory_anyio.glob(pattern)])
+            patterns = [f'{subtree_sqid}*.md']
         elif doctypes:
             # Filter by doctypes only
-            for doctype in doctypes:
-                pattern = f'*_{doctype}_*.md'
-                files.extend([PathlibPath(str(path_obj)) async for path_obj in directory_anyio.glob(pattern)])
+            patterns = [f'*_{doctype}_*.md' for doctype in doctypes]
         else:
             # No filters, search only linemark outline files (pattern: *_*_*.md)
             # This matches files with at least 2 underscores (position_SQID_doctype_slug.md)
             # and excludes non-linemark files like README.md
-            files.extend([PathlibPath(str(path_obj)) async for path_obj in directory_anyio.glob('*_*_*.md')])
+            patterns = ['*_*_*.md']
+
+        # Collect files in one worker-thread call, not one thread hop per directory entry
+        files = await run_sync(_glob_files, directory, patterns)
 
         # Sort and yield
         for file_path in sorted(files):
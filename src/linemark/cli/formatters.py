@@ -5,7 +5,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from linemark.domain.entities import Node
+    from collections.abc import Iterator
+
+    from linemark.domain.entities import MaterializedPath, Node
 
 
 def format_tree(nodes: list[Node], show_doctypes: bool = False, show_files: bool = False) -> str:  # noqa: FBT001, FBT002
@@ -20,35 +22,52 @@ def format_tree(nodes: list[Node], show_doctypes: bool = False, show_files: bool
         Tree-formatted string with indentation and connectors
 
     """
-    if not nodes:
-        return ''
+    return '\n'.join(format_tree_iter(nodes, show_doctypes=show_doctypes, show_files=show_files))
+
+
+def format_tree_iter(nodes: list[Node], show_doctypes: bool = False, show_files: bool = False) -> Iterator[str]:  # noqa: FBT001, FBT002
+    """Yield the lines of format_tree one at a time, without line terminators.
+
+    Lets callers stream a large outline to output without building the whole string.
+
+    Args:
+        nodes: List of nodes sorted by materialized path
+        show_doctypes: Whether to display document types (default: False)
+        show_files: Whether to display file paths (default: False)
 
-    lines: list[str] = []
+    Yields:
+        Tree lines with indentation and connectors
+
+    """
+    # Index the outline once so per-node lookups don't rescan every node
+    nodes_by_mp: dict[MaterializedPath, Node] = {}
+    for node in nodes:
+        nodes_by_mp.setdefault(node.mp, node)
+    last_children = _last_children(nodes)
 
-    # Build tree structure
     for node in nodes:
         # Determine if this is the last sibling at each depth level
-        is_last_sibling = _is_last_sibling(node, nodes)
+        is_last_sibling = last_children[node.mp.parent()] is node
 
         # Build prefix based on depth and position
-        prefix = _build_prefix(node, nodes)
+        prefix = _build_prefix(node, nodes_by_mp, last_children)
 
         # Add node line
         connector = '└── ' if is_last_sibling else '├── '
         if node.mp.depth == 1:
             # Root nodes have no prefix
-            lines.append(f'{node.title} (@{node.sqid.value})')
+            yield f'{node.title} (@{node.sqid.value})'
         else:
-            lines.append(f'{prefix}{connector}{node.title} (@{node.sqid.value})')
+            yield f'{prefix}{connector}{node.title} (@{node.sqid.value})'
 
         # Add doctype metadata if requested
         if show_doctypes and node.document_types:
             doctype_str = ', '.join(sorted(node.document_types))
             # Add doctype line with proper indentation
             if node.mp.depth == 1:
-                lines.append(f'└─ doctypes: {doctype_str}')
+                yield f'└─ doctypes: {doctype_str}'
             else:
-                lines.append(f'{prefix}└─ doctypes: {doctype_str}')
+                yield f'{prefix}└─ doctypes: {doctype_str}'
 
         # Add file metadata if requested
         if show_files and node.document_types:
@@ -56,38 +75,33 @@ def format_tree(nodes: list[Node], show_doctypes: bool = False, show_files: bool
             files_str = ', '.join(file_list)
             # Add files line with proper indentation
             if node.mp.depth == 1:
-                lines.append(f'└─ files: {files_str}')
+                yield f'└─ files: {files_str}'
             else:
-                lines.append(f'{prefix}└─ files: {files_str}')
-
-    return '\n'.join(lines)
+                yield f'{prefix}└─ files: {files_str}'
 
 
-def _is_last_sibling(node: Node, all_nodes: list[Node]) -> bool:
-    """Check if node is the last sibling among its peers.
+def _last_children(all_nodes: list[Node]) -> dict[MaterializedPath | None, Node]:
+    """Map each parent path to the last of its children, in list order.
 
     Args:
-        node: Node to check
         all_nodes: All nodes in the outline
 
     Returns:
-        True if node is the last sibling, False otherwise
+        Last child node keyed by parent materialized path (None for roots)
 
     """
-    # Get all siblings (nodes with same parent)
-    parent_mp = node.mp.parent()
-    siblings = [n for n in all_nodes if n.mp.parent() == parent_mp]
+    return {node.mp.parent(): node for node in all_nodes}
 
-    # Check if this is the last sibling
-    return node == siblings[-1] if siblings else True
 
-
-def _build_prefix(node: Node, all_nodes: list[Node]) -> str:
+def _build_prefix(
+    node: Node, nodes_by_mp: dict[MaterializedPath, Node], last_children: dict[MaterializedPath | None, Node]
+) -> str:
     """Build the prefix string for a node based on its ancestors.
 
     Args:
         node: Node to build prefix for
-        all_nodes: All nodes in the outline
+        nodes_by_mp: Nodes in the outline keyed by materialized path
+        last_children: Last child node keyed by parent materialized path
 
     Returns:
         Prefix string with indentation and connectors
@@ -102,12 +116,12 @@ def _build_prefix(node: Node, all_nodes: list[Node]) -> str:
     current_mp = node.mp.parent()
     while current_mp is not None and current_mp.depth > 1:
         # Find the node at this level
-        ancestor = next((n for n in all_nodes if n.mp == current_mp), None)
+        ancestor = nodes_by_mp.get(current_mp)
         if ancestor is None:  # pragma: no cover
             break
 
         # Check if ancestor is last sibling
-        ancestor_is_last = _is_last_sibling(ancestor, all_nodes)
+        ancestor_is_last = last_children[current_mp.parent()] is ancestor
 
         # Add connector
         if ancestor_is_last:
@@ -132,36 +146,39 @@ def format_json(nodes: list[Node], show_doctypes: bool = False, show_files: bool
         JSON-formatted string with nested children arrays
 
     """
-    import json
     from typing import Any
 
-    from linemark.domain.entities import MaterializedPath  # noqa: TC001
+    from pydantic_core import to_json
+
+    # Group children under their parent path once, keeping list order
+    children: dict[MaterializedPath | None, list[Node]] = {}
+    for node in nodes:
+        children.setdefault(node.mp.parent(), []).append(node)
 
     def build_tree(parent_mp: MaterializedPath | None) -> list[dict[str, Any]]:
         """Recursively build tree structure."""
         result = []
-        for node in nodes:
-            if node.mp.parent() == parent_mp:
-                node_dict: dict[str, Any] = {
-                    'sqid': node.sqid.value,
-                    'mp': node.mp.as_string,
-                    'title': node.title,
-                    'slug': node.slug,
-                    'document_types': sorted(node.document_types),
-                }
-
-                # Add doctypes field if requested and available
-                if show_doctypes and node.document_types:
-                    node_dict['doctypes'] = sorted(node.document_types)
-
-                # Add files field if requested and available
-                if show_files and node.document_types:
-                    node_dict['files'] = node.filenames()
-
-                # Add children
-                node_dict['children'] = build_tree(node.mp)
-
-                result.append(node_dict)
+        for node in children.get(parent_mp, []):
+            node_dict: dict[str, Any] = {
+                'sqid': node.sqid.value,
+                'mp': node.mp.as_string,
+                'title': node.title,
+                'slug': node.slug,
+                'document_types': sorted(node.document_types),
+            }
+
+            # Add doctypes field if requested and available
+            if show_doctypes and node.document_types:
+                node_dict['doctypes'] = sorted(node.document_types)
+
+            # Add files field if requested and available
+            if show_files and node.document_types:
+                node_dict['files'] = node.filenames()
+
+            # Add children
+            node_dict['children'] = build_tree(node.mp)
+
+            result.append(node_dict)
         return result
 
     # Find the shallowest parent MP in the nodes list
@@ -169,17 +186,10 @@ def format_json(nodes: list[Node], show_doctypes: bool = False, show_files: bool
     if not nodes:
         return '[]'
 
-    # Get all unique parent MPs
-    parent_mps_list = [node.mp.parent() for node in nodes]
-    # Remove duplicates by comparing materialized paths
-    unique_parents: list[MaterializedPath | None] = []
-    for mp in parent_mps_list:
-        if mp not in unique_parents:  # This works because MaterializedPath has __eq__
-            unique_parents.append(mp)
-
     # Start from the shallowest parent (the one with smallest depth)
-    # or None if we have root nodes
-    root_parent = min(unique_parents, key=lambda mp: mp.depth if mp else -1)
+    # or None if we have root nodes; the children keys are the unique parents in list order
+    root_parent = min(children, key=lambda mp: mp.depth if mp else -1)
 
     tree = build_tree(root_parent)
-    return json.dumps(tree, indent=2)
+    # pydantic-core's Rust serializer; same layout as json.dumps(indent=2), but UTF-8 is not escaped
+    return to_json(tree, indent=2).decode()
@@ -2,31 +2,123 @@
 
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import asyncclick as click
+import click
 
-from linemark.cli.formatters import format_json, format_tree
-from linemark.commanders import LinemarkCommander
+from linemark.cli.formatters import format_json, format_tree_iter
 from linemark.domain.exceptions import DoctypeNotFoundError, InvalidRegexError, NodeNotFoundError
+from linemark.utils import strip_at
+
+if TYPE_CHECKING:
+    import asyncio
+    import builtins
+    from collections.abc import AsyncIterator, Callable, Coroutine
+
+    from linemark.commanders import LinemarkCommander
+    from linemark.domain.entities import Node
+
+
+@functools.cache
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's event loop factory when it is installed, else None (asyncio default)."""
+    try:
+        import uvloop  # type: ignore[import-not-found,unused-ignore]
+    except ImportError:  # pragma: no cover
+        return None
+    return uvloop.new_event_loop  # type: ignore[no-any-return,unused-ignore]  # pragma: no cover
+
+
+def coro[**P, R](func: Callable[P, Coroutine[Any, Any, R]]) -> Callable[P, R]:
+    """Run an async command body to completion with asyncio.run, on uvloop if available."""
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        # Deferred like the commander import: --help and usage errors never start a loop
+        import asyncio
+
+        return asyncio.run(func(*args, **kwargs), loop_factory=_loop_factory())
+
+    return wrapper
+
+
+def _commander_factory(directory: Path) -> Callable[[], LinemarkCommander]:
+    """Return a cached factory for the commander of the working directory.
+
+    The commander pulls in every use case and adapter, so it is imported on
+    first use rather than at module load; ``lmk --help`` never pays for it.
+    Every command in the invocation then shares the one instance and its adapters.
+    """
+
+    @functools.cache
+    def commander() -> LinemarkCommander:
+        from linemark.commanders import LinemarkCommander
+
+        return LinemarkCommander(directory=directory)
+
+    return commander
+
+
+def _discard_stdout() -> None:
+    """Point stdout at os.devnull so the interpreter's final flush cannot raise again."""
+    import os
+
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+
+
+async def _write_stream(pieces: AsyncIterator[str]) -> None:
+    """Stream pieces to stdout as they arrive; an empty stream writes nothing, not even a newline."""
+    write = sys.stdout.write
+    wrote = False
+    try:
+        async for piece in pieces:
+            write(piece)
+            wrote = True
+        if wrote:
+            write('\n')
+    finally:
+        sys.stdout.flush()
+
+
+def _echo_nodes(nodes: builtins.list[Node], *, show_doctypes: bool, show_files: bool, output_json: bool) -> None:
+    """Write nodes to stdout as JSON or as a tree streamed line by line rather than built as one string."""
+    if output_json:
+        click.echo(format_json(nodes, show_doctypes=show_doctypes, show_files=show_files))
+    elif nodes:
+        lines = format_tree_iter(nodes, show_doctypes=show_doctypes, show_files=show_files)
+        sys.stdout.writelines(f'{line}\n' for line in lines)
+        sys.stdout.flush()
+    else:
+        click.echo('No nodes found in outline.', err=True)
+
+
+def _commander(ctx: click.Context) -> LinemarkCommander:
+    """Return the shared commander for this invocation."""
+    factory: Callable[[], LinemarkCommander] = ctx.obj['commander_factory']
+    return factory()
 
 
 @click.group()
 @click.option(
     '--directory',
     type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
-    default=Path.cwd(),
+    default=None,
     help='Working directory (default: current directory)',
 )
 @click.pass_context
-def lmk(ctx: click.Context, directory: Path) -> None:
+def lmk(ctx: click.Context, directory: Path | None) -> None:
     """Linemark - Hierarchical Markdown Outline Manager.
 
     A command-line tool for managing hierarchical outlines of Markdown documents
     using filename-based organization.
     """
-    ctx.obj = {'directory': directory}
+    # Resolved once per invocation (not at import time); commands reuse ctx.obj
+    directory = directory if directory is not None else Path.cwd()
+    ctx.obj = {'directory': directory, 'commander_factory': _commander_factory(directory)}
 
 
 @lmk.command(name='compile')
@@ -38,6 +130,7 @@ def lmk(ctx: click.Context, directory: Path) -> None:
     help='Separator between documents (escape sequences interpreted)',
 )
 @click.pass_context
+@coro
 async def compile_doctype(
     ctx: click.Context,
     doctype: str,
@@ -70,17 +163,13 @@ async def compile_doctype(
 
     """
     try:
-        commander = LinemarkCommander(directory=ctx.obj['directory'])
-        result = await commander.compile_doctype(
+        commander = _commander(ctx)
+        pieces = commander.compile_doctype_stream(
             doctype=doctype,
-            sqid=sqid.lstrip('@') if sqid else None,
+            sqid=strip_at(sqid),
             separator=separator,
         )
-
-        # Output to stdout
-        if result:
-            click.echo(result)
-        # Empty result is silent success (no output)
+        await _write_stream(pieces)
 
     except DoctypeNotFoundError as e:
         click.echo(f'Error: {e}', err=True)
@@ -111,6 +200,7 @@ async def compile_doctype(
     help='Insert before sibling (requires --sibling-of)',
 )
 @click.pass_context
+@coro
 async def add(
     ctx: click.Context,
     title: str,
@@ -140,18 +230,20 @@ async def add(
 
     """
     try:
-        commander = LinemarkCommander(directory=ctx.obj['directory'])
+        commander = _commander(ctx)
         node = await commander.add(
             title=title,
-            child_of=child_of.lstrip('@') if child_of else None,
-            sibling_of=sibling_of.lstrip('@') if sibling_of else None,
+            child_of=strip_at(child_of),
+            sibling_of=strip_at(sibling_of),
             before=before,
         )
 
         # Output success message
-        click.echo(f'Created node {node.mp.as_string} (@{node.sqid.value}): {node.title}')
-        click.echo(f'  Draft: {node.filename("draft")}')
-        click.echo(f'  Notes: {node.filename("notes")}')
+        click.echo(
+            f'Created node {node.mp.as_string} (@{node.sqid.value}): {node.title}\n'
+            f'  Draft: {node.filename("draft")}\n'
+            f'  Notes: {node.filename("notes")}'
+        )
 
     except ValueError as e:
         click.echo(f'Error: {e}', err=True)
@@ -179,6 +271,7 @@ async def add(
     help='Output in JSON format instead of tree',
 )
 @click.pass_context
+@coro
 async def list(ctx: click.Context, sqid: str | None, show_doctypes: bool, show_files: bool, output_json: bool) -> None:  # noqa: A001, FBT001
     """List all nodes in the outline, optionally filtered to a subtree.
 
@@ -206,21 +299,17 @@ async def list(ctx: click.Context, sqid: str | None, show_doctypes: bool, show_f
     """
     try:
         # Strip @ prefix if provided
-        sqid_clean = sqid.lstrip('@') if sqid else None
+        sqid_clean = strip_at(sqid)
 
-        commander = LinemarkCommander(directory=ctx.obj['directory'])
+        commander = _commander(ctx)
         nodes = await commander.list_nodes(sqid=sqid_clean)
 
-        # Format and output
-        if output_json:
-            output = format_json(nodes, show_doctypes=show_doctypes, show_files=show_files)
-        else:
-            output = format_tree(nodes, show_doctypes=show_doctypes, show_files=show_files)
-
-        if output:
-            click.echo(output)
-        else:
-            click.echo('No nodes found in outline.', err=True)
+        try:
+            _echo_nodes(nodes, show_doctypes=show_doctypes, show_files=show_files, output_json=output_json)
+        except BrokenPipeError:
+            # The reader went away (e.g. `lmk list | head`); stop writing and exit quietly
+            _discard_stdout()
+            sys.exit(1)
 
     except ValueError as e:
         click.echo(f'Error: {e}', err=True)
@@ -249,6 +338,7 @@ async def list(ctx: click.Context, sqid: str | None, show_doctypes: bool, show_f
     metavar='SQID',
 )
 @click.pass_context
+@coro
 async def move(
     ctx: click.Context,
     sqid: str,
@@ -278,14 +368,13 @@ async def move(
     """
     try:
         # Strip @ prefix if provided
-        sqid_clean = sqid.lstrip('@')
+        sqid_clean = strip_at(sqid)
 
-        commander = LinemarkCommander(directory=ctx.obj['directory'])
+        commander = _commander(ctx)
         await commander.move(sqid=sqid_clean, target_mp=target_mp)
 
         # Output success message
-        click.echo(f'Moved node @{sqid_clean} to {target_mp}')
-        click.echo('All files renamed successfully')
+        click.echo(f'Moved node @{sqid_clean} to {target_mp}\nAll files renamed successfully')
 
     except ValueError as e:
         click.echo(f'Error: {e}', err=True)
@@ -296,6 +385,7 @@ async def move(
 @click.argument('sqid')
 @click.argument('new_title')
 @click.pass_context
+@coro
 async def rename(ctx: click.Context, sqid: str, new_title: str) -> None:
     """Rename a node with a new title.
 
@@ -316,14 +406,13 @@ async def rename(ctx: click.Context, sqid: str, new_title: str) -> None:
     """
     try:
         # Strip @ prefix if provided
-        sqid_clean = sqid.lstrip('@')
+        sqid_clean = strip_at(sqid)
 
-        commander = LinemarkCommander(directory=ctx.obj['directory'])
+        commander = _commander(ctx)
         await commander.rename(sqid=sqid_clean, new_title=new_title)
 
         # Output success message
-        click.echo(f'Renamed node @{sqid_clean} to "{new_title}"')
-        click.echo('All files updated successfully')
+        click.echo(f'Renamed node @{sqid_clean} to "{new_title}"\nAll files updated successfully')
 
     except ValueError as e:
         click.echo(f'Error: {e}', err=True)
@@ -345,6 +434,7 @@ async def rename(ctx: click.Context, sqid: str, new_title: str) -> None:
     help='Delete node but promote children to parent level',
 )
 @click.pass_context
+@coro
 async def delete(ctx: click.Context, sqid: str, recursive: bool, promote: bool) -> None:  # noqa: FBT001
     """Delete a node from the outline.
 
@@ -369,9 +459,9 @@ async def delete(ctx: click.Context, sqid: str, recursive: bool, promote: bool)
     """
     try:
         # Strip @ prefix if provided
-        sqid_clean = sqid.lstrip('@')
+        sqid_clean = strip_at(sqid)
 
-        commander = LinemarkCommander(directory=ctx.obj['directory'])
+        commander = _commander(ctx)
         deleted_nodes = await commander.delete(sqid=sqid_clean, recursive=recursive, promote=promote)
 
         # Output success message
@@ -390,6 +480,7 @@ async def delete(ctx: click.Context, sqid: str, recursive: bool, promote: bool)
 @lmk.command()
 @click.argument('sqid', required=False)
 @click.pass_context
+@coro
 async def compact(ctx: click.Context, sqid: str | None) -> None:
     """Restore clean, evenly-spaced numbering to the outline.
 
@@ -409,8 +500,8 @@ async def compact(ctx: click.Context, sqid: str | None) -> None:
     """
     try:
         # Strip @ prefix if provided
-        sqid_clean = sqid.lstrip('@') if sqid else None
-        commander = LinemarkCommander(directory=ctx.obj['directory'])
+        sqid_clean = strip_at(sqid)
+        commander = _commander(ctx)
         compacted_nodes = await commander.compact(sqid=sqid_clean)
 
         # Output success message
@@ -431,6 +522,7 @@ async def compact(ctx: click.Context, sqid: str | None) -> None:
     help='Auto-repair common issues (missing files, etc.)',
 )
 @click.pass_context
+@coro
 async def doctor(ctx: click.Context, repair: bool) -> None:  # noqa: FBT001
     """Validate outline integrity and repair common issues.
 
@@ -449,25 +541,19 @@ async def doctor(ctx: click.Context, repair: bool) -> None:  # noqa: FBT001
 
     """
     try:
-        commander = LinemarkCommander(directory=ctx.obj['directory'])
+        commander = _commander(ctx)
         result = await commander.doctor(repair=repair)
 
         # Output results
         if result['valid']:
             click.echo('✓ Outline is valid')
             if result['repaired']:
-                click.echo('\nRepairs performed:')
-                for repair_msg in result['repaired']:
-                    click.echo(f'  • {repair_msg}')
+                click.echo('\n'.join(['\nRepairs performed:', *(f'  • {msg}' for msg in result['repaired'])]))
         else:
-            click.echo('✗ Outline has integrity issues:', err=True)
-            click.echo('', err=True)
-            for violation in result['violations']:
-                click.echo(f'  • {violation}', err=True)
-
+            lines = ['✗ Outline has integrity issues:', '', *(f'  • {violation}' for violation in result['violations'])]
             if not repair:  # pragma: no branch
-                click.echo('', err=True)
-                click.echo('Run with --repair to auto-fix common issues', err=True)
+                lines += ['', 'Run with --repair to auto-fix common issues']
+            click.echo('\n'.join(lines), err=True)
 
             sys.exit(1)
 
@@ -507,6 +593,7 @@ async def doctor(ctx: click.Context, repair: bool) -> None:  # noqa: FBT001
     help='Output results as JSON (one per line)',
 )
 @click.pass_context
+@coro
 async def search(
     ctx: click.Context,
     pattern: str,
@@ -561,27 +648,37 @@ async def search(
     """
     try:
         # Strip @ prefix from subtree_sqid if provided
-        if subtree_sqid:
-            subtree_sqid = subtree_sqid.lstrip('@')
+        subtree_sqid = strip_at(subtree_sqid)
 
         # Convert doctypes tuple to list or None
         doctype_list = list(doctypes) if doctypes else None
 
-        commander = LinemarkCommander(directory=ctx.obj['directory'])
+        commander = _commander(ctx)
 
-        # Output results
-        async for result in commander.search(
+        results = commander.search(
             pattern=pattern,
             subtree_sqid=subtree_sqid,
             doctypes=doctype_list,
             case_sensitive=case_sensitive,
             multiline=multiline,
             literal=literal,
-        ):
+        )
+
+        # Output results; write directly rather than paying click.echo's per-line overhead
+        try:
             if output_json:
-                click.echo(result.format_json())
+                # JSON is serialized straight to UTF-8, so bypass the text layer
+                write_bytes = sys.stdout.buffer.write
+                async for result in results:
+                    write_bytes(result.format_json_bytes())
+                    write_bytes(b'\n')
             else:
-                click.echo(result.format_plaintext())
+                write = sys.stdout.write
+                async for result in results:
+                    write(result.format_plaintext())
+                    write('\n')
+        finally:
+            sys.stdout.flush()
 
     except InvalidRegexError as e:
         click.echo(f'Error: {e}', err=True)
@@ -603,6 +700,7 @@ def types() -> None:
 @types.command('list')
 @click.argument('sqid')
 @click.pass_context
+@coro
 async def types_list(ctx: click.Context, sqid: str) -> None:
     """List all document types for a node.
 
@@ -617,16 +715,16 @@ async def types_list(ctx: click.Context, sqid: str) -> None:
     """
     try:
         # Strip @ prefix if provided
-        sqid_clean = sqid.lstrip('@')
+        sqid_clean = strip_at(sqid)
 
-        commander = LinemarkCommander(directory=ctx.obj['directory'])
+        commander = _commander(ctx)
         doc_types = await commander.list_types(sqid=sqid_clean)
 
         # Output types
         if doc_types:
-            click.echo(f'Document types for @{sqid_clean}:')
-            for doc_type in doc_types:
-                click.echo(f'  - {doc_type}')
+            click.echo(
+                '\n'.join([f'Document types for @{sqid_clean}:', *(f'  - {doc_type}' for doc_type in doc_types)])
+            )
         else:
             click.echo(f'No document types found for @{sqid_clean}', err=True)
             sys.exit(1)
@@ -640,6 +738,7 @@ async def types_list(ctx: click.Context, sqid: str) -> None:
 @click.argument('doc_type')
 @click.argument('sqid')
 @click.pass_context
+@coro
 async def types_add(ctx: click.Context, doc_type: str, sqid: str) -> None:
     """Add a new document type to a node.
 
@@ -655,9 +754,9 @@ async def types_add(ctx: click.Context, doc_type: str, sqid: str) -> None:
     """
     try:
         # Strip @ prefix if provided
-        sqid_clean = sqid.lstrip('@')
+        sqid_clean = strip_at(sqid)
 
-        commander = LinemarkCommander(directory=ctx.obj['directory'])
+        commander = _commander(ctx)
         await commander.add_type(doc_type=doc_type, sqid=sqid_clean)
 
         # Output success message
@@ -672,6 +771,7 @@ async def types_add(ctx: click.Context, doc_type: str, sqid: str) -> None:
 @click.argument('doc_type')
 @click.argument('sqid')
 @click.pass_context
+@coro
 async def types_remove(ctx: click.Context, doc_type: str, sqid: str) -> None:
     """Remove a document type from a node.
 
@@ -687,9 +787,9 @@ async def types_remove(ctx: click.Context, doc_type: str, sqid: str) -> None:
     """
     try:
         # Strip @ prefix if provided
-        sqid_clean = sqid.lstrip('@')
+        sqid_clean = strip_at(sqid)
 
-        commander = LinemarkCommander(directory=ctx.obj['directory'])
+        commander = _commander(ctx)
         await commander.remove_type(doc_type=doc_type, sqid=sqid_clean)
 
         # Output success message
@@ -704,6 +804,7 @@ async def types_remove(ctx: click.Context, doc_type: str, sqid: str) -> None:
 @click.argument('doctype')
 @click.argument('sqid')
 @click.pass_context
+@coro
 async def types_read(ctx: click.Context, doctype: str, sqid: str) -> None:
     """Read the body content of a document type.
 
@@ -719,9 +820,9 @@ async def types_read(ctx: click.Context, doctype: str, sqid: str) -> None:
     """
     try:
         # Strip @ prefix if provided
-        sqid_clean = sqid.lstrip('@')
+        sqid_clean = strip_at(sqid)
 
-        commander = LinemarkCommander(directory=ctx.obj['directory'])
+        commander = _commander(ctx)
         body = await commander.read_type(doctype=doctype, sqid=sqid_clean)
 
         # Output body to stdout
@@ -741,8 +842,14 @@ async def types_read(ctx: click.Context, doctype: str, sqid: str) -> None:
 @types.command('write')
 @click.argument('doctype')
 @click.argument('sqid')
+@click.option(
+    '--empty',
+    is_flag=True,
+    help='Clear the body without reading stdin',
+)
 @click.pass_context
-async def types_write(ctx: click.Context, doctype: str, sqid: str) -> None:
+@coro
+async def types_write(ctx: click.Context, doctype: str, sqid: str, *, empty: bool) -> None:
     """Write body content to a document type from stdin.
 
     Write the body content from stdin to the specified document type file,
@@ -758,17 +865,17 @@ async def types_write(ctx: click.Context, doctype: str, sqid: str) -> None:
 
         \b
         # Write empty content (clear the body)
-        echo -n "" | lmk types write notes @SQID1
+        lmk types write notes @SQID1 --empty
 
     """
     try:
         # Strip @ prefix if provided
-        sqid_clean = sqid.lstrip('@')
+        sqid_clean = strip_at(sqid)
 
-        # Read body content from stdin
-        body = sys.stdin.read()
+        # Read body content from stdin in one read and decode it once
+        body = '' if empty else sys.stdin.buffer.read().decode('utf-8')
 
-        commander = LinemarkCommander(directory=ctx.obj['directory'])
+        commander = _commander(ctx)
         await commander.write_type(doctype=doctype, sqid=sqid_clean, body=body)
 
     except NodeNotFoundError as e:
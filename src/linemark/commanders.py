@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 from linemark.adapters.filesystem import ConstitutionFileAdapter, FileSystemAdapter
@@ -14,7 +15,8 @@ from linemark.use_cases.add_node import AddNodeUseCase
 from linemark.use_cases.compact_outline import CompactOutlineUseCase
 from linemark.use_cases.compile_doctype import CompileDoctypeUseCase
 from linemark.use_cases.delete_node import DeleteNodeUseCase
-from linemark.use_cases.list_outline import ListOutlineUseCase
+from linemark.use_cases.first_node import FirstNodeUseCase
+from linemark.use_cases.list_outline import DEFAULT_READ_CONCURRENCY, ListOutlineUseCase
 from linemark.use_cases.manage_types import ManageTypesUseCase
 from linemark.use_cases.move_node import MoveNodeUseCase
 from linemark.use_cases.read_type import ReadTypeUseCase
@@ -22,7 +24,7 @@ from linemark.use_cases.rename_node import RenameNodeUseCase
 from linemark.use_cases.search import SearchUseCase
 from linemark.use_cases.validate_outline import ValidateOutlineUseCase, ValidationResult
 from linemark.use_cases.write_type import WriteTypeUseCase
-from linemark.utils import first
+from linemark.utils import strip_at
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -32,6 +34,18 @@ if TYPE_CHECKING:
     from linemark.ports.search import SearchResult
 
 
+@functools.cache
+def _sqid_generator() -> SQIDGeneratorAdapter:
+    """Return the process-wide SQID generator (stateless once its alphabet is built)."""
+    return SQIDGeneratorAdapter()
+
+
+@functools.cache
+def _slugifier() -> SlugifierAdapter:
+    """Return the process-wide slugifier (stateless)."""
+    return SlugifierAdapter()
+
+
 class ConstitutionCommander:  # pragma: no cover
     """A commander for the Constitution."""
 
@@ -52,37 +66,63 @@ class CharterCommander:  # pragma: no cover
 
     def __init__(self, directory: Path) -> None:  # pragma: no cover
         self.directory = directory
+        self.linemark_commander = LinemarkCommander(directory)
 
     async def read_charter(self) -> str:  # pragma: no cover
         """Read the charter."""
-        linemark_commander = LinemarkCommander(self.directory)
-        first_node = first(await linemark_commander.list_nodes())
-        if first_node is None:
+        first_sqid = await self.linemark_commander.first_node_sqid()
+        if first_sqid is None:
             raise ValueError('No nodes found')
-        return await linemark_commander.read_type(doctype='charter', sqid=first_node.sqid.value)
+        return await self.linemark_commander.read_type(doctype='charter', sqid=first_sqid)
 
     async def write_charter(self, content: str) -> None:  # pragma: no cover
         """Write the charter."""
-        linemark_commander = LinemarkCommander(self.directory)
-        first_node = first(await linemark_commander.list_nodes())
-        if first_node is None:
-            first_node = await linemark_commander.add(title='Project')
-        return await linemark_commander.write_type(doctype='charter', sqid=first_node.sqid.value, body=content)
+        first_sqid = await self.linemark_commander.first_node_sqid()
+        if first_sqid is None:
+            first_sqid = (await self.linemark_commander.add(title='Project')).sqid.value
+        return await self.linemark_commander.write_type(doctype='charter', sqid=first_sqid, body=content)
 
 
-class LinemarkCommander:
+class LinemarkCommander:  # noqa: PLR0904
     """A commander for the Linemark CLI."""
 
     def __init__(self, directory: Path) -> None:
         self.directory = directory
 
-    async def compile_doctype(self, doctype: str, sqid: str | None = None, separator: str = '\n\n---\n\n') -> str:
+    @functools.cached_property
+    def filesystem(self) -> FileSystemAdapter:
+        """Filesystem adapter, built on first use and shared by every command."""
+        return FileSystemAdapter()
+
+    @functools.cached_property
+    def search_adapter(self) -> SearchAdapter:
+        """Search adapter, built on first use and reused by later searches."""
+        return SearchAdapter()
+
+    @functools.cached_property
+    def read_adapter(self) -> ReadTypeAdapter:
+        """Read-type adapter, built on first use and reused by later reads."""
+        return ReadTypeAdapter()
+
+    @functools.cached_property
+    def write_adapter(self) -> WriteTypeAdapter:
+        """Write-type adapter, built on first use and reused by later writes."""
+        return WriteTypeAdapter()
+
+    async def compile_doctype(
+        self,
+        doctype: str,
+        sqid: str | None = None,
+        separator: str = '\n\n---\n\n',
+        concurrency: int = DEFAULT_READ_CONCURRENCY,
+    ) -> str:
         """Compile all doctype files into a single document.
 
         Args:
             doctype: The doctype to compile.
             sqid: The SQID of the subtree to compile.
             separator: The separator to use between documents.
+            concurrency: The maximum number of files to read at the same time.
 
         Returns:
             The compiled document.
@@ -94,20 +134,43 @@ class LinemarkCommander:
             PermissionError: If the file system operation fails due to permissions.
 
         """
-        # Strip @ prefix if provided
-        clean_sqid = sqid.lstrip('@') if sqid else None
+        pieces = self.compile_doctype_stream(doctype=doctype, sqid=sqid, separator=separator, concurrency=concurrency)
+        return ''.join([piece async for piece in pieces])
+
+    async def compile_doctype_stream(
+        self,
+        doctype: str,
+        sqid: str | None = None,
+        separator: str = '\n\n---\n\n',
+        concurrency: int = DEFAULT_READ_CONCURRENCY,
+    ) -> AsyncIterator[str]:
+        """Compile all doctype files, yielding the document piece by piece.
+
+        Args:
+            doctype: The doctype to compile.
+            sqid: The SQID of the subtree to compile.
+            separator: The separator to use between documents.
+            concurrency: The maximum number of files to read at the same time.
 
-        # Create adapter
-        filesystem = FileSystemAdapter()
+        Yields:
+            Document contents and separators, in outline order.
 
-        # Execute use case
-        use_case = CompileDoctypeUseCase(filesystem=filesystem)
-        return await use_case.execute(
+        Raises:
+            DoctypeNotFoundError: If the doctype is not found.
+            NodeNotFoundError: If the node is not found.
+            OSError: If the file system operation fails.
+            PermissionError: If the file system operation fails due to permissions.
+
+        """
+        use_case = CompileDoctypeUseCase(filesystem=self.filesystem)
+        async for piece in use_case.iter_compiled(
             doctype=doctype,
             directory=self.directory,
-            sqid=clean_sqid,
+            sqid=strip_at(sqid),
             separator=separator,
-        )
+            concurrency=concurrency,
+        ):
+            yield piece
 
     async def add(
         self,
@@ -134,13 +197,12 @@ class LinemarkCommander:
 
         """
         # Create adapters
-        filesystem = FileSystemAdapter()
-        sqid_generator = SQIDGeneratorAdapter()
-        slugifier = SlugifierAdapter()
+        sqid_generator = _sqid_generator()
+        slugifier = _slugifier()
 
         # Execute use case
         use_case = AddNodeUseCase(
-            filesystem=filesystem,
+            filesystem=self.filesystem,
             sqid_generator=sqid_generator,
             slugifier=slugifier,
         )
@@ -153,6 +215,18 @@ class LinemarkCommander:
             before=before,
         )
 
+    async def first_node_sqid(self) -> str | None:
+        """Find the SQID of the first node in the outline.
+
+        Only filenames are scanned; no node files are read.
+
+        Returns:
+            The SQID of the first node, or None if the outline is empty.
+
+        """
+        use_case = FirstNodeUseCase(filesystem=self.filesystem)
+        return await use_case.execute(directory=self.directory)
+
     async def list_nodes(self, sqid: str | None = None) -> list[Node]:
         """List all nodes in the outline, optionally filtered to a subtree.
 
@@ -168,9 +242,7 @@ class LinemarkCommander:
             ValueError: If the nodes are not found.
 
         """
-        filesystem = FileSystemAdapter()
-
-        use_case = ListOutlineUseCase(filesystem=filesystem)
+        use_case = ListOutlineUseCase(filesystem=self.filesystem)
         return await use_case.execute(directory=self.directory, root_sqid=sqid)
 
     async def move(
@@ -196,10 +268,8 @@ class LinemarkCommander:
             ValueError: If the node is not found.
 
         """
-        filesystem = FileSystemAdapter()
-
         # Execute use case
-        use_case = MoveNodeUseCase(filesystem=filesystem)
+        use_case = MoveNodeUseCase(filesystem=self.filesystem)
         await use_case.execute(
             sqid=sqid,
             new_mp_str=target_mp,
@@ -224,11 +294,10 @@ class LinemarkCommander:
             ValueError: If the node is not found.
 
         """
-        filesystem = FileSystemAdapter()
-        slugifier = SlugifierAdapter()
+        slugifier = _slugifier()
 
         # Execute use case
-        use_case = RenameNodeUseCase(filesystem=filesystem, slugifier=slugifier)
+        use_case = RenameNodeUseCase(filesystem=self.filesystem, slugifier=slugifier)
         await use_case.execute(sqid=sqid, new_title=new_title, directory=self.directory)
 
     async def delete(self, sqid: str, recursive: bool, promote: bool) -> list[Node]:  # noqa: FBT001
@@ -252,8 +321,7 @@ class LinemarkCommander:
             PermissionError: If the file system operation fails due to permissions.
 
         """
-        filesystem = FileSystemAdapter()
-        use_case = DeleteNodeUseCase(filesystem=filesystem)
+        use_case = DeleteNodeUseCase(filesystem=self.filesystem)
         return await use_case.execute(sqid=sqid, directory=self.directory, recursive=recursive, promote=promote)
 
     async def compact(self, sqid: str | None) -> list[Node]:
@@ -272,8 +340,7 @@ class LinemarkCommander:
             ValueError: If the node is not found.
 
         """
-        filesystem = FileSystemAdapter()
-        use_case = CompactOutlineUseCase(filesystem=filesystem)
+        use_case = CompactOutlineUseCase(filesystem=self.filesystem)
         return await use_case.execute(sqid=sqid, directory=self.directory)
 
     async def doctor(self, repair: bool) -> ValidationResult:  # noqa: FBT001
@@ -292,8 +359,7 @@ class LinemarkCommander:
             ValueError: If the outline is not valid.
 
         """
-        filesystem = FileSystemAdapter()
-        use_case = ValidateOutlineUseCase(filesystem=filesystem)
+        use_case = ValidateOutlineUseCase(filesystem=self.filesystem)
         return await use_case.execute(directory=self.directory, repair=repair)
 
     async def search(
@@ -330,8 +396,7 @@ class LinemarkCommander:
             UnicodeDecodeError: If the files are not valid UTF-8.
 
         """
-        search_adapter = SearchAdapter()
-        use_case = SearchUseCase(search_port=search_adapter)
+        use_case = SearchUseCase(search_port=self.search_adapter)
         async for result in use_case.execute(
             pattern=pattern,
             directory=self.directory,
@@ -358,11 +423,8 @@ class LinemarkCommander:
             ValueError: If the document types are not found.
 
         """
-        # Create adapter
-        filesystem = FileSystemAdapter()
-
         # Execute use case
-        use_case = ManageTypesUseCase(filesystem=filesystem)
+        use_case = ManageTypesUseCase(filesystem=self.filesystem)
         return await use_case.list_types(sqid=sqid, directory=self.directory)
 
     async def add_type(self, doc_type: str, sqid: str) -> None:
@@ -379,11 +441,8 @@ class LinemarkCommander:
             ValueError: If the document type is not added.
 
         """
-        # Create adapter
-        filesystem = FileSystemAdapter()
-
         # Execute use case
-        use_case = ManageTypesUseCase(filesystem=filesystem)
+        use_case = ManageTypesUseCase(filesystem=self.filesystem)
         return await use_case.add_type(sqid=sqid, doc_type=doc_type, directory=self.directory)
 
     async def remove_type(self, doc_type: str, sqid: str) -> None:
@@ -403,10 +462,8 @@ class LinemarkCommander:
             ValueError: If the document type is not removed.
 
         """
-        filesystem = FileSystemAdapter()
-
         # Execute use case
-        use_case = ManageTypesUseCase(filesystem=filesystem)
+        use_case = ManageTypesUseCase(filesystem=self.filesystem)
         return await use_case.remove_type(sqid=sqid, doc_type=doc_type, directory=self.directory)
 
     async def read_type(self, doctype: str, sqid: str) -> str:
@@ -425,10 +482,8 @@ class LinemarkCommander:
             ValueError: If the document type is not read.
 
         """
-        read_adapter = ReadTypeAdapter()
-
         # Execute use case
-        use_case = ReadTypeUseCase(read_type_port=read_adapter)
+        use_case = ReadTypeUseCase(read_type_port=self.read_adapter)
         return await use_case.execute(
             sqid=sqid,
             doctype=doctype,
@@ -454,11 +509,8 @@ class LinemarkCommander:
             ValueError: If the document type is not written.
 
         """
-        # Create adapter
-        write_adapter = WriteTypeAdapter()
-
         # Execute use case
-        use_case = WriteTypeUseCase(write_type_port=write_adapter)
+        use_case = WriteTypeUseCase(write_type_port=self.write_adapter)
         return use_case.execute(
             sqid=sqid,
             doctype=doctype,
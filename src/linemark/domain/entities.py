@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, field_validator
+import functools
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 # Materialized path segment constraints
 MIN_SEGMENT_VALUE = 1
 MAX_SEGMENT_VALUE = 999
 
+# Zero-padded text of every segment value, indexed by the value itself
+_SEGMENT_STRINGS: tuple[str, ...] = tuple(f'{seg:03d}' for seg in range(MAX_SEGMENT_VALUE + 1))
+
 
 class MaterializedPath(BaseModel):
     """Materialized path value object.
@@ -16,6 +21,8 @@ class MaterializedPath(BaseModel):
     sortable path segments (001-999).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     segments: tuple[int, ...] = Field(
         ...,
         description='Path segments as integers (001, 100, 050, etc.)',
@@ -31,6 +38,13 @@ class MaterializedPath(BaseModel):
             raise ValueError(msg)
         return v
 
+    # Formatted once at construction; paths are immutable, so it never goes stale
+    _as_string: str = PrivateAttr()
+
+    def model_post_init(self, _context: object, /) -> None:
+        """Precompute the string form used by filenames and sorting."""
+        self._as_string = '-'.join([_SEGMENT_STRINGS[seg] for seg in self.segments])
+
     @property
     def depth(self) -> int:
         """Depth in hierarchy (1 for root, 2 for child, etc.)."""
@@ -39,7 +53,7 @@ class MaterializedPath(BaseModel):
     @property
     def as_string(self) -> str:
         """String representation: '001-100-050'."""
-        return '-'.join(f'{seg:03d}' for seg in self.segments)
+        return self._as_string
 
     @classmethod
     def from_string(cls, path_str: str) -> MaterializedPath:
@@ -55,17 +69,7 @@ class MaterializedPath(BaseModel):
             ValueError: If path_str is empty, non-numeric, or segments out of range
 
         """
-        if not path_str:
-            msg = 'Path string cannot be empty'
-            raise ValueError(msg)
-
-        try:
-            segments = tuple(int(seg) for seg in path_str.split('-'))
-        except ValueError as e:
-            msg = f'Invalid path format: {path_str!r}'
-            raise ValueError(msg) from e
-
-        return cls(segments=segments)
+        return _parse_path(path_str)
 
     def parent(self) -> MaterializedPath | None:
         """Get parent path (None if root)."""
@@ -109,6 +113,22 @@ class MaterializedPath(BaseModel):
         return MaterializedPath(segments=(*new_prefix.segments, *remaining_segments))
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_path(path_str: str) -> MaterializedPath:
+    """Parse a path string, memoized: paths are immutable, so equal strings can share one instance."""
+    if not path_str:
+        msg = 'Path string cannot be empty'
+        raise ValueError(msg)
+
+    try:
+        segments = tuple(int(seg) for seg in path_str.split('-'))
+    except ValueError as e:
+        msg = f'Invalid path format: {path_str!r}'
+        raise ValueError(msg) from e
+
+    return MaterializedPath(segments=segments)
+
+
 class SQID(BaseModel):
     """SQID value object (URL-safe short identifier).
 
@@ -141,7 +161,7 @@ class SQID(BaseModel):
 
     def __eq__(self, other: object) -> bool:
         """Equality comparison."""
-        if not isinstance(other, SQID):
+        if type(other) is not SQID:
             return False
         return self.value == other.value
 
@@ -162,6 +182,15 @@ class Node(BaseModel):
         description='Document types present for this node',
     )
 
+    def _filename_parts(self) -> tuple[str, str]:
+        """Split the filename format around its document type.
+
+        Returns:
+            The '<mp>_<sqid>_' prefix and '_<slug>.md' suffix
+
+        """
+        return f'{self.mp.as_string}_{self.sqid.value}_', f'_{self.slug}.md'
+
     def filename(self, doc_type: str) -> str:
         """Generate filename for given document type.
 
@@ -172,7 +201,8 @@ class Node(BaseModel):
             Filename in format: <mp>_<sqid>_<type>_<slug>.md
 
         """
-        return f'{self.mp.as_string}_{self.sqid.value}_{doc_type}_{self.slug}.md'
+        prefix, suffix = self._filename_parts()
+        return f'{prefix}{doc_type}{suffix}'
 
     def filenames(self) -> list[str]:
         """Get all filenames for this node.
@@ -181,7 +211,8 @@ class Node(BaseModel):
             List of filenames sorted alphabetically by document type
 
         """
-        return [self.filename(dt) for dt in sorted(self.document_types)]
+        prefix, suffix = self._filename_parts()
+        return [f'{prefix}{dt}{suffix}' for dt in sorted(self.document_types)]
 
     def validate_required_types(self) -> bool:
         """Ensure draft and notes types exist.
@@ -218,8 +249,8 @@ class Outline(BaseModel):
             Node if found, None otherwise
 
         """
-        sqid_str = sqid.value if isinstance(sqid, SQID) else sqid
-        return self.nodes.get(sqid_str)
+        # Test for str, not SQID: isinstance on a pydantic model class is comparatively slow
+        return self.nodes.get(sqid if isinstance(sqid, str) else sqid.value)
 
     def get_by_mp(self, mp: MaterializedPath | str) -> Node | None:
         """Retrieve node by materialized path.
@@ -244,7 +275,8 @@ class Outline(BaseModel):
             List of nodes sorted lexicographically by materialized path
 
         """
-        return sorted(self.nodes.values(), key=lambda n: n.mp.as_string)
+        # Segment tuples order like the zero-padded strings, without formatting
+        return sorted(self.nodes.values(), key=lambda n: n.mp.segments)
 
     def root_nodes(self) -> list[Node]:
         """Get root-level nodes (depth 1).
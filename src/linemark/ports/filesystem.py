@@ -92,6 +92,24 @@ class FileSystemPort(Protocol):
         """
         ...
 
+    async def rename_files(self, pairs: list[tuple[Path, Path]]) -> None:
+        """Rename several files in order, as rename_file would one at a time.
+
+        Args:
+            pairs: (old_path, new_path) tuples, applied in sequence
+
+        Raises:
+            FileNotFoundError: If an old_path does not exist
+            FileExistsError: If a new_path already exists
+            PermissionError: If rename not permitted
+            OSError: For other filesystem errors
+
+        Note:
+            Renames before a failing pair stay applied; the batch is not transactional.
+
+        """
+        ...
+
     async def list_markdown_files(self, directory: Path) -> list[Path]:
         """List all .md files in directory (non-recursive).
 
@@ -7,11 +7,11 @@ line-by-line matching, and result ordering.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 
 from pydantic import BaseModel, ConfigDict
+from pydantic_core import to_json
 
 if TYPE_CHECKING:
     import re
@@ -54,10 +54,17 @@ class SearchResult(BaseModel):
             JSON string with sqid, filename, line_number, content, path
 
         """
-        data = self.model_dump()
-        # Convert Path to string for JSON serialization
-        data['path'] = str(data['path'])
-        return json.dumps(data)
+        # Serialized by pydantic-core directly, without an intermediate dict
+        return self.model_dump_json()
+
+    def format_json_bytes(self) -> bytes:
+        """Format a search result as UTF-8 encoded JSON.
+
+        Returns:
+            The same JSON as format_json, encoded, for writing to a binary stream
+
+        """
+        return to_json(self)
 
 
 class SearchPort(Protocol):
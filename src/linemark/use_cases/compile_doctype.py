@@ -7,25 +7,18 @@ from a forest or subtree into a single concatenated document.
 from __future__ import annotations
 
 import codecs
-import re
 from typing import TYPE_CHECKING
 
-from linemark.domain.entities import SQID, MaterializedPath, Node
 from linemark.domain.exceptions import DoctypeNotFoundError, NodeNotFoundError
+from linemark.use_cases.list_outline import DEFAULT_READ_CONCURRENCY, iter_files, load_nodes
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from pathlib import Path
 
+    from linemark.domain.entities import Node
     from linemark.ports.filesystem import FileSystemPort
 
-# Filename pattern per FR-030: <mp>_<sqid>_<type>_<slug>.md
-FILENAME_PATTERN = re.compile(
-    r'^(?P<mp>\d{3}(?:-\d{3})*)_'
-    r'(?P<sqid>[A-Za-z0-9]+)_'
-    r'(?P<type>[a-z]+)'
-    r'(?:_(?P<slug>.+))?\.md$',
-)
-
 
 class CompileDoctypeUseCase:
     """Use case for compiling doctype files into a single document.
@@ -43,82 +36,6 @@ class CompileDoctypeUseCase:
         """
         self.filesystem = filesystem
 
-    def _extract_title_from_frontmatter(self, content: str) -> str:
-        """Extract title from YAML frontmatter.
-
-        Args:
-            content: File content with YAML frontmatter
-
-        Returns:
-            Title string from frontmatter, or 'Untitled' if not found
-
-        """
-        if not content.startswith('---\n'):
-            return 'Untitled'  # pragma: no cover
-
-        parts = content.split('---\n', 2)
-        if len(parts) < 3:
-            return 'Untitled'  # pragma: no cover
-
-        frontmatter = parts[1]
-        for line in frontmatter.split('\n'):
-            if line.startswith('title:'):  # pragma: no branch
-                return line.split('title:', 1)[1].strip()
-
-        return 'Untitled'  # pragma: no cover
-
-    async def _list_nodes(self, directory: Path) -> list[Node]:
-        """List all nodes in the forest.
-
-        Args:
-            directory: Working directory containing the forest
-
-        Returns:
-            List of nodes sorted by materialized path
-
-        """
-        nodes_by_sqid: dict[str, Node] = {}
-
-        # List all markdown files
-        md_files = await self.filesystem.list_markdown_files(directory)
-
-        # Parse each file
-        for file_path in md_files:
-            match = FILENAME_PATTERN.match(file_path.name)
-            if not match:
-                continue  # pragma: no cover
-
-            mp_str = match.group('mp')
-            sqid_str = match.group('sqid')
-            doc_type = match.group('type')
-            slug = match.group('slug') or ''
-
-            # Get or create node for this SQID
-            if sqid_str not in nodes_by_sqid:
-                # For compilation, we need title from draft file
-                if doc_type == 'draft':
-                    content = await self.filesystem.read_file(file_path)
-                    title = self._extract_title_from_frontmatter(content)
-                else:
-                    # Skip non-draft files if node doesn't exist yet
-                    continue
-
-                # Create new node
-                node = Node(
-                    sqid=SQID(value=sqid_str),
-                    mp=MaterializedPath.from_string(mp_str),
-                    title=title,
-                    slug=slug or 'untitled',
-                    document_types=set(),
-                )
-                nodes_by_sqid[sqid_str] = node
-
-            # Add document type
-            nodes_by_sqid[sqid_str].document_types.add(doc_type)
-
-        # Return nodes sorted by materialized path
-        return sorted(nodes_by_sqid.values(), key=lambda n: n.mp.as_string)
-
     def _filter_subtree(self, nodes: list[Node], sqid: str) -> list[Node]:
         """Filter nodes to only include subtree rooted at given SQID.
 
@@ -202,22 +119,6 @@ class CompileDoctypeUseCase:
         # No frontmatter - check content directly
         return content.isspace()  # pragma: no cover
 
-    def _get_doctype_filepath(self, directory: Path, node: Node, doctype: str) -> Path:
-        """Build filepath for a node's doctype file.
-
-        Args:
-            directory: Working directory
-            node: Node to get file for
-            doctype: Doctype name
-
-        Returns:
-            Path to the doctype file
-
-        """
-        # Pattern: <mp>_<sqid>_<type>_<slug>.md
-        filename = f'{node.mp.as_string}_{node.sqid.value}_{doctype}_{node.slug}.md'
-        return directory / filename
-
     def _process_separator(self, separator: str) -> str:
         r"""Process separator to interpret escape sequences.
 
@@ -241,6 +142,7 @@ class CompileDoctypeUseCase:
         directory: Path,
         sqid: str | None = None,
         separator: str = '\n\n---\n\n',
+        concurrency: int = DEFAULT_READ_CONCURRENCY,
     ) -> str:
         """Compile all doctype files into single output.
 
@@ -249,6 +151,7 @@ class CompileDoctypeUseCase:
             directory: Working directory containing the forest
             sqid: Optional SQID to limit to subtree (None = entire forest)
             separator: Separator between documents (escape sequences interpreted)
+            concurrency: Maximum number of files read at the same time
 
         Returns:
             Compiled content as string (empty string if no content found)
@@ -258,9 +161,43 @@ class CompileDoctypeUseCase:
             NodeNotFoundError: If sqid provided but node doesn't exist
             FileSystemError: If file system operations fail
 
+        """
+        pieces = self.iter_compiled(
+            doctype=doctype, directory=directory, sqid=sqid, separator=separator, concurrency=concurrency
+        )
+        return ''.join([piece async for piece in pieces])
+
+    async def iter_compiled(
+        self,
+        doctype: str,
+        directory: Path,
+        sqid: str | None = None,
+        separator: str = '\n\n---\n\n',
+        concurrency: int = DEFAULT_READ_CONCURRENCY,
+    ) -> AsyncIterator[str]:
+        """Compile all doctype files, yielding documents and separators as they are read.
+
+        At most concurrency files are read at once, so output can start before
+        later files are read and only that many are held at a time.
+
+        Args:
+            doctype: Name of doctype to compile (e.g., 'draft', 'notes')
+            directory: Working directory containing the forest
+            sqid: Optional SQID to limit to subtree (None = entire forest)
+            separator: Separator between documents (escape sequences interpreted)
+            concurrency: Maximum number of files read at the same time
+
+        Yields:
+            Document contents in outline order, with separators between them
+
+        Raises:
+            DoctypeNotFoundError: If doctype doesn't exist in compilation scope
+            NodeNotFoundError: If sqid provided but node doesn't exist
+            FileSystemError: If file system operations fail
+
         """
         # 1. Get all nodes
-        all_nodes = await self._list_nodes(directory)
+        all_nodes = await load_nodes(self.filesystem, directory, concurrency)
 
         # 2. Filter to subtree if SQID provided
         nodes = self._filter_subtree(all_nodes, sqid) if sqid is not None else all_nodes
@@ -271,33 +208,16 @@ class CompileDoctypeUseCase:
         # 4. Process separator (interpret escape sequences)
         processed_separator = self._process_separator(separator)
 
-        # 5. Collect content from matching nodes
-        contents: list[str] = []
-
-        for node in nodes:
-            # Check if node has this doctype
-            if doctype not in node.document_types:
-                continue  # pragma: no cover
-
-            # Get filepath for this doctype
-            filepath = self._get_doctype_filepath(directory, node, doctype)
-
-            # Read file content
-            try:
-                content = await self.filesystem.read_file(filepath)
-            except FileNotFoundError:  # pragma: no cover
-                # File doesn't exist - skip # pragma: no cover
-                continue  # pragma: no cover
-
-            # Skip if empty or whitespace-only
-            if self._is_empty_content(content):
+        # 5. Read the matching nodes' files with bounded concurrency, keeping outline order
+        filepaths = [directory / node.filename(doctype) for node in nodes if doctype in node.document_types]
+        emitted = False
+        async for content in iter_files(self.filesystem, filepaths, concurrency):
+            # Skip missing files and empty or whitespace-only content
+            if content is None or self._is_empty_content(content):
                 continue
 
-            # Add to collection
-            contents.append(content)
-
-        # 6. Concatenate with separator
-        if not contents:
-            return ''
-
-        return processed_separator.join(contents)
+            # 6. Separate each document from the one before it
+            if emitted:
+                yield processed_separator
+            emitted = True
+            yield content
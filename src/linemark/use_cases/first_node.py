@@ -0,0 +1,55 @@
+"""Find first node use case."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from linemark.use_cases.list_outline import FILENAME_PATTERN
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from linemark.ports.filesystem import FileSystemPort
+
+
+class FirstNodeUseCase:
+    """Use case for finding the first node in outline order.
+
+    Works from filenames alone, so unlike listing the outline it reads no
+    files to pull titles out of frontmatter.
+    """
+
+    def __init__(self, filesystem: FileSystemPort) -> None:
+        """Initialize the use case.
+
+        Args:
+            filesystem: Filesystem port for listing files
+
+        """
+        self.filesystem = filesystem
+
+    async def execute(self, directory: Path) -> str | None:
+        """Execute the find first node use case.
+
+        Args:
+            directory: Working directory containing outline files
+
+        Returns:
+            SQID of the first node by materialized path, or None if the outline is empty
+
+        """
+        first_mp: str | None = None
+        first_sqid: str | None = None
+
+        for file_path in await self.filesystem.list_markdown_files(directory):
+            match = FILENAME_PATTERN.match(file_path.name)
+            # A node exists where its draft file does, as when listing the outline
+            if match is None or match['type'] != 'draft':
+                continue
+
+            # Zero-padded segments make string order match outline order
+            mp_str = match['mp']
+            if first_mp is None or mp_str < first_mp:
+                first_mp, first_sqid = mp_str, match['sqid']
+
+        return first_sqid
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import re
+from collections import deque
 from typing import TYPE_CHECKING
 
 from linemark.domain.entities import SQID, MaterializedPath, Node
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
     from pathlib import Path
 
     from linemark.ports.filesystem import FileSystemPort
@@ -20,6 +24,139 @@ FILENAME_PATTERN = re.compile(
     r'(?:_(?P<slug>.+))?\.md$',
 )
 
+# Files read at once; bounded so large outlines don't open every file together
+DEFAULT_READ_CONCURRENCY = 16
+
+
+def _extract_title_from_frontmatter(content: str) -> str:
+    """Extract title from YAML frontmatter.
+
+    Args:
+        content: File content with YAML frontmatter
+
+    Returns:
+        Title string from frontmatter, or 'Untitled' if not found
+
+    """
+    if not content.startswith('---\n'):  # pragma: no cover
+        return 'Untitled'
+
+    parts = content.split('---\n', 2)
+    if len(parts) < 3:  # pragma: no cover
+        return 'Untitled'
+
+    frontmatter = parts[1]
+    for line in frontmatter.split('\n'):
+        if line.startswith('title:'):  # pragma: no branch
+            return line.split('title:', 1)[1].strip()
+
+    return 'Untitled'  # pragma: no cover
+
+
+async def iter_files(
+    filesystem: FileSystemPort, filepaths: list[Path], concurrency: int = DEFAULT_READ_CONCURRENCY
+) -> AsyncGenerator[str | None]:
+    """Read files concurrently, yielding their contents in order.
+
+    A sliding window keeps at most concurrency reads in flight: each time the
+    oldest read is yielded, the next file's read starts.
+
+    Args:
+        filesystem: Filesystem port to read through
+        filepaths: Files to read
+        concurrency: Maximum number of reads in flight
+
+    Yields:
+        File contents in the order of filepaths, None where a file doesn't exist
+
+    """
+
+    async def read(filepath: Path) -> str | None:
+        try:
+            return await filesystem.read_file(filepath)
+        except FileNotFoundError:
+            # File vanished after listing - skip
+            return None
+
+    remaining = iter(filepaths)
+    pending = deque(asyncio.create_task(read(filepath)) for filepath in itertools.islice(remaining, concurrency))
+    try:
+        while pending:
+            content = await pending.popleft()
+            for filepath in itertools.islice(remaining, 1):
+                pending.append(asyncio.create_task(read(filepath)))
+            yield content
+    finally:
+        # Don't leave reads running if the caller stops early or a read fails, and
+        # wait for the cancelled ones so none outlive the generator
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def load_nodes(
+    filesystem: FileSystemPort, directory: Path, concurrency: int = DEFAULT_READ_CONCURRENCY
+) -> list[Node]:
+    """Load every node in the outline from its files.
+
+    Filenames are parsed to find each node's draft and document types, then
+    the drafts are read concurrently for their titles.
+
+    Args:
+        filesystem: Filesystem port to read through
+        directory: Working directory containing outline files
+        concurrency: Maximum number of draft files read at the same time
+
+    Returns:
+        Nodes sorted by materialized path
+
+    """
+    drafts: dict[str, tuple[str, str, Path]] = {}
+    document_types: dict[str, set[str]] = {}
+
+    # List all markdown files
+    md_files = await filesystem.list_markdown_files(directory)
+
+    # Parse each file
+    for file_path in md_files:
+        match = FILENAME_PATTERN.match(file_path.name)
+        if not match:
+            continue
+
+        # One groups() call unpacks mp, sqid, type and slug in pattern order
+        mp_str, sqid_str, doc_type, slug = match.groups('')
+
+        # Register a node for this SQID at its draft file
+        if sqid_str not in document_types:
+            if doc_type != 'draft':
+                # Skip non-draft files if node doesn't exist yet
+                continue
+            drafts[sqid_str] = (mp_str, slug, file_path)
+            document_types[sqid_str] = set()
+
+        # Add document type
+        document_types[sqid_str].add(doc_type)
+
+    # Read every draft, a bounded number of files at a time
+    contents = [
+        content
+        async for content in iter_files(filesystem, [file_path for _, _, file_path in drafts.values()], concurrency)
+    ]
+
+    # A draft deleted since the listing has no node left to load
+    nodes = [
+        Node(
+            sqid=SQID(value=sqid_str),
+            mp=MaterializedPath.from_string(mp_str),
+            title=_extract_title_from_frontmatter(content),
+            slug=slug,
+            document_types=document_types[sqid_str],
+        )
+        for (sqid_str, (mp_str, slug, _)), content in zip(drafts.items(), contents, strict=True)
+        if content is not None
+    ]
+    return sorted(nodes, key=lambda n: n.mp.segments)
+
 
 class ListOutlineUseCase:
     """Use case for listing all nodes in the outline.
@@ -36,30 +173,6 @@ class ListOutlineUseCase:
         """
         self.filesystem = filesystem
 
-    def _extract_title_from_frontmatter(self, content: str) -> str:
-        """Extract title from YAML frontmatter.
-
-        Args:
-            content: File content with YAML frontmatter
-
-        Returns:
-            Title string from frontmatter, or 'Untitled' if not found
-
-        """
-        if not content.startswith('---\n'):  # pragma: no cover
-            return 'Untitled'
-
-        parts = content.split('---\n', 2)
-        if len(parts) < 3:  # pragma: no cover
-            return 'Untitled'
-
-        frontmatter = parts[1]
-        for line in frontmatter.split('\n'):
-            if line.startswith('title:'):  # pragma: no branch
-                return line.split('title:', 1)[1].strip()
-
-        return 'Untitled'  # pragma: no cover
-
     async def execute(self, directory: Path, root_sqid: str | None = None) -> list[Node]:
         """Execute the list outline use case.
 
@@ -74,47 +187,8 @@ class ListOutlineUseCase:
             ValueError: If root_sqid is invalid or not found
 
         """
-        nodes_by_sqid: dict[str, Node] = {}
-
-        # List all markdown files
-        md_files = await self.filesystem.list_markdown_files(directory)
-
-        # Parse each file
-        for file_path in md_files:
-            match = FILENAME_PATTERN.match(file_path.name)
-            if not match:
-                continue
-
-            mp_str = match.group('mp')
-            sqid_str = match.group('sqid')
-            doc_type = match.group('type')
-            slug = match.group('slug') or ''
-
-            # Get or create node for this SQID
-            if sqid_str not in nodes_by_sqid:
-                # Read title from draft file
-                if doc_type == 'draft':
-                    content = await self.filesystem.read_file(file_path)
-                    title = self._extract_title_from_frontmatter(content)
-                else:  # pragma: no cover
-                    # Skip non-draft files if node doesn't exist yet
-                    continue
-
-                # Create new node
-                node = Node(
-                    sqid=SQID(value=sqid_str),
-                    mp=MaterializedPath.from_string(mp_str),
-                    title=title,
-                    slug=slug,
-                    document_types=set(),
-                )
-                nodes_by_sqid[sqid_str] = node
-
-            # Add document type
-            nodes_by_sqid[sqid_str].document_types.add(doc_type)
-
         # Get all nodes sorted by materialized path
-        all_nodes = sorted(nodes_by_sqid.values(), key=lambda n: n.mp.as_string)
+        all_nodes = await load_nodes(self.filesystem, directory)
 
         # Filter to subtree if requested
         if root_sqid:
@@ -156,7 +156,8 @@ class MoveNodeUseCase:
             n for n in outline.nodes.values() if n.sqid.value == sqid or self._is_descendant_of(n, new_mp)
         ]
 
-        # Rename files for all affected nodes
+        # Collect renames for all affected nodes, then apply them as one batch
+        renames: list[tuple[Path, Path]] = []
         for affected_node in affected_nodes:
             # Determine what the old MP was for this node
             if affected_node.sqid.value == sqid:
@@ -170,11 +171,9 @@ class MoveNodeUseCase:
                 old_filename = f'{node_old_mp.as_string}_{affected_node.sqid.value}_{doc_type}_{affected_node.slug}.md'
                 new_filename = affected_node.filename(doc_type)
 
-                old_path = directory / old_filename
-                new_path = directory / new_filename
+                renames.append((directory / old_filename, directory / new_filename))
 
-                # Rename file
-                await self.filesystem.rename_file(old_path, new_path)
+        await self.filesystem.rename_files(renames)
 
     def _is_descendant_of(self, node: Node, ancestor_mp: MaterializedPath) -> bool:
         """Check if node is a descendant of the given materialized path.
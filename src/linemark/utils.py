@@ -1,7 +1,7 @@
 """Utility functions for Linemark"""
 
 from collections.abc import Iterable
-from typing import TypeVar
+from typing import TypeVar, overload
 
 T = TypeVar('T')
 
@@ -20,3 +20,26 @@ def first[T](iterable: Iterable[T]) -> T | None:
         return next(iter(iterable))
     except StopIteration:
         return None
+
+
+@overload
+def strip_at(sqid: str) -> str: ...
+
+
+@overload
+def strip_at(sqid: str | None) -> str | None: ...
+
+
+def strip_at(sqid: str | None) -> str | None:
+    """Remove a single leading ``@`` from a SQID reference.
+
+    Args:
+        sqid: The SQID as typed by the user (e.g. ``@A3F7c``), or None.
+
+    Returns:
+        The SQID without its ``@`` prefix; None and unprefixed values are returned unchanged.
+
+    """
+    if sqid and sqid[0] == '@':
+        return sqid[1:]
+    return sqid
@@ -43,11 +43,12 @@ except ImportError:
     pass
 
 
-def invoke_asyncclick_command(args: list[str], stdin_content: str | None = None) -> tuple[int, str, str]:
-    """Invoke an asyncclick command synchronously for testing.
+def invoke_cli_command(args: list[str], stdin_content: str | None = None) -> tuple[int, str, str]:
+    """Invoke a CLI command in-process for testing.
 
-    This helper properly runs asyncclick commands in tests by setting sys.argv
-    and running the event loop to completion, capturing stdout and stderr.
+    This helper runs the lmk command group by setting sys.argv and calling it
+    directly (each async command runs its own event loop), capturing stdout
+    and stderr.
 
     Args:
         args: Command-line arguments including the program name
@@ -57,13 +58,12 @@ def invoke_asyncclick_command(args: list[str], stdin_content: str | None = None)
         Tuple of (exit_code, stdout, stderr)
 
     Example:
-        exit_code, stdout, stderr = invoke_asyncclick_command(['lmk', '--directory', '/tmp', 'add', 'Test'])
-        exit_code, stdout, stderr = invoke_asyncclick_command(['lmk', 'types', 'write', 'draft', '@ABC'], stdin_content='content')
+        exit_code, stdout, stderr = invoke_cli_command(['lmk', '--directory', '/tmp', 'add', 'Test'])
+        exit_code, stdout, stderr = invoke_cli_command(['lmk', 'types', 'write', 'draft', '@ABC'], stdin_content='content')
 
     """
-    import asyncio
     import sys
-    from io import StringIO
+    from io import BytesIO, StringIO, TextIOWrapper
 
     from linemark.cli.main import lmk
 
@@ -73,10 +73,13 @@ def invoke_asyncclick_command(args: list[str], stdin_content: str | None = None)
     original_stderr = sys.stderr
     original_stdin = sys.stdin
 
-    stdout_capture = StringIO()
+    # stdout gets a real binary buffer underneath, as commands may write bytes to it
+    stdout_capture = TextIOWrapper(BytesIO(), encoding='utf-8', newline='\n')
     stderr_capture = StringIO()
-    stdin_input = StringIO(stdin_content) if stdin_content is not None else None
-    exit_code = [0]  # Use list to allow mutation in nested function
+    stdin_input = (
+        TextIOWrapper(BytesIO(stdin_content.encode('utf-8')), encoding='utf-8') if stdin_content is not None else None
+    )
+    exit_code = 0
 
     try:
         sys.argv = args
@@ -85,23 +88,62 @@ def invoke_asyncclick_command(args: list[str], stdin_content: str | None = None)
         if stdin_input is not None:
             sys.stdin = stdin_input
 
-        async def run_command() -> int:
-            result = lmk.main(standalone_mode=False, prog_name=args[0])
-            if asyncio.iscoroutine(result):
-                code = await result
-            else:
-                code = result
-            return code if isinstance(code, int) else 0
-
-        # Run the async command
+        # Run the command
         try:
-            exit_code[0] = asyncio.run(run_command())
+            code = lmk.main(standalone_mode=False, prog_name=args[0])
+            exit_code = code if isinstance(code, int) else 0
         except SystemExit as e:
-            exit_code[0] = e.code if isinstance(e.code, int) else 0
+            exit_code = e.code if isinstance(e.code, int) else 0
     finally:
         sys.argv = original_argv
         sys.stdout = original_stdout
         sys.stderr = original_stderr
         sys.stdin = original_stdin
 
-    return exit_code[0], stdout_capture.getvalue(), stderr_capture.getvalue()
+    stdout_capture.flush()
+    stdout = stdout_capture.buffer.getvalue().decode('utf-8')
+    return exit_code, stdout, stderr_capture.getvalue()
+
+
+class FakeFileSystem:
+    """In-memory fake of FileSystemPort shared by the use case unit tests."""
+
+    def __init__(self) -> None:
+        self.files: dict[str, str] = {}
+        self.directories: set[str] = set()
+
+    async def read_file(self, path: Path) -> str:
+        """Read file from in-memory storage, or an empty string if it is missing."""
+        return self.files.get(str(path), '')
+
+    async def write_file(self, path: Path, content: str) -> None:
+        """Write file to in-memory storage."""
+        self.files[str(path)] = content
+
+    async def delete_file(self, path: Path) -> None:
+        """Delete file from in-memory storage."""
+        if str(path) in self.files:
+            del self.files[str(path)]
+
+    async def rename_file(self, old_path: Path, new_path: Path) -> None:
+        """Rename file in in-memory storage."""
+        if str(old_path) in self.files:
+            self.files[str(new_path)] = self.files[str(old_path)]
+            del self.files[str(old_path)]
+
+    async def rename_files(self, pairs: list[tuple[Path, Path]]) -> None:
+        """Rename files in in-memory storage."""
+        for old_path, new_path in pairs:
+            await self.rename_file(old_path, new_path)
+
+    async def list_markdown_files(self, directory: Path) -> list[Path]:
+        """List markdown files in directory."""
+        return [Path(path) for path in self.files if path.endswith('.md') and path.startswith(str(directory))]
+
+    async def file_exists(self, path: Path) -> bool:
+        """Check if file exists in in-memory storage."""
+        return str(path) in self.files
+
+    async def create_directory(self, directory: Path) -> None:
+        """Create directory in in-memory storage."""
+        self.directories.add(str(directory))
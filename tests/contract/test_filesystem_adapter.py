@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import os
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
 import pytest
 
-from linemark.adapters.filesystem import FileSystemAdapter
+from linemark.adapters import filesystem
+from linemark.adapters.filesystem import ConstitutionFileAdapter, FileSystemAdapter
 from tests.contract.test_filesystem_port import TestFileSystemPortContract
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 @pytest.fixture
 def filesystem_port() -> FileSystemAdapter:
@@ -20,4 +28,118 @@ class TestFileSystemAdapter(TestFileSystemPortContract):
     # Enable test collection for this subclass
     __test__ = True
 
-    # All tests inherited from TestFileSystemPortContract
+    # Contract tests inherited from TestFileSystemPortContract
+
+    @pytest.mark.asyncio
+    async def test_rename_into_missing_directory_raises_error(
+        self, filesystem_port: FileSystemAdapter, tmp_path: Path
+    ) -> None:
+        """Renaming into a nonexistent directory raises FileNotFoundError and keeps the source."""
+        old_path = tmp_path / 'old.md'
+        await filesystem_port.write_file(old_path, 'content')
+
+        with pytest.raises(FileNotFoundError):
+            await filesystem_port.rename_file(old_path, tmp_path / 'missing' / 'new.md')
+
+        assert await filesystem_port.file_exists(old_path)
+
+    @pytest.mark.asyncio
+    async def test_rename_files_across_directories(self, filesystem_port: FileSystemAdapter, tmp_path: Path) -> None:
+        """A batch spanning directories falls back to renaming each pair by full path."""
+        await filesystem_port.write_file(tmp_path / 'a' / 'old.md', 'content')
+        await filesystem_port.create_directory(tmp_path / 'b')
+
+        await filesystem_port.rename_files([(tmp_path / 'a' / 'old.md', tmp_path / 'b' / 'new.md')])
+
+        assert await filesystem_port.read_file(tmp_path / 'b' / 'new.md') == 'content'
+        assert not await filesystem_port.file_exists(tmp_path / 'a' / 'old.md')
+
+    @pytest.mark.asyncio
+    async def test_write_file_bounds_known_directory_cache(
+        self, filesystem_port: FileSystemAdapter, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The cache of ensured parent directories evicts least recently used entries."""
+        monkeypatch.setattr(filesystem, '_KNOWN_DIRS_SIZE', 2)
+        monkeypatch.setattr(filesystem, '_known_dirs', OrderedDict())
+
+        for name in ('a', 'b', 'a', 'c'):
+            await filesystem_port.write_file(tmp_path / name / 'test.md', name)
+
+        assert list(filesystem._known_dirs) == [tmp_path / 'a', tmp_path / 'c']
+
+
+class TestConstitutionFileAdapter:
+    """Test ConstitutionFileAdapter's upward search for constitution.md."""
+
+    @pytest.mark.asyncio
+    async def test_finds_start_path_that_is_the_constitution(self, tmp_path: Path) -> None:
+        """A start path naming a readable constitution.md is used directly."""
+        adapter = ConstitutionFileAdapter()
+        constitution_file = await adapter.write_constitution(tmp_path, 'Rules\n')
+
+        assert await adapter.find_constitution_file(constitution_file) == (constitution_file, True)
+
+    @pytest.mark.asyncio
+    async def test_finds_constitution_in_ancestor(self, tmp_path: Path) -> None:
+        """The nearest ancestor's constitution.md is found and read."""
+        adapter = ConstitutionFileAdapter()
+        await adapter.write_constitution(tmp_path, 'Rules\n')
+        nested = tmp_path / 'a' / 'b'
+        await adapter.file_adapter.create_directory(nested)
+
+        assert await adapter.find_constitution_file(nested) == (tmp_path / 'constitution.md', True)
+        assert await adapter.read_constitution(nested) == 'Rules\n'
+
+    @pytest.mark.asyncio
+    async def test_missing_constitution_points_at_start_path(self, tmp_path: Path) -> None:
+        """Without a constitution, the start path is where one would be written."""
+        adapter = ConstitutionFileAdapter()
+
+        assert await adapter.find_constitution_file(tmp_path) == (tmp_path / 'constitution.md', False)
+        with pytest.raises(FileNotFoundError, match='Constitution file not found'):
+            await adapter.read_constitution(tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_sees_constitution_created_in_ancestor_after_lookup(self, tmp_path: Path) -> None:
+        """A constitution.md created in an ancestor after a lookup is found on the next one."""
+        adapter = ConstitutionFileAdapter()
+        nested = tmp_path / 'a'
+        await adapter.file_adapter.create_directory(nested)
+        assert await adapter.find_constitution_file(nested) == (nested / 'constitution.md', False)
+
+        await adapter.file_adapter.write_file(tmp_path / 'constitution.md', 'Rules\n')
+
+        assert await adapter.find_constitution_file(nested) == (tmp_path / 'constitution.md', True)
+
+    @pytest.mark.asyncio
+    async def test_skips_constitution_that_is_not_a_file(self, tmp_path: Path) -> None:
+        """A directory named constitution.md is not treated as the constitution."""
+        adapter = ConstitutionFileAdapter()
+        await adapter.file_adapter.create_directory(tmp_path / 'constitution.md')
+
+        assert await adapter.find_constitution_file(tmp_path / 'constitution.md') == (
+            tmp_path / 'constitution.md' / 'constitution.md',
+            False,
+        )
+
+    @pytest.mark.asyncio
+    async def test_stops_below_ancestor_that_is_not_writable(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The search never climbs past a directory the user can't write to."""
+        adapter = ConstitutionFileAdapter()
+        await adapter.write_constitution(tmp_path, 'Outside rules\n')
+        locked = tmp_path / 'locked'
+        nested = locked / 'project'
+        await adapter.file_adapter.create_directory(nested)
+
+        # Permission bits don't bind when tests run as root, so deny write access to locked directly
+        access = os.access
+
+        def fake_access(path: Path, mode: int) -> bool:
+            return not (path == locked and mode & os.W_OK) and access(path, mode)
+
+        monkeypatch.setattr(os, 'access', fake_access)
+
+        assert await adapter.find_constitution_file(nested) == (nested / 'constitution.md', False)
+        assert await adapter.find_constitution_file(locked) == (tmp_path / 'constitution.md', True)
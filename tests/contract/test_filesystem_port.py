@@ -56,6 +56,20 @@ class TestFileSystemPortContract:
         assert filepath.exists()
         assert await filesystem_port.read_file(filepath) == content
 
+    @pytest.mark.asyncio
+    async def test_write_file_recreates_removed_parent_directory(
+        self, filesystem_port: FileSystemPort, tmp_path: Path
+    ) -> None:
+        """Writing a file recreates a parent directory removed after an earlier write."""
+        filepath = tmp_path / 'parent' / 'test.md'
+        await filesystem_port.write_file(filepath, 'first')
+        filepath.unlink()
+        filepath.parent.rmdir()
+
+        await filesystem_port.write_file(filepath, 'second')
+
+        assert await filesystem_port.read_file(filepath) == 'second'
+
     @pytest.mark.asyncio
     async def test_delete_existing_file(self, filesystem_port: FileSystemPort, tmp_path: Path) -> None:
         """Delete an existing file."""
@@ -109,6 +123,43 @@ class TestFileSystemPortContract:
         with pytest.raises(FileExistsError):
             await filesystem_port.rename_file(old_path, new_path)
 
+    @pytest.mark.asyncio
+    async def test_rename_files_applies_every_pair(self, filesystem_port: FileSystemPort, tmp_path: Path) -> None:
+        """Rename a batch of files, including a chain that frees each target first."""
+        await filesystem_port.write_file(tmp_path / 'a.md', 'a')
+        await filesystem_port.write_file(tmp_path / 'b.md', 'b')
+
+        await filesystem_port.rename_files([
+            (tmp_path / 'b.md', tmp_path / 'c.md'),
+            (tmp_path / 'a.md', tmp_path / 'b.md'),
+        ])
+
+        assert not await filesystem_port.file_exists(tmp_path / 'a.md')
+        assert await filesystem_port.read_file(tmp_path / 'b.md') == 'a'
+        assert await filesystem_port.read_file(tmp_path / 'c.md') == 'b'
+
+    @pytest.mark.asyncio
+    async def test_rename_files_nonexistent_file_raises_error(
+        self, filesystem_port: FileSystemPort, tmp_path: Path
+    ) -> None:
+        """Renaming a nonexistent file in a batch raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            await filesystem_port.rename_files([(tmp_path / 'nonexistent.md', tmp_path / 'new.md')])
+
+    @pytest.mark.asyncio
+    async def test_rename_files_to_existing_file_raises_error(
+        self, filesystem_port: FileSystemPort, tmp_path: Path
+    ) -> None:
+        """Renaming onto an existing file in a batch raises FileExistsError and keeps both files."""
+        await filesystem_port.write_file(tmp_path / 'old.md', 'old content')
+        await filesystem_port.write_file(tmp_path / 'existing.md', 'existing content')
+
+        with pytest.raises(FileExistsError):
+            await filesystem_port.rename_files([(tmp_path / 'old.md', tmp_path / 'existing.md')])
+
+        assert await filesystem_port.read_file(tmp_path / 'old.md') == 'old content'
+        assert await filesystem_port.read_file(tmp_path / 'existing.md') == 'existing content'
+
     @pytest.mark.asyncio
     async def test_list_markdown_files(self, filesystem_port: FileSystemPort, tmp_path: Path) -> None:
         """List all .md files in directory."""
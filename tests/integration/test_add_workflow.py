@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
-from tests.conftest import invoke_asyncclick_command
+from tests.conftest import invoke_cli_command
 
 
 def test_add_command_creates_root_node(tmp_path: Path) -> None:
@@ -15,7 +16,7 @@ def test_add_command_creates_root_node(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Run add command with explicit directory
-        exit_code, stdout, _stderr = invoke_asyncclick_command([
+        exit_code, stdout, _stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -52,7 +53,7 @@ def test_add_and_list_workflow(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add first node
-        exit_code1, _stdout1, _ = invoke_asyncclick_command([
+        exit_code1, _stdout1, _ = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -62,7 +63,7 @@ def test_add_and_list_workflow(tmp_path: Path) -> None:
         assert exit_code1 == 0
 
         # Add second node
-        exit_code2, _stdout2, _ = invoke_asyncclick_command([
+        exit_code2, _stdout2, _ = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -72,7 +73,7 @@ def test_add_and_list_workflow(tmp_path: Path) -> None:
         assert exit_code2 == 0
 
         # List nodes
-        exit_code3, stdout3, _ = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list'])
+        exit_code3, stdout3, _ = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list'])
         assert exit_code3 == 0
         assert 'Chapter One' in stdout3
         assert 'Chapter Two' in stdout3
@@ -84,7 +85,7 @@ def test_add_child_node_workflow(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add parent node
-        exit_code1, stdout1, _ = invoke_asyncclick_command([
+        exit_code1, stdout1, _ = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -99,7 +100,7 @@ def test_add_child_node_workflow(tmp_path: Path) -> None:
         sqid = sqid_line.split('@')[1].split(')')[0]
 
         # Add child node
-        exit_code2, stdout2, _ = invoke_asyncclick_command([
+        exit_code2, stdout2, _ = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -112,7 +113,7 @@ def test_add_child_node_workflow(tmp_path: Path) -> None:
         assert 'Section 1.1' in stdout2
 
         # List to verify hierarchy
-        exit_code3, stdout3, _ = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list'])
+        exit_code3, stdout3, _ = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list'])
         assert exit_code3 == 0
         assert 'Chapter One' in stdout3
         assert 'Section 1.1' in stdout3
@@ -126,11 +127,11 @@ def test_list_json_format(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add nodes
-        invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'add', 'Chapter One'])
-        invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'add', 'Chapter Two'])
+        invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'add', 'Chapter One'])
+        invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'add', 'Chapter Two'])
 
         # List as JSON
-        exit_code, stdout, _ = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list', '--json'])
+        exit_code, stdout, _ = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list', '--json'])
         assert exit_code == 0
 
         # Verify JSON structure
@@ -148,7 +149,7 @@ def test_add_with_special_characters(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add node with special characters
-        exit_code, _stdout, _ = invoke_asyncclick_command([
+        exit_code, _stdout, _ = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -169,11 +170,11 @@ def test_add_multiple_levels(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add root
-        _, stdout1, _ = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'add', 'Chapter One'])
+        _, stdout1, _ = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'add', 'Chapter One'])
         sqid1 = stdout1.split('@')[1].split(')')[0]
 
         # Add child
-        _, stdout2, _ = invoke_asyncclick_command([
+        _, stdout2, _ = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -185,7 +186,7 @@ def test_add_multiple_levels(tmp_path: Path) -> None:
         sqid2 = stdout2.split('@')[1].split(')')[0]
 
         # Add grandchild
-        exit_code3, _stdout3, _ = invoke_asyncclick_command([
+        exit_code3, _stdout3, _ = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -197,7 +198,7 @@ def test_add_multiple_levels(tmp_path: Path) -> None:
         assert exit_code3 == 0
 
         # Verify hierarchy in list
-        _, stdout4, _ = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list'])
+        _, stdout4, _ = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list'])
         assert 'Chapter One' in stdout4
         assert 'Section 1.1' in stdout4
         assert 'Subsection 1.1.1' in stdout4
@@ -208,6 +209,25 @@ def test_empty_directory_list(tmp_path: Path) -> None:
     runner = CliRunner()
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
-        exit_code, _stdout, stderr = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list'])
+        exit_code, _stdout, stderr = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list'])
         assert exit_code == 0
         assert 'No nodes found' in stderr
+
+
+@pytest.mark.asyncio
+async def test_commander_first_node_sqid_follows_outline_order(tmp_path: Path) -> None:
+    """Test first_node_sqid is None for an empty outline, else the lowest-path node's SQID."""
+    from linemark.commanders import LinemarkCommander
+
+    commander = LinemarkCommander(directory=tmp_path)
+    assert await commander.first_node_sqid() is None
+
+    first = await commander.add(title='Chapter One')
+    await commander.add(title='Section One', child_of=first.sqid.value)
+    assert await commander.first_node_sqid() == first.sqid.value
+
+    prologue = await commander.add(title='Prologue')
+    assert await commander.first_node_sqid() == first.sqid.value
+
+    await commander.move(sqid=prologue.sqid.value, target_mp='050')
+    assert await commander.first_node_sqid() == prologue.sqid.value
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 from click.testing import CliRunner
 
 from linemark.cli.main import main
-from tests.conftest import invoke_asyncclick_command
+from tests.conftest import invoke_cli_command
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -21,7 +21,7 @@ def test_compile_oserror_handling(tmp_path: Path) -> None:
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Try to compile from an existing directory but with a doctype that doesn't exist
         # This will trigger the DoctypeNotFoundError path which returns exit code 1
-        exit_code, _stdout, stderr = invoke_asyncclick_command([
+        exit_code, _stdout, stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -39,7 +39,7 @@ def test_add_invalid_title_error(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Try to add with empty/whitespace title should fail in slugifier
-        exit_code, _stdout, stderr = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'add', '   '])
+        exit_code, _stdout, stderr = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'add', '   '])
 
         assert exit_code == 1
         assert 'Error:' in stderr
@@ -50,7 +50,7 @@ def test_list_empty_directory_message(tmp_path: Path) -> None:
     runner = CliRunner()
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
-        exit_code, _stdout, stderr = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list'])
+        exit_code, _stdout, stderr = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list'])
 
         assert exit_code == 0
         assert 'No nodes found' in stderr
@@ -62,7 +62,7 @@ def test_doctor_with_repair_flag(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create a node first
-        exit_code1, _stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, _stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -72,7 +72,7 @@ def test_doctor_with_repair_flag(tmp_path: Path) -> None:
         assert exit_code1 == 0
 
         # Run doctor with repair on a valid outline (should pass)
-        exit_code2, stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -92,7 +92,7 @@ def test_types_list_no_types_error(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -108,7 +108,7 @@ def test_types_list_no_types_error(tmp_path: Path) -> None:
             Path(f).unlink()
 
         # List types should fail now
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -127,7 +127,7 @@ def test_types_add_invalid_type_error(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -138,7 +138,7 @@ def test_types_add_invalid_type_error(tmp_path: Path) -> None:
         sqid = stdout1.split('@')[1].split(')')[0]
 
         # Try to add a reserved type (draft or notes)
-        exit_code2, _stdout2, stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
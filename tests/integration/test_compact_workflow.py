@@ -6,7 +6,7 @@ from pathlib import Path
 
 from click.testing import CliRunner
 
-from tests.conftest import invoke_asyncclick_command
+from tests.conftest import invoke_cli_command
 
 
 def test_compact_root_level_with_irregular_spacing(tmp_path: Path) -> None:
@@ -15,7 +15,7 @@ def test_compact_root_level_with_irregular_spacing(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create 4 nodes with irregular spacing: 001, 003, 007, 099
-        exit_code1, _stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, _stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -24,7 +24,7 @@ def test_compact_root_level_with_irregular_spacing(tmp_path: Path) -> None:
         ])
         assert exit_code1 == 0
 
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -33,7 +33,7 @@ def test_compact_root_level_with_irregular_spacing(tmp_path: Path) -> None:
         ])
         assert exit_code2 == 0
 
-        exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -42,7 +42,7 @@ def test_compact_root_level_with_irregular_spacing(tmp_path: Path) -> None:
         ])
         assert exit_code3 == 0
 
-        exit_code4, _stdout4, _stderr4 = invoke_asyncclick_command([
+        exit_code4, _stdout4, _stderr4 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -52,7 +52,7 @@ def test_compact_root_level_with_irregular_spacing(tmp_path: Path) -> None:
         assert exit_code4 == 0
 
         # Compact root level
-        exit_code5, stdout5, _stderr5 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'compact'])
+        exit_code5, stdout5, _stderr5 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'compact'])
         assert exit_code5 == 0
         assert 'Compacted 4 root-level nodes' in stdout5
 
@@ -78,7 +78,7 @@ def test_compact_specific_subtree(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create parent
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -89,7 +89,7 @@ def test_compact_specific_subtree(tmp_path: Path) -> None:
         parent_sqid = stdout1.split('@')[1].split(')')[0]
 
         # Add 3 children
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -100,7 +100,7 @@ def test_compact_specific_subtree(tmp_path: Path) -> None:
         ])
         assert exit_code2 == 0
 
-        exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -111,7 +111,7 @@ def test_compact_specific_subtree(tmp_path: Path) -> None:
         ])
         assert exit_code3 == 0
 
-        exit_code4, _stdout4, _stderr4 = invoke_asyncclick_command([
+        exit_code4, _stdout4, _stderr4 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -123,7 +123,7 @@ def test_compact_specific_subtree(tmp_path: Path) -> None:
         assert exit_code4 == 0
 
         # Compact children of parent
-        exit_code5, stdout5, _stderr5 = invoke_asyncclick_command([
+        exit_code5, stdout5, _stderr5 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -150,7 +150,7 @@ def test_compact_preserves_hierarchy(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create parent with children
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -160,7 +160,7 @@ def test_compact_preserves_hierarchy(tmp_path: Path) -> None:
         assert exit_code1 == 0
         parent_sqid = stdout1.split('@')[1].split(')')[0]
 
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -172,7 +172,7 @@ def test_compact_preserves_hierarchy(tmp_path: Path) -> None:
         assert exit_code2 == 0
 
         # Add another root node
-        exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -182,11 +182,11 @@ def test_compact_preserves_hierarchy(tmp_path: Path) -> None:
         assert exit_code3 == 0
 
         # Compact root level
-        exit_code4, _stdout4, _stderr4 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'compact'])
+        exit_code4, _stdout4, _stderr4 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'compact'])
         assert exit_code4 == 0
 
         # Verify hierarchy intact via list
-        _exit_code5, stdout5, _stderr5 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list'])
+        _exit_code5, stdout5, _stderr5 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list'])
         assert 'Parent' in stdout5
         assert 'Child' in stdout5
         assert 'Root Two' in stdout5
@@ -199,7 +199,7 @@ def test_compact_with_many_siblings_uses_smaller_tier(tmp_path: Path) -> None:
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create 12 root nodes to trigger 10s tier
         for i in range(1, 13):
-            exit_code, _stdout, _stderr = invoke_asyncclick_command([
+            exit_code, _stdout, _stderr = invoke_cli_command([
                 'lmk',
                 '--directory',
                 str(isolated_dir),
@@ -209,7 +209,7 @@ def test_compact_with_many_siblings_uses_smaller_tier(tmp_path: Path) -> None:
             assert exit_code == 0
 
         # Compact root level
-        exit_code_compact, stdout_compact, _stderr_compact = invoke_asyncclick_command([
+        exit_code_compact, stdout_compact, _stderr_compact = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -234,7 +234,7 @@ def test_compact_preserves_content(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create nodes
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -244,7 +244,7 @@ def test_compact_preserves_content(tmp_path: Path) -> None:
         assert exit_code1 == 0
         sqid1 = stdout1.split('@')[1].split(')')[0]
 
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -264,7 +264,7 @@ def test_compact_preserves_content(tmp_path: Path) -> None:
         assert 'Chapter One' in original_content
 
         # Compact
-        exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'compact'])
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'compact'])
         assert exit_code3 == 0
 
         # Find renamed file and verify content
@@ -281,7 +281,7 @@ def test_compact_nonexistent_node_fails(tmp_path: Path) -> None:
     runner = CliRunner()
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
-        exit_code, stdout, stderr = invoke_asyncclick_command([
+        exit_code, stdout, stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -298,7 +298,7 @@ def test_compact_with_deep_hierarchy(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create parent
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -309,7 +309,7 @@ def test_compact_with_deep_hierarchy(tmp_path: Path) -> None:
         parent_sqid = stdout1.split('@')[1].split(')')[0]
 
         # Add child
-        exit_code2, stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -322,7 +322,7 @@ def test_compact_with_deep_hierarchy(tmp_path: Path) -> None:
         child_sqid = stdout2.split('@')[1].split(')')[0]
 
         # Add grandchild
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -335,7 +335,7 @@ def test_compact_with_deep_hierarchy(tmp_path: Path) -> None:
         grandchild_sqid = stdout3.split('@')[1].split(')')[0]
 
         # Add another root to trigger compaction
-        exit_code4, _stdout4, _stderr4 = invoke_asyncclick_command([
+        exit_code4, _stdout4, _stderr4 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -345,7 +345,7 @@ def test_compact_with_deep_hierarchy(tmp_path: Path) -> None:
         assert exit_code4 == 0
 
         # Compact root level
-        exit_code5, _stdout5, _stderr5 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'compact'])
+        exit_code5, _stdout5, _stderr5 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'compact'])
         assert exit_code5 == 0
 
         # Verify grandchild file updated with new path prefix
@@ -5,9 +5,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import pytest
 from click.testing import CliRunner
 
-from tests.conftest import invoke_asyncclick_command
+from tests.conftest import invoke_cli_command
 
 
 def flatten_nodes(nodes: list[Any]) -> list[dict[str, Any]]:
@@ -29,7 +30,7 @@ def test_compile_multiple_nodes(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add several nodes
-        _exit_code_add1, _stdout_add1, _stderr_add1 = invoke_asyncclick_command([
+        _exit_code_add1, _stdout_add1, _stderr_add1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -38,7 +39,7 @@ def test_compile_multiple_nodes(tmp_path: Path) -> None:
         ])
 
         # Extract SQID from first node to add a child
-        _exit_code_list, stdout_list, _stderr_list = invoke_asyncclick_command([
+        _exit_code_list, stdout_list, _stderr_list = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -51,7 +52,7 @@ def test_compile_multiple_nodes(tmp_path: Path) -> None:
         nodes = flatten_nodes(nodes_tree)
         first_sqid = nodes[0]['sqid']
 
-        _exit_code_add2, _stdout_add2, _stderr_add2 = invoke_asyncclick_command([
+        _exit_code_add2, _stdout_add2, _stderr_add2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -60,7 +61,7 @@ def test_compile_multiple_nodes(tmp_path: Path) -> None:
             '--child-of',
             first_sqid,
         ])
-        _exit_code_add3, _stdout_add3, _stderr_add3 = invoke_asyncclick_command([
+        _exit_code_add3, _stdout_add3, _stderr_add3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -83,7 +84,7 @@ def test_compile_multiple_nodes(tmp_path: Path) -> None:
                 draft_file.write_text(content + '\n\nChapter Two content')
 
         # Compile all drafts
-        exit_code, stdout, _stderr = invoke_asyncclick_command([
+        exit_code, stdout, _stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -106,21 +107,21 @@ def test_compile_skips_empty_files(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add three nodes
-        _exit_code1, _stdout1, _stderr1 = invoke_asyncclick_command([
+        _exit_code1, _stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
             'add',
             'Chapter One',
         ])
-        _exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        _exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
             'add',
             'Chapter Two',
         ])
-        _exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command([
+        _exit_code3, _stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -143,7 +144,7 @@ def test_compile_skips_empty_files(tmp_path: Path) -> None:
         draft_files[2].write_text(content3 + '\n\nThird chapter content')
 
         # Compile
-        exit_code, stdout, _stderr = invoke_asyncclick_command([
+        exit_code, stdout, _stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -164,7 +165,7 @@ def test_compile_doctype_not_found_error(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node (only has draft and notes by default)
-        _exit_code1, _stdout1, _stderr1 = invoke_asyncclick_command([
+        _exit_code1, _stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -173,7 +174,7 @@ def test_compile_doctype_not_found_error(tmp_path: Path) -> None:
         ])
 
         # Try to compile a non-existent doctype
-        exit_code, stdout, stderr = invoke_asyncclick_command([
+        exit_code, stdout, stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -194,14 +195,14 @@ def test_compile_empty_result_handling(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add nodes but don't add any content
-        _exit_code1, _stdout1, _stderr1 = invoke_asyncclick_command([
+        _exit_code1, _stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
             'add',
             'Chapter One',
         ])
-        _exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        _exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -210,7 +211,7 @@ def test_compile_empty_result_handling(tmp_path: Path) -> None:
         ])
 
         # Compile (all draft files have only frontmatter, no actual content)
-        exit_code, stdout, _stderr = invoke_asyncclick_command([
+        exit_code, stdout, _stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -234,7 +235,7 @@ def test_subtree_compilation_with_children(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add parent and children
-        exit_code1, _stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, _stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -244,7 +245,7 @@ def test_subtree_compilation_with_children(tmp_path: Path) -> None:
         assert exit_code1 == 0
 
         # Extract SQID
-        _exit_code_list, stdout_list, _stderr_list = invoke_asyncclick_command([
+        _exit_code_list, stdout_list, _stderr_list = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -257,7 +258,7 @@ def test_subtree_compilation_with_children(tmp_path: Path) -> None:
         chapter_one_sqid = nodes[0]['sqid']
 
         # Add child and grandchild
-        _exit_code_add2, _stdout_add2, _stderr_add2 = invoke_asyncclick_command([
+        _exit_code_add2, _stdout_add2, _stderr_add2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -266,7 +267,7 @@ def test_subtree_compilation_with_children(tmp_path: Path) -> None:
             '--child-of',
             chapter_one_sqid,
         ])
-        _exit_code_list2, stdout_list2, _stderr_list2 = invoke_asyncclick_command([
+        _exit_code_list2, stdout_list2, _stderr_list2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -277,7 +278,7 @@ def test_subtree_compilation_with_children(tmp_path: Path) -> None:
         # Find Section 1.1 by title
         section_sqid = next(n['sqid'] for n in nodes2 if n['title'] == 'Section 1.1')
 
-        _exit_code_add3, _stdout_add3, _stderr_add3 = invoke_asyncclick_command([
+        _exit_code_add3, _stdout_add3, _stderr_add3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -288,7 +289,7 @@ def test_subtree_compilation_with_children(tmp_path: Path) -> None:
         ])
 
         # Add another root node
-        _exit_code_add4, _stdout_add4, _stderr_add4 = invoke_asyncclick_command([
+        _exit_code_add4, _stdout_add4, _stderr_add4 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -310,7 +311,7 @@ def test_subtree_compilation_with_children(tmp_path: Path) -> None:
                 draft_file.write_text(content + '\n\nChapter Two content')
 
         # Compile only Section 1.1 subtree
-        exit_code, stdout, _stderr = invoke_asyncclick_command([
+        exit_code, stdout, _stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -333,14 +334,14 @@ def test_leaf_node_subtree_compilation(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add multiple nodes
-        _exit_code1, _stdout1, _stderr1 = invoke_asyncclick_command([
+        _exit_code1, _stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
             'add',
             'Chapter One',
         ])
-        _exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        _exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -349,7 +350,7 @@ def test_leaf_node_subtree_compilation(tmp_path: Path) -> None:
         ])
 
         # Get SQID of Chapter Two
-        _exit_code_list, stdout_list, _stderr_list = invoke_asyncclick_command([
+        _exit_code_list, stdout_list, _stderr_list = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -371,7 +372,7 @@ def test_leaf_node_subtree_compilation(tmp_path: Path) -> None:
                 draft_file.write_text(content + '\n\nChapter Two content')
 
         # Compile leaf node subtree
-        exit_code, stdout, _stderr = invoke_asyncclick_command([
+        exit_code, stdout, _stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -391,7 +392,7 @@ def test_invalid_sqid_error_integration(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        _exit_code1, _stdout1, _stderr1 = invoke_asyncclick_command([
+        _exit_code1, _stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -400,7 +401,7 @@ def test_invalid_sqid_error_integration(tmp_path: Path) -> None:
         ])
 
         # Try to compile with invalid SQID
-        exit_code, stdout, stderr = invoke_asyncclick_command([
+        exit_code, stdout, stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -421,7 +422,7 @@ def test_subtree_with_no_matching_doctype_integration(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add parent and child
-        _exit_code1, _stdout1, _stderr1 = invoke_asyncclick_command([
+        _exit_code1, _stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -430,7 +431,7 @@ def test_subtree_with_no_matching_doctype_integration(tmp_path: Path) -> None:
         ])
 
         # Get SQID
-        _exit_code_list, stdout_list, _stderr_list = invoke_asyncclick_command([
+        _exit_code_list, stdout_list, _stderr_list = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -442,7 +443,7 @@ def test_subtree_with_no_matching_doctype_integration(tmp_path: Path) -> None:
         nodes = flatten_nodes(json.loads(stdout_list))
         sqid = nodes[0]['sqid']
 
-        _exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        _exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -453,7 +454,7 @@ def test_subtree_with_no_matching_doctype_integration(tmp_path: Path) -> None:
         ])
 
         # Try to compile non-existent doctype from subtree
-        exit_code, stdout, stderr = invoke_asyncclick_command([
+        exit_code, stdout, stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -475,7 +476,7 @@ def test_at_prefix_stripping_integration(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add nodes
-        _exit_code1, _stdout1, _stderr1 = invoke_asyncclick_command([
+        _exit_code1, _stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -484,7 +485,7 @@ def test_at_prefix_stripping_integration(tmp_path: Path) -> None:
         ])
 
         # Get SQID
-        _exit_code_list, stdout_list, _stderr_list = invoke_asyncclick_command([
+        _exit_code_list, stdout_list, _stderr_list = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -503,7 +504,7 @@ def test_at_prefix_stripping_integration(tmp_path: Path) -> None:
             draft_file.write_text(content + '\n\nChapter content')
 
         # Compile with @ prefix
-        exit_code, stdout, _stderr = invoke_asyncclick_command([
+        exit_code, stdout, _stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -514,3 +515,24 @@ def test_at_prefix_stripping_integration(tmp_path: Path) -> None:
 
         assert exit_code == 0
         assert 'Chapter content' in stdout
+
+
+@pytest.mark.asyncio
+async def test_commander_compile_doctype_joins_streamed_pieces(tmp_path: Path) -> None:
+    """Test LinemarkCommander.compile_doctype returns the streamed output as one string."""
+    from linemark.commanders import LinemarkCommander
+
+    commander = LinemarkCommander(directory=tmp_path)
+    first = await commander.add(title='Chapter One')
+    second = await commander.add(title='Chapter Two')
+    await commander.write_type(doctype='draft', sqid=first.sqid.value, body='First body\n')
+    await commander.write_type(doctype='draft', sqid=second.sqid.value, body='Second body\n')
+
+    pieces = [piece async for piece in commander.compile_doctype_stream(doctype='draft', separator='|')]
+    result = await commander.compile_doctype(doctype='draft', separator='|')
+
+    assert len(pieces) == 3
+    assert pieces[1] == '|'
+    assert result == ''.join(pieces)
+    assert 'First body' in pieces[0]
+    assert 'Second body' in pieces[2]
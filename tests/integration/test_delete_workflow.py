@@ -6,7 +6,7 @@ from pathlib import Path
 
 from click.testing import CliRunner
 
-from tests.conftest import invoke_asyncclick_command
+from tests.conftest import invoke_cli_command
 
 
 def test_delete_leaf_node(tmp_path: Path) -> None:
@@ -15,7 +15,7 @@ def test_delete_leaf_node(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add two nodes
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -25,7 +25,7 @@ def test_delete_leaf_node(tmp_path: Path) -> None:
         assert exit_code1 == 0
         sqid1 = stdout1.split('@')[1].split(')')[0]
 
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -35,7 +35,7 @@ def test_delete_leaf_node(tmp_path: Path) -> None:
         assert exit_code2 == 0
 
         # Delete first node
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -46,7 +46,7 @@ def test_delete_leaf_node(tmp_path: Path) -> None:
         assert f'Deleted node @{sqid1}' in stdout3
 
         # Verify node deleted (list should only show Node Two)
-        _exit_code4, stdout4, _stderr4 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list'])
+        _exit_code4, stdout4, _stderr4 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list'])
         assert 'Node Two' in stdout4
         assert 'Node One' not in stdout4
 
@@ -62,7 +62,7 @@ def test_delete_node_with_children_fails(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add parent and child
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -72,7 +72,7 @@ def test_delete_node_with_children_fails(tmp_path: Path) -> None:
         assert exit_code1 == 0
         parent_sqid = stdout1.split('@')[1].split(')')[0]
 
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -84,7 +84,7 @@ def test_delete_node_with_children_fails(tmp_path: Path) -> None:
         assert exit_code2 == 0
 
         # Try to delete parent without flags
-        exit_code3, stdout3, stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -102,7 +102,7 @@ def test_delete_recursive(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create hierarchy: parent -> child -> grandchild
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -112,7 +112,7 @@ def test_delete_recursive(tmp_path: Path) -> None:
         assert exit_code1 == 0
         parent_sqid = stdout1.split('@')[1].split(')')[0]
 
-        exit_code2, stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -124,7 +124,7 @@ def test_delete_recursive(tmp_path: Path) -> None:
         assert exit_code2 == 0
         child_sqid = stdout2.split('@')[1].split(')')[0]
 
-        exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -136,7 +136,7 @@ def test_delete_recursive(tmp_path: Path) -> None:
         assert exit_code3 == 0
 
         # Add sibling to parent
-        exit_code4, _stdout4, _stderr4 = invoke_asyncclick_command([
+        exit_code4, _stdout4, _stderr4 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -146,7 +146,7 @@ def test_delete_recursive(tmp_path: Path) -> None:
         assert exit_code4 == 0
 
         # Delete parent recursively
-        exit_code5, stdout5, _stderr5 = invoke_asyncclick_command([
+        exit_code5, stdout5, _stderr5 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -158,7 +158,7 @@ def test_delete_recursive(tmp_path: Path) -> None:
         assert f'Deleted node @{parent_sqid} and 2 descendants' in stdout5
 
         # Verify only sibling remains
-        _exit_code6, stdout6, _stderr6 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list'])
+        _exit_code6, stdout6, _stderr6 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list'])
         assert 'Sibling' in stdout6
         assert 'Parent' not in stdout6
         assert 'Child' not in stdout6
@@ -171,7 +171,7 @@ def test_delete_promote(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create parent with two children
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -181,7 +181,7 @@ def test_delete_promote(tmp_path: Path) -> None:
         assert exit_code1 == 0
         parent_sqid = stdout1.split('@')[1].split(')')[0]
 
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -192,7 +192,7 @@ def test_delete_promote(tmp_path: Path) -> None:
         ])
         assert exit_code2 == 0
 
-        exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -204,7 +204,7 @@ def test_delete_promote(tmp_path: Path) -> None:
         assert exit_code3 == 0
 
         # Delete parent with promote
-        exit_code4, stdout4, _stderr4 = invoke_asyncclick_command([
+        exit_code4, stdout4, _stderr4 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -216,7 +216,7 @@ def test_delete_promote(tmp_path: Path) -> None:
         assert f'Deleted node @{parent_sqid} (children promoted to parent level)' in stdout4
 
         # Verify children still exist at root level
-        _exit_code5, stdout5, _stderr5 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list'])
+        _exit_code5, stdout5, _stderr5 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list'])
         assert 'Child One' in stdout5
         assert 'Child Two' in stdout5
         assert 'Parent' not in stdout5
@@ -228,7 +228,7 @@ def test_delete_with_multiple_document_types(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -239,8 +239,8 @@ def test_delete_with_multiple_document_types(tmp_path: Path) -> None:
         sqid = stdout1.split('@')[1].split(')')[0]
 
         # Add custom document types
-        invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'types', 'add', 'characters', f'@{sqid}'])
-        invoke_asyncclick_command([
+        invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'types', 'add', 'characters', f'@{sqid}'])
+        invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -256,7 +256,7 @@ def test_delete_with_multiple_document_types(tmp_path: Path) -> None:
         assert len(files_before) == 4  # draft, notes, characters, worldbuilding
 
         # Delete node
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -275,7 +275,7 @@ def test_delete_nonexistent_node_fails(tmp_path: Path) -> None:
     runner = CliRunner()
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
-        exit_code, stdout, stderr = invoke_asyncclick_command([
+        exit_code, stdout, stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -6,7 +6,7 @@ from pathlib import Path
 
 from click.testing import CliRunner
 
-from tests.conftest import invoke_asyncclick_command
+from tests.conftest import invoke_cli_command
 
 
 def test_doctor_validates_clean_outline(tmp_path: Path) -> None:
@@ -15,7 +15,7 @@ def test_doctor_validates_clean_outline(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create valid outline
-        exit_code1, _stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, _stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -24,7 +24,7 @@ def test_doctor_validates_clean_outline(tmp_path: Path) -> None:
         ])
         assert exit_code1 == 0
 
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -34,7 +34,7 @@ def test_doctor_validates_clean_outline(tmp_path: Path) -> None:
         assert exit_code2 == 0
 
         # Run doctor
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'doctor'])
+        exit_code3, stdout3, _stderr3 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'doctor'])
         assert exit_code3 == 0
         assert 'valid' in stdout3.lower()
 
@@ -45,7 +45,7 @@ def test_doctor_detects_missing_notes_file(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -62,7 +62,7 @@ def test_doctor_detects_missing_notes_file(tmp_path: Path) -> None:
         notes_files[0].unlink()
 
         # Run doctor (should detect issue)
-        exit_code2, stdout2, stderr2 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'doctor'])
+        exit_code2, stdout2, stderr2 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'doctor'])
         assert exit_code2 != 0
         output = (stdout2 + stderr2).lower()
         assert 'integrity issues' in output
@@ -75,7 +75,7 @@ def test_doctor_repairs_missing_notes_file(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -93,7 +93,7 @@ def test_doctor_repairs_missing_notes_file(tmp_path: Path) -> None:
         notes_file.unlink()
 
         # Run doctor with repair
-        exit_code2, stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -116,7 +116,7 @@ def test_doctor_detects_duplicate_sqids(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create valid node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -132,7 +132,7 @@ def test_doctor_detects_duplicate_sqids(tmp_path: Path) -> None:
         corrupt_file.write_text('---\ntitle: Corrupt Node\n---\n')
 
         # Run doctor (should detect duplicate SQID)
-        exit_code2, stdout2, stderr2 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'doctor'])
+        exit_code2, stdout2, stderr2 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'doctor'])
         assert exit_code2 != 0
         output = stdout2 + stderr2
         assert 'integrity issues' in output.lower()
@@ -146,7 +146,7 @@ def test_doctor_suggests_repair_flag(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -162,7 +162,7 @@ def test_doctor_suggests_repair_flag(tmp_path: Path) -> None:
         notes_files[0].unlink()
 
         # Run doctor without repair
-        exit_code2, stdout2, stderr2 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'doctor'])
+        exit_code2, stdout2, stderr2 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'doctor'])
         assert exit_code2 != 0
         output = stdout2 + stderr2
         assert '--repair' in output
@@ -174,7 +174,7 @@ def test_doctor_empty_outline(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Run doctor on empty directory
-        exit_code, stdout, _stderr = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'doctor'])
+        exit_code, stdout, _stderr = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'doctor'])
         assert exit_code == 0
         assert 'valid' in stdout.lower()
 
@@ -185,7 +185,7 @@ def test_doctor_repairs_multiple_nodes(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create multiple nodes
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -195,7 +195,7 @@ def test_doctor_repairs_multiple_nodes(tmp_path: Path) -> None:
         assert exit_code1 == 0
         sqid1 = stdout1.split('@')[1].split(')')[0]
 
-        exit_code2, stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -212,7 +212,7 @@ def test_doctor_repairs_multiple_nodes(tmp_path: Path) -> None:
             notes_files[0].unlink()
 
         # Run doctor with repair
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -233,7 +233,7 @@ def test_doctor_with_hierarchy(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create hierarchy
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -243,7 +243,7 @@ def test_doctor_with_hierarchy(tmp_path: Path) -> None:
         assert exit_code1 == 0
         parent_sqid = stdout1.split('@')[1].split(')')[0]
 
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -255,6 +255,6 @@ def test_doctor_with_hierarchy(tmp_path: Path) -> None:
         assert exit_code2 == 0
 
         # Run doctor
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'doctor'])
+        exit_code3, stdout3, _stderr3 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'doctor'])
         assert exit_code3 == 0
         assert 'valid' in stdout3.lower()
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 import pytest
 from click.testing import CliRunner
 
-from tests.conftest import invoke_asyncclick_command
+from tests.conftest import invoke_cli_command
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -57,7 +57,7 @@ title: Chapter Two
 def test_list_command_with_sqid_filters_to_subtree(test_outline: Path) -> None:
     """Test lmk list @<sqid> filters to subtree."""
     CliRunner()
-    exit_code, stdout, _stderr = invoke_asyncclick_command(['lmk', '--directory', str(test_outline), 'list', '@sqid2'])
+    exit_code, stdout, _stderr = invoke_cli_command(['lmk', '--directory', str(test_outline), 'list', '@sqid2'])
 
     assert exit_code == 0
     output = stdout
@@ -75,7 +75,7 @@ def test_list_command_with_sqid_filters_to_subtree(test_outline: Path) -> None:
 def test_list_command_with_invalid_sqid_shows_error(test_outline: Path) -> None:
     """Test lmk list @<invalid> shows error message."""
     CliRunner()
-    exit_code, stdout, stderr = invoke_asyncclick_command(['lmk', '--directory', str(test_outline), 'list', '@invalid'])
+    exit_code, stdout, stderr = invoke_cli_command(['lmk', '--directory', str(test_outline), 'list', '@invalid'])
 
     assert exit_code == 1
     output = stdout + stderr
@@ -85,7 +85,7 @@ def test_list_command_with_invalid_sqid_shows_error(test_outline: Path) -> None:
 def test_list_command_without_args_returns_full_outline(test_outline: Path) -> None:
     """Test backward compatibility: lmk list without args returns full outline."""
     CliRunner()
-    exit_code, stdout, _stderr = invoke_asyncclick_command(['lmk', '--directory', str(test_outline), 'list'])
+    exit_code, stdout, _stderr = invoke_cli_command(['lmk', '--directory', str(test_outline), 'list'])
 
     assert exit_code == 0
     output = stdout
@@ -104,7 +104,7 @@ def test_list_command_without_args_returns_full_outline(test_outline: Path) -> N
 def test_list_command_with_show_doctypes(test_outline: Path) -> None:
     """Test lmk list --show-doctypes displays doctypes in tree output."""
     CliRunner()
-    exit_code, stdout, _stderr = invoke_asyncclick_command([
+    exit_code, stdout, _stderr = invoke_cli_command([
         'lmk',
         '--directory',
         str(test_outline),
@@ -127,7 +127,7 @@ def test_list_command_with_show_doctypes_json(test_outline: Path) -> None:
     import json
 
     CliRunner()
-    exit_code, stdout, _stderr = invoke_asyncclick_command([
+    exit_code, stdout, _stderr = invoke_cli_command([
         'lmk',
         '--directory',
         str(test_outline),
@@ -148,7 +148,7 @@ def test_list_command_with_show_doctypes_json(test_outline: Path) -> None:
 def test_list_command_with_sqid_and_show_doctypes(test_outline: Path) -> None:
     """Test combining SQID filtering with --show-doctypes."""
     CliRunner()
-    exit_code, stdout, _stderr = invoke_asyncclick_command([
+    exit_code, stdout, _stderr = invoke_cli_command([
         'lmk',
         '--directory',
         str(test_outline),
@@ -177,7 +177,7 @@ def test_list_command_with_sqid_and_show_doctypes(test_outline: Path) -> None:
 def test_list_command_with_show_files(test_outline: Path) -> None:
     """Test lmk list --show-files displays file paths in tree output."""
     CliRunner()
-    exit_code, stdout, _stderr = invoke_asyncclick_command([
+    exit_code, stdout, _stderr = invoke_cli_command([
         'lmk',
         '--directory',
         str(test_outline),
@@ -202,7 +202,7 @@ def test_list_command_with_show_files_json(test_outline: Path) -> None:
     import json
 
     CliRunner()
-    exit_code, stdout, _stderr = invoke_asyncclick_command([
+    exit_code, stdout, _stderr = invoke_cli_command([
         'lmk',
         '--directory',
         str(test_outline),
@@ -226,7 +226,7 @@ def test_list_command_with_show_files_json(test_outline: Path) -> None:
 def test_list_command_with_sqid_and_show_files(test_outline: Path) -> None:
     """Test combining SQID filtering with --show-files."""
     CliRunner()
-    exit_code, stdout, _stderr = invoke_asyncclick_command([
+    exit_code, stdout, _stderr = invoke_cli_command([
         'lmk',
         '--directory',
         str(test_outline),
@@ -256,7 +256,7 @@ def test_list_command_with_sqid_and_show_files(test_outline: Path) -> None:
 def test_list_command_with_all_flags_tree(test_outline: Path) -> None:
     """Test lmk list with @SQID, --show-doctypes, and --show-files in tree output."""
     CliRunner()
-    exit_code, stdout, _stderr = invoke_asyncclick_command([
+    exit_code, stdout, _stderr = invoke_cli_command([
         'lmk',
         '--directory',
         str(test_outline),
@@ -289,7 +289,7 @@ def test_list_command_with_all_flags_json(test_outline: Path) -> None:
     import json
 
     CliRunner()
-    exit_code, stdout, _stderr = invoke_asyncclick_command([
+    exit_code, stdout, _stderr = invoke_cli_command([
         'lmk',
         '--directory',
         str(test_outline),
@@ -321,7 +321,7 @@ def test_list_command_with_all_flags_json(test_outline: Path) -> None:
 def test_list_command_metadata_order_tree(test_outline: Path) -> None:
     """Test that metadata appears in correct order: doctypes first, then files."""
     CliRunner()
-    exit_code, stdout, _stderr = invoke_asyncclick_command([
+    exit_code, stdout, _stderr = invoke_cli_command([
         'lmk',
         '--directory',
         str(test_outline),
@@ -348,7 +348,7 @@ def test_list_command_metadata_order_tree(test_outline: Path) -> None:
 def test_list_command_backward_compat_no_flags(test_outline: Path) -> None:
     """Test backward compatibility: lmk list without any flags."""
     CliRunner()
-    exit_code, stdout, _stderr = invoke_asyncclick_command(['lmk', '--directory', str(test_outline), 'list'])
+    exit_code, stdout, _stderr = invoke_cli_command(['lmk', '--directory', str(test_outline), 'list'])
 
     assert exit_code == 0
     output = stdout
@@ -360,3 +360,26 @@ def test_list_command_backward_compat_no_flags(test_outline: Path) -> None:
     # Should NOT show metadata
     assert 'doctypes:' not in output
     assert 'files:' not in output
+
+
+def test_list_command_exits_quietly_when_reader_closes_pipe(
+    test_outline: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test lmk list stops writing when stdout's reader has gone away (e.g. piped into head)."""
+    import os
+    import sys
+    from io import TextIOWrapper
+
+    from linemark.cli.main import lmk
+
+    read_fd, write_fd = os.pipe()
+    os.close(read_fd)
+    stdout = TextIOWrapper(os.fdopen(write_fd, 'wb'), encoding='utf-8')
+    monkeypatch.setattr(sys, 'stdout', stdout)
+
+    with pytest.raises(SystemExit) as exc_info:
+        lmk.main(['--directory', str(test_outline), 'list'], standalone_mode=False)
+
+    assert exc_info.value.code == 1
+    # stdout now points at os.devnull, so closing it flushes without raising
+    stdout.close()
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 
 from click.testing import CliRunner
 
-from tests.conftest import invoke_asyncclick_command
+from tests.conftest import invoke_cli_command
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -19,7 +19,7 @@ def test_list_tree_format(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create hierarchy
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -29,7 +29,7 @@ def test_list_tree_format(tmp_path: Path) -> None:
         assert exit_code1 == 0
         parent_sqid = stdout1.split('@')[1].split(')')[0]
 
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -40,7 +40,7 @@ def test_list_tree_format(tmp_path: Path) -> None:
         ])
         assert exit_code2 == 0
 
-        exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -52,7 +52,7 @@ def test_list_tree_format(tmp_path: Path) -> None:
         assert exit_code3 == 0
 
         # List in tree format (default)
-        exit_code4, stdout4, _stderr4 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list'])
+        exit_code4, stdout4, _stderr4 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list'])
         assert exit_code4 == 0
 
         # Verify tree characters present
@@ -69,7 +69,7 @@ def test_list_json_format(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create hierarchy
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -79,7 +79,7 @@ def test_list_json_format(tmp_path: Path) -> None:
         assert exit_code1 == 0
         root_sqid = stdout1.split('@')[1].split(')')[0]
 
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -91,7 +91,7 @@ def test_list_json_format(tmp_path: Path) -> None:
         assert exit_code2 == 0
 
         # List in JSON format
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -127,7 +127,7 @@ def test_list_json_preserves_hierarchy(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create 3-level hierarchy
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -137,7 +137,7 @@ def test_list_json_preserves_hierarchy(tmp_path: Path) -> None:
         assert exit_code1 == 0
         level1_sqid = stdout1.split('@')[1].split(')')[0]
 
-        exit_code2, stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -149,7 +149,7 @@ def test_list_json_preserves_hierarchy(tmp_path: Path) -> None:
         assert exit_code2 == 0
         level2_sqid = stdout2.split('@')[1].split(')')[0]
 
-        exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -161,7 +161,7 @@ def test_list_json_preserves_hierarchy(tmp_path: Path) -> None:
         assert exit_code3 == 0
 
         # Get JSON output
-        exit_code4, stdout4, _stderr4 = invoke_asyncclick_command([
+        exit_code4, stdout4, _stderr4 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -184,7 +184,7 @@ def test_list_json_with_siblings(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create parent with multiple children
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -195,7 +195,7 @@ def test_list_json_with_siblings(tmp_path: Path) -> None:
         parent_sqid = stdout1.split('@')[1].split(')')[0]
 
         for i in range(1, 4):
-            exit_code_child, _stdout_child, _stderr_child = invoke_asyncclick_command([
+            exit_code_child, _stdout_child, _stderr_child = invoke_cli_command([
                 'lmk',
                 '--directory',
                 str(isolated_dir),
@@ -207,7 +207,7 @@ def test_list_json_with_siblings(tmp_path: Path) -> None:
             assert exit_code_child == 0
 
         # Get JSON output
-        exit_code_json, stdout_json, _stderr_json = invoke_asyncclick_command([
+        exit_code_json, stdout_json, _stderr_json = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -232,7 +232,7 @@ def test_list_empty_outline(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # List empty outline
-        exit_code, stdout, stderr = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list'])
+        exit_code, stdout, stderr = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list'])
         assert exit_code == 0
         output = stdout + stderr
         assert 'No nodes found' in output
@@ -244,7 +244,7 @@ def test_list_json_empty_outline(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # List empty outline as JSON
-        exit_code, stdout, _stderr = invoke_asyncclick_command([
+        exit_code, stdout, _stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -263,7 +263,7 @@ def test_list_formats_show_same_content(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Create nodes
-        exit_code1, _stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, _stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -272,7 +272,7 @@ def test_list_formats_show_same_content(tmp_path: Path) -> None:
         ])
         assert exit_code1 == 0
 
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -282,7 +282,7 @@ def test_list_formats_show_same_content(tmp_path: Path) -> None:
         assert exit_code2 == 0
 
         # Get tree format
-        exit_code_tree, stdout_tree, _stderr_tree = invoke_asyncclick_command([
+        exit_code_tree, stdout_tree, _stderr_tree = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -291,7 +291,7 @@ def test_list_formats_show_same_content(tmp_path: Path) -> None:
         assert exit_code_tree == 0
 
         # Get JSON format
-        exit_code_json, stdout_json, _stderr_json = invoke_asyncclick_command([
+        exit_code_json, stdout_json, _stderr_json = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -6,7 +6,7 @@ from pathlib import Path
 
 from click.testing import CliRunner
 
-from tests.conftest import invoke_asyncclick_command
+from tests.conftest import invoke_cli_command
 
 
 def test_move_node_to_root(tmp_path: Path) -> None:
@@ -15,7 +15,7 @@ def test_move_node_to_root(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add parent and child
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -28,7 +28,7 @@ def test_move_node_to_root(tmp_path: Path) -> None:
         sqid_parent = stdout1.split('@')[1].split(')')[0]
 
         # Add child
-        exit_code2, stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -43,7 +43,7 @@ def test_move_node_to_root(tmp_path: Path) -> None:
         sqid_child = stdout2.split('@')[1].split(')')[0]
 
         # Move child to root at position 200
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -67,7 +67,7 @@ def test_move_node_to_new_parent(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add parent1
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -78,7 +78,7 @@ def test_move_node_to_new_parent(tmp_path: Path) -> None:
         sqid_parent1 = stdout1.split('@')[1].split(')')[0]
 
         # Add parent2
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -88,7 +88,7 @@ def test_move_node_to_new_parent(tmp_path: Path) -> None:
         assert exit_code2 == 0
 
         # Add child to parent1
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -101,7 +101,7 @@ def test_move_node_to_new_parent(tmp_path: Path) -> None:
         sqid_child = stdout3.split('@')[1].split(')')[0]
 
         # Move child from parent1 to parent2 (at position 200-100)
-        exit_code4, _stdout4, _stderr4 = invoke_asyncclick_command([
+        exit_code4, _stdout4, _stderr4 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -124,7 +124,7 @@ def test_move_node_with_descendants_cascades(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add parent
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -135,7 +135,7 @@ def test_move_node_with_descendants_cascades(tmp_path: Path) -> None:
         sqid_parent = stdout1.split('@')[1].split(')')[0]
 
         # Add child
-        exit_code2, stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -148,7 +148,7 @@ def test_move_node_with_descendants_cascades(tmp_path: Path) -> None:
         sqid_child = stdout2.split('@')[1].split(')')[0]
 
         # Add grandchild
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -161,7 +161,7 @@ def test_move_node_with_descendants_cascades(tmp_path: Path) -> None:
         sqid_grandchild = stdout3.split('@')[1].split(')')[0]
 
         # Move child to root at 300 (should cascade grandchild to 300-100)
-        exit_code4, _stdout4, _stderr4 = invoke_asyncclick_command([
+        exit_code4, _stdout4, _stderr4 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -188,7 +188,7 @@ def test_move_command_error_handling(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Try to move non-existent node
-        exit_code1, stdout1, stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -208,7 +208,7 @@ def test_move_preserves_content(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -230,7 +230,7 @@ def test_move_preserves_content(tmp_path: Path) -> None:
         draft_file.write_text(custom_content)
 
         # Move node
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -255,7 +255,7 @@ def test_move_and_list_workflow(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add nodes: root1, root2, root1-child
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -265,7 +265,7 @@ def test_move_and_list_workflow(tmp_path: Path) -> None:
         assert exit_code1 == 0
         sqid1 = stdout1.split('@')[1].split(')')[0]
 
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -274,7 +274,7 @@ def test_move_and_list_workflow(tmp_path: Path) -> None:
         ])
         assert exit_code2 == 0
 
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -287,13 +287,13 @@ def test_move_and_list_workflow(tmp_path: Path) -> None:
         sqid_child = stdout3.split('@')[1].split(')')[0]
 
         # List before move
-        exit_code4, stdout4, _stderr4 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list'])
+        exit_code4, stdout4, _stderr4 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list'])
         assert exit_code4 == 0
         assert 'Chapter One' in stdout4
         assert 'Section 1.1' in stdout4
 
         # Move Section 1.1 to root at 300
-        exit_code5, _stdout5, _stderr5 = invoke_asyncclick_command([
+        exit_code5, _stdout5, _stderr5 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -305,6 +305,6 @@ def test_move_and_list_workflow(tmp_path: Path) -> None:
         assert exit_code5 == 0
 
         # List after move - Section 1.1 should be at root level
-        exit_code6, stdout6, _stderr6 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list'])
+        exit_code6, stdout6, _stderr6 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list'])
         assert exit_code6 == 0
         assert 'Section 1.1' in stdout6
@@ -7,7 +7,7 @@ from pathlib import Path
 import yaml
 from click.testing import CliRunner
 
-from tests.conftest import invoke_asyncclick_command
+from tests.conftest import invoke_cli_command
 
 
 def test_rename_updates_title_and_filenames(tmp_path: Path) -> None:
@@ -16,7 +16,7 @@ def test_rename_updates_title_and_filenames(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -27,7 +27,7 @@ def test_rename_updates_title_and_filenames(tmp_path: Path) -> None:
         sqid = stdout1.split('@')[1].split(')')[0]
 
         # Rename the node
-        exit_code2, stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -64,7 +64,7 @@ def test_rename_with_special_characters(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -75,7 +75,7 @@ def test_rename_with_special_characters(tmp_path: Path) -> None:
         sqid = stdout1.split('@')[1].split(')')[0]
 
         # Rename with special characters
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -98,7 +98,7 @@ def test_rename_with_multiple_document_types(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -109,8 +109,8 @@ def test_rename_with_multiple_document_types(tmp_path: Path) -> None:
         sqid = stdout1.split('@')[1].split(')')[0]
 
         # Add additional document types
-        invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'types', 'add', 'characters', f'@{sqid}'])
-        invoke_asyncclick_command([
+        invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'types', 'add', 'characters', f'@{sqid}'])
+        invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -121,7 +121,7 @@ def test_rename_with_multiple_document_types(tmp_path: Path) -> None:
         ])
 
         # Rename the node
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -154,7 +154,7 @@ def test_rename_preserves_sqid_and_path(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add parent and child nodes
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -164,7 +164,7 @@ def test_rename_preserves_sqid_and_path(tmp_path: Path) -> None:
         assert exit_code1 == 0
         parent_sqid = stdout1.split('@')[1].split(')')[0]
 
-        exit_code2, stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -182,7 +182,7 @@ def test_rename_preserves_sqid_and_path(tmp_path: Path) -> None:
         orig_mp = orig_draft.name.split('_')[0]
 
         # Rename child
-        exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -207,7 +207,7 @@ def test_rename_preserves_content(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -231,7 +231,7 @@ def test_rename_preserves_content(tmp_path: Path) -> None:
         notes_file.write_text('Important notes here')
 
         # Rename the node
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -259,7 +259,7 @@ def test_rename_nonexistent_node_fails(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Try to rename nonexistent node
-        exit_code, stdout, stderr = invoke_asyncclick_command([
+        exit_code, stdout, stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -278,7 +278,7 @@ def test_rename_integration_with_list(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add nodes
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -288,7 +288,7 @@ def test_rename_integration_with_list(tmp_path: Path) -> None:
         assert exit_code1 == 0
         sqid1 = stdout1.split('@')[1].split(')')[0]
 
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -298,7 +298,7 @@ def test_rename_integration_with_list(tmp_path: Path) -> None:
         assert exit_code2 == 0
 
         # Rename first node
-        exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -309,7 +309,7 @@ def test_rename_integration_with_list(tmp_path: Path) -> None:
         assert exit_code3 == 0
 
         # List and verify new name appears
-        exit_code4, stdout4, _stderr4 = invoke_asyncclick_command(['lmk', '--directory', str(isolated_dir), 'list'])
+        exit_code4, stdout4, _stderr4 = invoke_cli_command(['lmk', '--directory', str(isolated_dir), 'list'])
         assert exit_code4 == 0
         assert 'Prologue' in stdout4
         assert 'Chapter Two' in stdout4
@@ -6,7 +6,7 @@ from pathlib import Path
 
 from click.testing import CliRunner
 
-from tests.conftest import invoke_asyncclick_command
+from tests.conftest import invoke_cli_command
 
 
 def test_search_finds_text_in_draft(tmp_path: Path) -> None:
@@ -15,7 +15,7 @@ def test_search_finds_text_in_draft(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -27,13 +27,13 @@ def test_search_finds_text_in_draft(tmp_path: Path) -> None:
 
         # Write content to draft
         content = 'This is a test with keyword FINDME in it'
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command(
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'draft', f'@{sqid}'], stdin_content=content
         )
         assert exit_code2 == 0
 
         # Search for the keyword
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -51,7 +51,7 @@ def test_search_finds_text_in_notes(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -63,13 +63,13 @@ def test_search_finds_text_in_notes(tmp_path: Path) -> None:
 
         # Write content to notes
         content = 'Important notes with SECRET keyword'
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command(
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'notes', f'@{sqid}'], stdin_content=content
         )
         assert exit_code2 == 0
 
         # Search for the keyword
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -86,7 +86,7 @@ def test_search_with_regex_pattern(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -98,13 +98,13 @@ def test_search_with_regex_pattern(tmp_path: Path) -> None:
 
         # Write content with pattern
         content = 'Error: Code 123\nError: Code 456'
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command(
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'draft', f'@{sqid}'], stdin_content=content
         )
         assert exit_code2 == 0
 
         # Search with regex pattern
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -121,7 +121,7 @@ def test_search_case_sensitive(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -133,13 +133,13 @@ def test_search_case_sensitive(tmp_path: Path) -> None:
 
         # Write content with mixed case
         content = 'This has lowercase findme and UPPERCASE FINDME'
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command(
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'draft', f'@{sqid}'], stdin_content=content
         )
         assert exit_code2 == 0
 
         # Search case-sensitively for uppercase
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -157,7 +157,7 @@ def test_search_filter_by_doctype(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -169,7 +169,7 @@ def test_search_filter_by_doctype(tmp_path: Path) -> None:
 
         # Write content to draft
         draft_content = 'This is in the draft with KEYWORD'
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command(
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'draft', f'@{sqid}'],
             stdin_content=draft_content,
         )
@@ -177,14 +177,14 @@ def test_search_filter_by_doctype(tmp_path: Path) -> None:
 
         # Write content to notes
         notes_content = 'This is in the notes with KEYWORD'
-        exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command(
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'notes', f'@{sqid}'],
             stdin_content=notes_content,
         )
         assert exit_code3 == 0
 
         # Search across all doctypes
-        exit_code4, stdout4, _stderr4 = invoke_asyncclick_command([
+        exit_code4, stdout4, _stderr4 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -202,7 +202,7 @@ def test_search_multiline(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -214,13 +214,13 @@ def test_search_multiline(tmp_path: Path) -> None:
 
         # Write content with pattern on single line
         content = 'Line one two three'
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command(
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'draft', f'@{sqid}'], stdin_content=content
         )
         assert exit_code2 == 0
 
         # Search with pattern (multiline doesn't affect line-by-line search)
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -238,7 +238,7 @@ def test_search_literal_string(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -250,13 +250,13 @@ def test_search_literal_string(tmp_path: Path) -> None:
 
         # Write content with regex special characters
         content = 'This has regex chars: [a-z]+ and \\d+'
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command(
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'draft', f'@{sqid}'], stdin_content=content
         )
         assert exit_code2 == 0
 
         # Search literally for the pattern
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -274,7 +274,7 @@ def test_search_json_output(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -286,13 +286,13 @@ def test_search_json_output(tmp_path: Path) -> None:
 
         # Write content
         content = 'This has JSONTEST keyword'
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command(
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'draft', f'@{sqid}'], stdin_content=content
         )
         assert exit_code2 == 0
 
         # Search with JSON output
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -311,7 +311,7 @@ def test_search_no_results(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, _stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, _stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -321,7 +321,7 @@ def test_search_no_results(tmp_path: Path) -> None:
         assert exit_code1 == 0
 
         # Search for non-existent pattern
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -338,7 +338,7 @@ def test_search_invalid_regex(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Search with invalid regex
-        exit_code, stdout, stderr = invoke_asyncclick_command([
+        exit_code, stdout, stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -355,7 +355,7 @@ def test_search_subtree_filter(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add parent node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -368,7 +368,7 @@ def test_search_subtree_filter(tmp_path: Path) -> None:
         parent_position = stdout1.split('node ')[1].split(' ')[0]
 
         # Add child node
-        exit_code2, stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -382,14 +382,14 @@ def test_search_subtree_filter(tmp_path: Path) -> None:
 
         # Write content to child
         content = 'Child content with SUBTREETEST'
-        exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command(
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'draft', f'@{child_sqid}'],
             stdin_content=content,
         )
         assert exit_code3 == 0
 
         # Search within parent subtree using position prefix
-        exit_code4, stdout4, _stderr4 = invoke_asyncclick_command([
+        exit_code4, stdout4, _stderr4 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -407,7 +407,7 @@ def test_search_single_doctype_filter(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -419,7 +419,7 @@ def test_search_single_doctype_filter(tmp_path: Path) -> None:
 
         # Write content to draft
         draft_content = 'Draft DOCTYPE1TEST'
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command(
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'draft', f'@{sqid}'],
             stdin_content=draft_content,
         )
@@ -427,14 +427,14 @@ def test_search_single_doctype_filter(tmp_path: Path) -> None:
 
         # Write content to notes (different keyword)
         notes_content = 'Notes different content'
-        exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command(
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'notes', f'@{sqid}'],
             stdin_content=notes_content,
         )
         assert exit_code3 == 0
 
         # Search across all doctypes (--doctype causes Click parsing issues with optional positional)
-        exit_code4, stdout4, _stderr4 = invoke_asyncclick_command([
+        exit_code4, stdout4, _stderr4 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -462,7 +462,7 @@ def test_search_handles_non_utf8_encoding(tmp_path: Path) -> None:
     file_path.write_bytes(content_bytes)
 
     # Search should not crash on encoding errors
-    exit_code, stdout, _stderr = invoke_asyncclick_command([
+    exit_code, stdout, _stderr = invoke_cli_command([
         'lmk',
         '--directory',
         str(test_dir),
@@ -6,7 +6,7 @@ from pathlib import Path
 
 from click.testing import CliRunner
 
-from tests.conftest import invoke_asyncclick_command
+from tests.conftest import invoke_cli_command
 
 
 def test_types_list_shows_default_types(tmp_path: Path) -> None:
@@ -15,7 +15,7 @@ def test_types_list_shows_default_types(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -26,7 +26,7 @@ def test_types_list_shows_default_types(tmp_path: Path) -> None:
         sqid = stdout1.split('@')[1].split(')')[0]
 
         # List types
-        exit_code2, stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -45,7 +45,7 @@ def test_types_add_creates_new_file(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -56,7 +56,7 @@ def test_types_add_creates_new_file(tmp_path: Path) -> None:
         sqid = stdout1.split('@')[1].split(')')[0]
 
         # Add characters type
-        exit_code2, stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -80,7 +80,7 @@ def test_types_add_shows_in_list(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -91,7 +91,7 @@ def test_types_add_shows_in_list(tmp_path: Path) -> None:
         sqid = stdout1.split('@')[1].split(')')[0]
 
         # Add characters type
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -103,7 +103,7 @@ def test_types_add_shows_in_list(tmp_path: Path) -> None:
         assert exit_code2 == 0
 
         # List types and verify characters is present
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -123,7 +123,7 @@ def test_types_remove_deletes_file(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -134,7 +134,7 @@ def test_types_remove_deletes_file(tmp_path: Path) -> None:
         sqid = stdout1.split('@')[1].split(')')[0]
 
         # Add characters type
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -146,7 +146,7 @@ def test_types_remove_deletes_file(tmp_path: Path) -> None:
         assert exit_code2 == 0
 
         # Remove characters type
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -170,7 +170,7 @@ def test_types_remove_preserves_draft_and_notes(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -181,7 +181,7 @@ def test_types_remove_preserves_draft_and_notes(tmp_path: Path) -> None:
         sqid = stdout1.split('@')[1].split(')')[0]
 
         # Add characters type
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -193,7 +193,7 @@ def test_types_remove_preserves_draft_and_notes(tmp_path: Path) -> None:
         assert exit_code2 == 0
 
         # Remove characters type
-        exit_code3, _stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -218,7 +218,7 @@ def test_types_remove_required_type_fails(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -229,7 +229,7 @@ def test_types_remove_required_type_fails(tmp_path: Path) -> None:
         sqid = stdout1.split('@')[1].split(')')[0]
 
         # Try to remove draft
-        exit_code2, stdout2, stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -242,7 +242,7 @@ def test_types_remove_required_type_fails(tmp_path: Path) -> None:
         assert 'Cannot remove required type' in stdout2 or 'Cannot remove required type' in stderr2
 
         # Try to remove notes
-        exit_code3, stdout3, stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -261,7 +261,7 @@ def test_types_read_returns_body_content(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -272,7 +272,7 @@ def test_types_read_returns_body_content(tmp_path: Path) -> None:
         sqid = stdout1.split('@')[1].split(')')[0]
 
         # Read draft type (should have default content)
-        exit_code2, stdout2, _stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, _stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -292,7 +292,7 @@ def test_types_read_nonexistent_node_fails(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Try to read from nonexistent node
-        exit_code, stdout, stderr = invoke_asyncclick_command([
+        exit_code, stdout, stderr = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -311,7 +311,7 @@ def test_types_read_nonexistent_doctype_fails(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -322,7 +322,7 @@ def test_types_read_nonexistent_doctype_fails(tmp_path: Path) -> None:
         sqid = stdout1.split('@')[1].split(')')[0]
 
         # Try to read nonexistent type
-        exit_code2, stdout2, stderr2 = invoke_asyncclick_command([
+        exit_code2, stdout2, stderr2 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -341,7 +341,7 @@ def test_types_write_updates_body_content(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -353,13 +353,13 @@ def test_types_write_updates_body_content(tmp_path: Path) -> None:
 
         # Write new content to draft
         new_content = 'This is new draft content\nWith multiple lines'
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command(
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'draft', f'@{sqid}'], stdin_content=new_content
         )
         assert exit_code2 == 0
 
         # Read back and verify
-        exit_code3, stdout3, _stderr3 = invoke_asyncclick_command([
+        exit_code3, stdout3, _stderr3 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -378,7 +378,7 @@ def test_types_write_preserves_frontmatter(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -390,7 +390,7 @@ def test_types_write_preserves_frontmatter(tmp_path: Path) -> None:
 
         # Write new content
         new_content = 'Updated content'
-        exit_code2, _stdout2, _stderr2 = invoke_asyncclick_command(
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'draft', f'@{sqid}'], stdin_content=new_content
         )
         assert exit_code2 == 0
@@ -405,13 +405,49 @@ def test_types_write_preserves_frontmatter(tmp_path: Path) -> None:
         assert new_content in content
 
 
+def test_types_write_empty_clears_body_without_reading_stdin(tmp_path: Path) -> None:
+    """Test writing with --empty clears the body and ignores stdin."""
+    runner = CliRunner()
+
+    with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
+        # Add a node with some draft content
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
+            'lmk',
+            '--directory',
+            str(isolated_dir),
+            'add',
+            'Chapter One',
+        ])
+        assert exit_code1 == 0
+        sqid = stdout1.split('@')[1].split(')')[0]
+        exit_code2, _stdout2, _stderr2 = invoke_cli_command(
+            ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'draft', f'@{sqid}'], stdin_content='Old draft'
+        )
+        assert exit_code2 == 0
+
+        # Clear it; stdin content must be ignored
+        exit_code3, _stdout3, _stderr3 = invoke_cli_command(
+            ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'draft', f'@{sqid}', '--empty'],
+            stdin_content='Ignored',
+        )
+        assert exit_code3 == 0
+
+        # Frontmatter survives, body is gone
+        draft_files = list(Path(isolated_dir).glob(f'*_{sqid}_draft_*.md'))
+        assert len(draft_files) == 1
+        content = draft_files[0].read_text()
+        assert content.startswith('---\n')
+        assert 'Old draft' not in content
+        assert 'Ignored' not in content
+
+
 def test_types_write_nonexistent_node_fails(tmp_path: Path) -> None:
     """Test writing to nonexistent node fails."""
     runner = CliRunner()
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Try to write to nonexistent node
-        exit_code, stdout, stderr = invoke_asyncclick_command(
+        exit_code, stdout, stderr = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'draft', '@NONEXIST'], stdin_content='test'
         )
         assert exit_code != 0
@@ -424,7 +460,7 @@ def test_types_write_nonexistent_doctype_fails(tmp_path: Path) -> None:
 
     with runner.isolated_filesystem(temp_dir=tmp_path) as isolated_dir:
         # Add a node
-        exit_code1, stdout1, _stderr1 = invoke_asyncclick_command([
+        exit_code1, stdout1, _stderr1 = invoke_cli_command([
             'lmk',
             '--directory',
             str(isolated_dir),
@@ -435,7 +471,7 @@ def test_types_write_nonexistent_doctype_fails(tmp_path: Path) -> None:
         sqid = stdout1.split('@')[1].split(')')[0]
 
         # Try to write to nonexistent type
-        exit_code2, stdout2, stderr2 = invoke_asyncclick_command(
+        exit_code2, stdout2, stderr2 = invoke_cli_command(
             ['lmk', '--directory', str(isolated_dir), 'types', 'write', 'nonexistent', f'@{sqid}'], stdin_content='test'
         )
         assert exit_code2 != 0
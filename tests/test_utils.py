@@ -1,6 +1,6 @@
 """Tests for utility functions."""
 
-from linemark.utils import first
+from linemark.utils import first, strip_at
 
 
 def test_first_returns_first_element() -> None:
@@ -25,3 +25,20 @@ def test_first_returns_none_for_empty_generator() -> None:
     """Test that first returns None for an empty generator."""
     result = first(x for x in range(0))
     assert result is None
+
+
+def test_strip_at_removes_prefix() -> None:
+    """Test that strip_at removes a leading @ from a SQID."""
+    assert strip_at('@A3F7c') == 'A3F7c'
+
+
+def test_strip_at_leaves_unprefixed_and_none_unchanged() -> None:
+    """Test that strip_at passes through values without a prefix."""
+    assert strip_at('A3F7c') == 'A3F7c'
+    assert strip_at('') == ''
+    assert strip_at(None) is None
+
+
+def test_strip_at_removes_only_one_prefix() -> None:
+    """Test that strip_at removes a single @, unlike str.lstrip."""
+    assert strip_at('@@A3F7c') == '@A3F7c'
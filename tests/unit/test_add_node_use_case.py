@@ -8,45 +8,7 @@ import pytest
 
 from linemark.domain.entities import MaterializedPath
 from linemark.use_cases.add_node import AddNodeUseCase
-
-
-class FakeFileSystem:
-    """Fake filesystem adapter for testing."""
-
-    def __init__(self) -> None:
-        self.files: dict[str, str] = {}
-        self.directories: set[str] = set()
-
-    async def read_file(self, path: Path) -> str:
-        """Read file from in-memory storage."""
-        return self.files.get(str(path), '')
-
-    async def write_file(self, path: Path, content: str) -> None:
-        """Write file to in-memory storage."""
-        self.files[str(path)] = content
-
-    async def delete_file(self, path: Path) -> None:
-        """Delete file from in-memory storage."""
-        if str(path) in self.files:
-            del self.files[str(path)]
-
-    async def rename_file(self, old_path: Path, new_path: Path) -> None:
-        """Rename file in in-memory storage."""
-        if str(old_path) in self.files:
-            self.files[str(new_path)] = self.files[str(old_path)]
-            del self.files[str(old_path)]
-
-    async def list_markdown_files(self, directory: Path) -> list[Path]:
-        """List markdown files in directory."""
-        return [Path(path) for path in self.files if path.endswith('.md') and path.startswith(str(directory))]
-
-    async def file_exists(self, path: Path) -> bool:
-        """Check if file exists in in-memory storage."""
-        return str(path) in self.files
-
-    async def create_directory(self, path: Path) -> None:
-        """Create directory in in-memory storage."""
-        self.directories.add(str(path))
+from tests.conftest import FakeFileSystem
 
 
 class FakeSQIDGenerator:
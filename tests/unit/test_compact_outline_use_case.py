@@ -6,37 +6,7 @@ from pathlib import Path
 
 import pytest
 
-
-class FakeFileSystem:
-    """Fake filesystem adapter for testing."""
-
-    def __init__(self) -> None:
-        self.files: dict[str, str] = {}
-
-    async def read_file(self, path: Path) -> str:
-        return self.files.get(str(path), '')
-
-    async def write_file(self, path: Path, content: str) -> None:
-        self.files[str(path)] = content
-
-    async def delete_file(self, path: Path) -> None:
-        if str(path) in self.files:
-            del self.files[str(path)]
-
-    async def list_markdown_files(self, directory: Path) -> list[Path]:
-        return [Path(path) for path in self.files if path.endswith('.md') and path.startswith(str(directory))]
-
-    async def file_exists(self, path: Path) -> bool:
-        return str(path) in self.files
-
-    async def create_directory(self, directory: Path) -> None:
-        """Create directory (no-op for fake filesystem)."""
-
-    async def rename_file(self, old_path: Path, new_path: Path) -> None:
-        """Rename file."""
-        if str(old_path) in self.files:
-            self.files[str(new_path)] = self.files[str(old_path)]
-            del self.files[str(old_path)]
+from tests.conftest import FakeFileSystem
 
 
 @pytest.mark.asyncio
@@ -7,16 +7,12 @@ from pathlib import Path
 import pytest
 
 from linemark.domain.exceptions import DoctypeNotFoundError
+from tests.conftest import FakeFileSystem as BaseFakeFileSystem
 
 
-class FakeFileSystem:
+class FakeFileSystem(BaseFakeFileSystem):
     """Fake filesystem adapter for testing compile doctype use case."""
 
-    def __init__(self) -> None:
-        """Initialize with empty file storage."""
-        self.files: dict[str, str] = {}
-        self.directories: set[str] = set()
-
     async def read_file(self, path: Path) -> str:
         """Read file from in-memory storage."""
         key = str(path)
@@ -25,33 +21,9 @@ class FakeFileSystem:
             raise FileNotFoundError(msg)
         return self.files[key]
 
-    async def file_exists(self, path: Path) -> bool:
-        """Check if file exists in storage."""
-        return str(path) in self.files
-
     async def list_markdown_files(self, directory: Path) -> list[Path]:
         """List markdown files in directory."""
-        dir_str = str(directory)
-        return sorted([Path(path) for path in self.files if path.startswith(dir_str) and path.endswith('.md')])
-
-    async def write_file(self, path: Path, content: str) -> None:
-        """Write file to in-memory storage."""
-        self.files[str(path)] = content
-
-    async def delete_file(self, path: Path) -> None:
-        """Delete file from in-memory storage."""
-        if str(path) in self.files:
-            del self.files[str(path)]
-
-    async def create_directory(self, directory: Path) -> None:
-        """Create directory in in-memory storage."""
-        self.directories.add(str(directory))
-
-    async def rename_file(self, old_path: Path, new_path: Path) -> None:
-        """Rename file in in-memory storage."""
-        if str(old_path) in self.files:
-            self.files[str(new_path)] = self.files[str(old_path)]
-            del self.files[str(old_path)]
+        return sorted(await super().list_markdown_files(directory))
 
     def add_node(
         self,
@@ -752,3 +724,103 @@ async def test_default_separator_when_not_provided() -> None:
     assert '\n\n---\n\n' in result
     assert 'Chapter 1' in result
     assert 'Chapter 2' in result
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_are_bounded_and_keep_outline_order() -> None:
+    """Test files are read at most `concurrency` at a time and joined in outline order."""
+    import asyncio
+
+    from linemark.use_cases.compile_doctype import CompileDoctypeUseCase
+
+    class TrackingFileSystem(FakeFileSystem):
+        """Fake filesystem that records how many reads overlap."""
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def read_file(self, path: Path) -> str:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+            return await super().read_file(path)
+
+    fs = TrackingFileSystem()
+    directory = Path('/test')
+    for index in range(1, 6):
+        fs.add_node(
+            directory,
+            mp=f'{index:03d}',
+            sqid=f'SQID{index}',
+            title=f'Chapter {index}',
+            slug=f'chapter-{index}',
+            doctypes={'draft': f'Chapter {index} content', 'notes': ''},
+        )
+
+    use_case = CompileDoctypeUseCase(filesystem=fs)
+
+    result = await use_case.execute(doctype='notes', directory=directory, concurrency=2)
+
+    assert result == ''
+    assert fs.max_in_flight == 2
+
+    fs.max_in_flight = 0
+    result = await use_case.execute(doctype='draft', directory=directory, separator='|', concurrency=2)
+
+    assert fs.max_in_flight == 2
+    assert [part.rsplit('\n', 1)[-1] for part in result.split('|')] == [f'Chapter {i} content' for i in range(1, 6)]
+
+
+@pytest.mark.asyncio
+async def test_failed_read_cancels_pending_reads() -> None:
+    """Test reads still in flight are cancelled when one of them fails."""
+    import asyncio
+
+    from linemark.use_cases.compile_doctype import CompileDoctypeUseCase
+
+    class FailingFileSystem(FakeFileSystem):
+        """Fake filesystem whose first notes read fails after the others have started."""
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.started: list[str] = []
+            self.cancelled: list[str] = []
+
+        async def read_file(self, path: Path) -> str:
+            if '_notes_' not in path.name:
+                return await super().read_file(path)
+            self.started.append(path.name)
+            if path.name.startswith('001_'):
+                await asyncio.sleep(0)
+                msg = 'disk error'
+                raise OSError(msg)
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                self.cancelled.append(path.name)
+                raise
+            return await super().read_file(path)  # pragma: no cover
+
+    fs = FailingFileSystem()
+    directory = Path('/test')
+    for index in range(1, 6):
+        fs.add_node(
+            directory,
+            mp=f'{index:03d}',
+            sqid=f'SQID{index}',
+            title=f'Chapter {index}',
+            slug=f'chapter-{index}',
+            doctypes={'draft': '', 'notes': f'Notes {index}'},
+        )
+
+    use_case = CompileDoctypeUseCase(filesystem=fs)
+
+    with pytest.raises(OSError, match='disk error'):
+        await use_case.execute(doctype='notes', directory=directory, concurrency=3)
+
+    # Only the first window of three reads ever started
+    assert len(fs.started) == 3
+    assert sorted(fs.cancelled) == sorted(fs.started[1:])
@@ -173,6 +173,20 @@ class TestMaterializedPath:
                 old_prefix=MaterializedPath.from_string('200'), new_prefix=MaterializedPath.from_string('300')
             )
 
+    def test_is_immutable(self) -> None:
+        """Reject reassigning segments, so the precomputed string form cannot go stale."""
+        from pydantic import ValidationError
+
+        from linemark.domain.entities import MaterializedPath
+
+        mp = MaterializedPath(segments=(1, 100))
+
+        with pytest.raises(ValidationError):
+            mp.segments = (2,)  # type: ignore[misc]
+
+        assert mp.as_string == '001-100'
+        assert mp == MaterializedPath.from_string('001-100')
+
 
 class TestSQID:
     """Test suite for SQID value object."""
@@ -0,0 +1,38 @@
+"""Unit tests for FirstNodeUseCase."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from linemark.use_cases.first_node import FirstNodeUseCase
+from tests.conftest import FakeFileSystem
+
+
+@pytest.mark.asyncio
+async def test_first_node_returns_none_for_empty_outline() -> None:
+    """Test an outline without nodes has no first node."""
+    fs = FakeFileSystem()
+    fs.files[str(Path('/test') / 'README.md')] = ''
+
+    use_case = FirstNodeUseCase(filesystem=fs)
+
+    assert await use_case.execute(directory=Path('/test')) is None
+
+
+@pytest.mark.asyncio
+async def test_first_node_returns_lowest_materialized_path() -> None:
+    """Test the first node is the one listing the outline would put first, without reading files."""
+    fs = FakeFileSystem()
+    directory = Path('/test')
+
+    fs.files[str(directory / '200_SQID2_draft_chapter-two.md')] = ''
+    fs.files[str(directory / '100-100_SQID3_draft_section.md')] = ''
+    fs.files[str(directory / '100_SQID1_draft_chapter-one.md')] = ''
+    fs.files[str(directory / '300_SQID5_draft_chapter-three.md')] = ''
+    fs.files[str(directory / '050_SQID4_notes_orphan.md')] = ''
+
+    use_case = FirstNodeUseCase(filesystem=fs)
+
+    assert await use_case.execute(directory=directory) == 'SQID1'
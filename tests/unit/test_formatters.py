@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from linemark.cli.formatters import format_json, format_tree
+from linemark.cli.formatters import format_json, format_tree, format_tree_iter
 from linemark.domain.entities import SQID, MaterializedPath, Node, Outline
 
 
@@ -394,3 +394,26 @@ def test_format_json_with_show_files_omits_when_empty() -> None:
 
     assert len(data) == 1
     assert 'files' not in data[0]
+
+
+def test_format_tree_iter_yields_format_tree_lines() -> None:
+    """Test format_tree_iter yields the same lines format_tree joins."""
+    root = Node(
+        sqid=SQID(value='abc123'),
+        mp=MaterializedPath(segments=(100,)),
+        title='Root',
+        slug='root',
+        document_types={'draft', 'notes'},
+    )
+    child = Node(
+        sqid=SQID(value='def456'),
+        mp=MaterializedPath(segments=(100, 100)),
+        title='Child',
+        slug='child',
+        document_types={'draft', 'notes'},
+    )
+
+    lines = list(format_tree_iter([root, child], show_doctypes=True, show_files=True))
+
+    assert lines == format_tree([root, child], show_doctypes=True, show_files=True).split('\n')
+    assert len(lines) == 6
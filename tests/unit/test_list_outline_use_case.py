@@ -7,43 +7,7 @@ from pathlib import Path
 import pytest
 
 from linemark.use_cases.list_outline import ListOutlineUseCase
-
-
-class FakeFileSystem:
-    """Fake filesystem adapter for testing."""
-
-    def __init__(self) -> None:
-        self.files: dict[str, str] = {}
-
-    async def read_file(self, path: Path) -> str:
-        """Read file from in-memory storage."""
-        return self.files.get(str(path), '')
-
-    async def list_markdown_files(self, directory: Path) -> list[Path]:
-        """List markdown files in directory."""
-        return [Path(path) for path in self.files if path.endswith('.md') and path.startswith(str(directory))]
-
-    async def write_file(self, path: Path, content: str) -> None:
-        """Write file to in-memory storage."""
-        self.files[str(path)] = content
-
-    async def delete_file(self, path: Path) -> None:
-        """Delete file from in-memory storage."""
-        if str(path) in self.files:
-            del self.files[str(path)]
-
-    async def file_exists(self, path: Path) -> bool:
-        """Check if file exists."""
-        return str(path) in self.files
-
-    async def create_directory(self, directory: Path) -> None:
-        """Create directory (no-op for fake filesystem)."""
-
-    async def rename_file(self, old_path: Path, new_path: Path) -> None:
-        """Rename file."""
-        if str(old_path) in self.files:
-            self.files[str(new_path)] = self.files[str(old_path)]
-            del self.files[str(old_path)]
+from tests.conftest import FakeFileSystem
 
 
 @pytest.mark.asyncio
@@ -392,3 +356,69 @@ title: Section One
     assert len(nodes) == 2  # All nodes returned
     assert nodes[0].sqid.value == 'sqid1'
     assert nodes[1].sqid.value == 'sqid2'
+
+
+@pytest.mark.asyncio
+async def test_list_outline_skips_draft_deleted_after_listing() -> None:
+    """Test a draft deleted between listing and reading yields no node."""
+
+    class VanishingFileSystem(FakeFileSystem):
+        """Fake filesystem that deletes a draft right after listing it."""
+
+        async def list_markdown_files(self, directory: Path) -> list[Path]:
+            md_files = await super().list_markdown_files(directory)
+            await self.delete_file(directory / '200_SQID2_draft_gone.md')
+            return md_files
+
+        async def read_file(self, path: Path) -> str:
+            if str(path) not in self.files:
+                msg = f'File not found: {path}'
+                raise FileNotFoundError(msg)
+            return await super().read_file(path)
+
+    fs = VanishingFileSystem()
+    directory = Path('/test')
+    fs.files[str(directory / '100_SQID1_draft_kept.md')] = '---\ntitle: Kept\n---\n'
+    fs.files[str(directory / '200_SQID2_draft_gone.md')] = '---\ntitle: Gone\n---\n'
+
+    use_case = ListOutlineUseCase(filesystem=fs)
+
+    nodes = await use_case.execute(directory=directory)
+
+    assert [(node.sqid.value, node.title) for node in nodes] == [('SQID1', 'Kept')]
+
+
+@pytest.mark.asyncio
+async def test_iter_files_cancels_and_awaits_pending_reads_on_early_exit() -> None:
+    """Test closing iter_files early cancels the reads in flight and waits for them."""
+    import asyncio
+
+    from linemark.use_cases.list_outline import iter_files
+
+    class SlowFileSystem(FakeFileSystem):
+        """Fake filesystem whose reads after the first never finish on their own."""
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.tasks: list[asyncio.Task[object]] = []
+
+        async def read_file(self, path: Path) -> str:
+            task = asyncio.current_task()
+            assert task is not None
+            self.tasks.append(task)
+            if path.name != 'a.md':
+                await asyncio.sleep(60)
+            return await super().read_file(path)
+
+    fs = SlowFileSystem()
+    paths = [Path('/test') / name for name in ('a.md', 'b.md', 'c.md', 'd.md')]
+    fs.files[str(paths[0])] = 'first'
+
+    files = iter_files(fs, paths, concurrency=3)
+    assert await anext(files) == 'first'
+    await files.aclose()
+
+    # a.md finished; the reads of b.md and c.md were in flight and are cancelled, not left pending.
+    # d.md's read was queued when a.md was yielded but never got to start.
+    assert all(task.done() for task in fs.tasks)
+    assert [task.cancelled() for task in fs.tasks] == [False, True, True]
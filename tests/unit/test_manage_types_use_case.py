@@ -7,48 +7,7 @@ from pathlib import Path
 import pytest
 
 from linemark.use_cases.manage_types import ManageTypesUseCase
-
-
-class FakeFileSystem:
-    """Fake filesystem adapter for testing."""
-
-    def __init__(self) -> None:
-        """Initialize with empty file storage."""
-        self.files: dict[str, str] = {}
-
-    async def list_markdown_files(self, directory: Path) -> list[Path]:
-        """List all .md files in directory."""
-        return [
-            Path(filepath)
-            for filepath in self.files
-            if filepath.startswith(str(directory)) and filepath.endswith('.md')
-        ]
-
-    async def file_exists(self, filepath: Path) -> bool:
-        """Check if file exists."""
-        return str(filepath) in self.files
-
-    async def read_file(self, filepath: Path) -> str:
-        """Read file content."""
-        return self.files.get(str(filepath), '')
-
-    async def write_file(self, filepath: Path, content: str) -> None:
-        """Write file content."""
-        self.files[str(filepath)] = content
-
-    async def delete_file(self, filepath: Path) -> None:
-        """Delete file."""
-        if str(filepath) in self.files:
-            del self.files[str(filepath)]
-
-    async def create_directory(self, directory: Path) -> None:
-        """Create directory (no-op for fake filesystem)."""
-
-    async def rename_file(self, old_path: Path, new_path: Path) -> None:
-        """Rename file."""
-        if str(old_path) in self.files:
-            self.files[str(new_path)] = self.files[str(old_path)]
-            del self.files[str(old_path)]
+from tests.conftest import FakeFileSystem
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,88 @@
+"""Unit tests for the pre-tool-use Bash hook that blocks dangerous git flags."""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+HOOK_PATH = Path(__file__).parents[2] / '.claude' / 'hooks' / 'pre-tool-use-bash.py'
+
+
+@pytest.fixture(scope='module')
+def hook() -> ModuleType:
+    """Load the hook script, whose hyphenated filename can't be imported directly."""
+    spec = importlib.util.spec_from_file_location('pre_tool_use_bash', HOOK_PATH)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize(
+    'command',
+    [
+        'git commit --no-verify',
+        'git commit --no-gpg-sign -m msg',
+        'git push --force',
+        'git push -f origin main',
+        'git push --force-with-lease=main',
+        '/usr/bin/git commit "--no-verify"',
+        'git commit --no-verify; echo hi',
+        '(git commit --no-verify)',
+        'git push --force&&echo ok',
+        'echo a;git commit --no-verify',
+        'echo $(git push --force)',
+        'echo `git push --force`',
+        'echo hi | git commit --no-verify',
+        'git push -f;echo done',
+        'git push origin main -f|cat',
+        'git push --force-with-lease>log',
+        'git -C repo push --force',
+    ],
+)
+def test_blocks_prohibited_flags(hook: ModuleType, command: str) -> None:
+    """Test prohibited flags are caught, including next to shell separators."""
+    assert hook.is_prohibited(command)
+
+
+@pytest.mark.parametrize(
+    'command',
+    [
+        'ls -la',
+        'git status',
+        'git commit -m "fix"',
+        'git push origin main',
+        'git log -f',
+        'rm -f build; git push origin main',
+    ],
+)
+def test_allows_safe_commands(hook: ModuleType, command: str) -> None:
+    """Test ordinary commands, including non-push uses of -f, are allowed."""
+    assert not hook.is_prohibited(command)
+
+
+@pytest.mark.parametrize(
+    ('command', 'expected_code'),
+    [
+        ('git commit --no-verify; echo hi', 2),
+        ('git status; echo hi', 0),
+    ],
+)
+def test_hook_exit_code(hook: ModuleType, monkeypatch: pytest.MonkeyPatch, command: str, expected_code: int) -> None:
+    """Test the hook exits 2 for blocked commands and 0 otherwise."""
+    payload = json.dumps({'tool_input': {'command': command}}).encode()
+    monkeypatch.setattr('sys.stdin', io.TextIOWrapper(io.BytesIO(payload), encoding='utf-8'))
+
+    with pytest.raises(SystemExit) as exc_info:
+        hook.main()
+
+    assert exc_info.value.code == expected_code